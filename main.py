@@ -155,7 +155,11 @@ def run_demo_mode():
     # ポジション管理（MT5を使用）
     logger.info("DEMO口座でトレードを実行中...")
     position_manager = PositionManager(symbol=symbol, use_mt5=True)
-    result = position_manager.process_ai_judgment(ai_result)
+    try:
+        result = position_manager.process_ai_judgment(ai_result)
+    finally:
+        # トレード記録の書き込みを完了させてから資源を解放（以降は使用しない）
+        position_manager.close()
 
     if result['success']:
         logger.info(f"[成功] トレード成功: ticket={result['ticket']}")
@@ -249,7 +253,11 @@ def run_live_mode():
     # ポジション管理（MT5を使用）
     logger.info("本番口座でトレードを実行中...")
     position_manager = PositionManager(symbol=symbol, use_mt5=True)
-    result = position_manager.process_ai_judgment(ai_result)
+    try:
+        result = position_manager.process_ai_judgment(ai_result)
+    finally:
+        # トレード記録の書き込みを完了させてから資源を解放（以降は使用しない）
+        position_manager.close()
 
     if result['success']:
         logger.info(f"[成功] トレード成功: ticket={result['ticket']}")
@@ -321,8 +329,8 @@ def main():
     logger.info("=" * 80)
     logger.info("")
 
-    # 起動チェック
-    checker = StartupChecker()
+    # 起動チェック（MT5セッションは維持し、DEMO/本番モードで再利用する）
+    checker = StartupChecker(keep_mt5_open=True)
     is_ok, errors = checker.check_all()
 
     if not is_ok:
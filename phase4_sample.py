@@ -1,6 +1,7 @@
 """
 フェーズ4サンプルスクリプト: ルールエンジンとトレード実行
 """
+import atexit
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -93,6 +94,8 @@ if not all([mt5_login, mt5_password, mt5_server]):
 
 # MT5接続モードでPositionManagerを初期化
 manager = PositionManager(symbol='USDJPY', use_mt5=True)
+# 終了時（sys.exit()を含む）にトレード記録を書き込んでから資源を解放
+atexit.register(manager.close)
 
 # MT5に接続できているか確認
 if not manager.executor or not manager.use_mt5:
@@ -42,6 +42,12 @@ import psycopg2
 from psycopg2.extras import Json
 import os
 
+# AI応答のJSONパース（orjsonがあれば高速版を使用）
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from src.data_processing.tick_loader import TickDataLoader
 from src.data_processing.mt5_data_loader import MT5DataLoader
 from src.data_processing.timeframe_converter import TimeframeConverter
@@ -623,7 +629,7 @@ class AIAnalyzer:
             else:
                 json_str = response
 
-            review_result = json.loads(json_str)
+            review_result = _json_loads(json_str)
 
             self.logger.info(f"Daily review completed. Total score: {review_result.get('score', {}).get('total', 'N/A')}")
 
@@ -789,7 +795,7 @@ class AIAnalyzer:
             else:
                 json_str = response
 
-            strategy_result = json.loads(json_str)
+            strategy_result = _json_loads(json_str)
 
             self.logger.info(
                 f"Morning analysis completed. Bias: {strategy_result.get('daily_bias', 'N/A')}, "
@@ -1037,7 +1043,7 @@ class AIAnalyzer:
             else:
                 json_str = response
 
-            update_result = json.loads(json_str)
+            update_result = _json_loads(json_str)
 
             self.logger.info(
                 f"Periodic update completed at {update_time}. "
@@ -1174,7 +1180,7 @@ class AIAnalyzer:
             else:
                 json_str = response
 
-            structured_rule = json.loads(json_str)
+            structured_rule = _json_loads(json_str)
 
             # タイムスタンプの設定（もし含まれていなければ）
             if 'generated_at' not in structured_rule:
@@ -1413,7 +1419,7 @@ class AIAnalyzer:
             else:
                 json_str = response
 
-            monitor_result = json.loads(json_str)
+            monitor_result = _json_loads(json_str)
 
             self.logger.debug(
                 f"Layer 3a monitoring completed. "
@@ -1601,7 +1607,7 @@ class AIAnalyzer:
             else:
                 json_str = response
 
-            emergency_result = json.loads(json_str)
+            emergency_result = _json_loads(json_str)
 
             self.logger.warning(
                 f"Layer 3b emergency evaluation completed. "
@@ -38,16 +38,24 @@ Google Gemini APIと連携し、マーケットデータを分析してトレー
 【作成日】2025-10-22
 """
 
-import google.generativeai as genai
 from typing import Dict, Optional
 import os
 import logging
 import json
 import re
 import time
-from google.api_core import exceptions as google_exceptions
 from src.ai_analysis.base_llm_client import BaseLLMClient
 
+# AI応答からJSON部分を抽出する正規表現（```json ... ```ブロック / { } で囲まれた部分）
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _genai():
+    """google.generativeaiを初回使用時にimport（パッケージimport時の読み込みコストを避ける）"""
+    import google.generativeai as genai
+    return genai
+
 
 class GeminiClient(BaseLLMClient):
     """
@@ -67,11 +75,6 @@ class GeminiClient(BaseLLMClient):
         Raises:
             ValueError: GEMINI_API_KEYが設定されていない場合
         """
-        from src.utils.config import get_config
-
-        # .envから設定を強制的に読み込み
-        self.config = get_config()
-
         # APIキーの取得（引数優先、次に環境変数）
         if api_key is None:
             api_key = self.config.gemini_api_key
@@ -83,10 +86,22 @@ class GeminiClient(BaseLLMClient):
         super().__init__(api_key)
 
         # Gemini APIの設定
-        genai.configure(api_key=api_key)
+        _genai().configure(api_key=api_key)
 
         self.logger.info("✓ Gemini API initialized")
 
+    @property
+    def config(self):
+        """
+        現在の設定を取得
+
+        クライアントはプロバイダー・APIキー単位で共有されるため、インスタンスに
+        保持せず毎回取得する（reload_config() 後の温度・トークン数を反映）。
+        """
+        from src.utils.config import get_config
+
+        return get_config()
+
     def analyze_market(self,
                       market_data: Dict,
                       model: str = 'flash') -> Dict:
@@ -188,6 +203,8 @@ class GeminiClient(BaseLLMClient):
                 generation_config['max_output_tokens'] = max_tokens
 
             # AI応答の生成（リトライ処理付き）
+            from google.api_core import exceptions as google_exceptions
+
             max_retries = 3
             retry_delay = 2  # 初回待機時間（秒）
 
@@ -417,7 +434,7 @@ class GeminiClient(BaseLLMClient):
             )
 
         # GenerativeModelオブジェクトを生成して、モデル名も返す
-        return genai.GenerativeModel(model_name), model_name
+        return _genai().GenerativeModel(model_name), model_name
 
     def _parse_response(self, response_text: str) -> Dict:
         """
@@ -434,17 +451,13 @@ class GeminiClient(BaseLLMClient):
         """
         try:
             # JSONブロック（```json ... ```）を抽出
-            json_match = re.search(
-                r'```json\s*(\{.*?\})\s*```',
-                response_text,
-                re.DOTALL
-            )
+            json_match = _JSON_BLOCK_RE.search(response_text)
 
             if json_match:
                 json_text = json_match.group(1)
             else:
                 # JSONブロックがない場合、{ } で囲まれた部分を探す
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(response_text)
                 if json_match:
                     json_text = json_match.group(0)
                 else:
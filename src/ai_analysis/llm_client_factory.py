@@ -28,6 +28,7 @@ client = create_llm_client(model_name="claude-sonnet-4-5")
 【作成日】2025-10-23
 """
 
+from functools import lru_cache
 from typing import Optional
 import logging
 from src.utils.config import get_config
@@ -77,6 +78,7 @@ def create_llm_client(
 
     モデル名のプレフィックスからプロバイダーを自動判定し、
     適切なLLMクライアントを生成します。
+    同じプロバイダー・APIキーでは生成済みのクライアントを再利用します。
 
     Args:
         model_name: モデル名
@@ -108,20 +110,34 @@ def create_llm_client(
             f".envファイルで{provider.upper()}_API_KEYを設定してください。"
         )
 
-    # プロバイダー別にクライアント生成
+    return _create_provider_client(provider, api_key)
+
+
+@lru_cache(maxsize=8)
+def _create_provider_client(provider: str, api_key: str) -> BaseLLMClient:
+    """
+    プロバイダー・APIキーごとにLLMクライアントを生成（結果はキャッシュ）
+
+    クライアントは使用モデルを呼び出し時に受け取るため、同じプロバイダー・
+    APIキーであれば1つのインスタンス（HTTP接続プール）を共有できます。
+
+    Args:
+        provider: プロバイダー名（gemini/openai/anthropic）
+        api_key: APIキー
+    """
     if provider == 'gemini':
         from src.ai_analysis.gemini_client import GeminiClient
-        logger.info(f"Creating Gemini client for model: {model_name}")
+        logger.info("Creating Gemini client")
         return GeminiClient(api_key=api_key)
 
     elif provider == 'openai':
         from src.ai_analysis.openai_client import OpenAIClient
-        logger.info(f"Creating OpenAI client for model: {model_name}")
+        logger.info("Creating OpenAI client")
         return OpenAIClient(api_key=api_key)
 
     elif provider == 'anthropic':
         from src.ai_analysis.anthropic_client import AnthropicClient
-        logger.info(f"Creating Anthropic client for model: {model_name}")
+        logger.info("Creating Anthropic client")
         return AnthropicClient(api_key=api_key)
 
     else:
@@ -135,6 +151,8 @@ def create_phase_clients() -> dict:
 
     環境変数で設定されたモデル名に基づいて、
     各Phaseで使用するLLMクライアントを生成します。
+    同じプロバイダー・APIキーのクライアントは create_llm_client() 側で
+    共有されるため、Phase間・呼び出し間でSDKクライアントは再生成されません。
 
     Returns:
         dict: Phase名をキーとするクライアント辞書
@@ -0,0 +1,154 @@
+"""
+========================================
+LLM接続テスト結果キャッシュモジュール
+========================================
+
+ファイル名: probe_cache.py
+パス: src/ai_analysis/probe_cache.py
+
+【概要】
+LLMクライアントの接続テスト（test_connection）の成功結果を
+ファイルにキャッシュし、短時間に繰り返し実行されるテストスクリプトで
+API呼び出しを省略します。
+
+【キャッシュ仕様】
+- 保存先: $XDG_CACHE_HOME/fx-autotrade/llm_probe.json（未設定時は ~/.cache）
+- キー: (プロバイダー名, モデル名, APIキーのハッシュ)
+- 有効期間: 既定600秒
+- 成功結果のみキャッシュ（失敗時は毎回再テスト）
+
+【使用例】
+```python
+from src.ai_analysis.probe_cache import cached_test_connection
+
+ok = cached_test_connection(client, model='gemini-2.5-flash')
+ok = cached_test_connection(client, model='gpt-4o', use_cache=False)  # 強制再テスト
+
+# 独自の接続テストを行うスクリプトでは判定と記録を個別に呼び出す
+if not is_probe_cached(client, 'gpt-5-nano'):
+    if client.generate_response(prompt='OK?', model='gpt-5-nano'):
+        record_probe_success(client, 'gpt-5-nano')
+```
+
+【作成日】2025-10-23
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from src.ai_analysis.base_llm_client import BaseLLMClient
+from src.utils.cache import cache_dir
+
+logger = logging.getLogger(__name__)
+
+# キャッシュの既定有効期間（秒）
+DEFAULT_TTL = 600
+
+# 複数スレッドからの同時書き込みを防ぐロック
+_lock = threading.Lock()
+
+
+def _cache_path() -> str:
+    """キャッシュファイルのパスを取得"""
+    return os.path.join(cache_dir(), 'llm_probe.json')
+
+
+def _cache_key(client: BaseLLMClient, model: str) -> str:
+    """キャッシュキーを生成（APIキーはハッシュ化して保持）"""
+    api_key_hash = hashlib.sha256((client.api_key or '').encode('utf-8')).hexdigest()[:16]
+    return f"{client.get_provider_name()}:{model}:{api_key_hash}"
+
+
+def _load_cache(path: str) -> dict:
+    """キャッシュファイルを読み込む（存在しない・破損時は空）"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_probe_cached(client: BaseLLMClient, model: str, ttl: int = DEFAULT_TTL) -> bool:
+    """
+    有効期間内に接続テストが成功しているか確認
+
+    Args:
+        client: LLMクライアント
+        model: テスト対象のモデル名
+        ttl: キャッシュの有効期間（秒）
+
+    Returns:
+        bool: True=有効なキャッシュあり
+    """
+    key = _cache_key(client, model)
+    entry = _load_cache(_cache_path()).get(key)
+    if entry and entry.get('ok') and time.time() - entry.get('ts', 0) < ttl:
+        logger.debug(f"Connection test cache hit: {key}")
+        return True
+    return False
+
+
+def record_probe_success(client: BaseLLMClient, model: str) -> None:
+    """
+    接続テストの成功をキャッシュに記録
+
+    Args:
+        client: LLMクライアント
+        model: テスト対象のモデル名
+    """
+    path = _cache_path()
+    with _lock:
+        cache = _load_cache(path)
+        cache[_cache_key(client, model)] = {'ok': True, 'ts': time.time()}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # キャッシュの保存失敗は接続テスト結果に影響させない
+            logger.debug(f"Failed to save connection test cache: {e}")
+
+
+def cached_test_connection(
+    client: BaseLLMClient,
+    model: str,
+    ttl: int = DEFAULT_TTL,
+    use_cache: bool = True
+) -> bool:
+    """
+    キャッシュを利用してLLMの接続テストを実行
+
+    有効期間内に同じプロバイダー・モデル・APIキーで成功していれば、
+    API呼び出しを行わずにTrueを返します。
+
+    Args:
+        client: LLMクライアント
+        model: テスト対象のモデル名
+        ttl: キャッシュの有効期間（秒）
+        use_cache: Falseの場合はキャッシュを参照せず必ず再テストする
+
+    Returns:
+        bool: True=接続成功, False=接続失敗
+    """
+    if use_cache and is_probe_cached(client, model, ttl):
+        return True
+
+    ok = client.test_connection(verbose=False, model=model)
+    if ok:
+        record_probe_success(client, model)
+    return ok
+
+
+# モジュールのエクスポート
+__all__ = [
+    'cached_test_connection',
+    'is_probe_cached',
+    'record_probe_success',
+    'DEFAULT_TTL'
+]
@@ -3,11 +3,12 @@
 
 AI APIの使用トークン数を記録・集計します。
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime
 import logging
 import os
+import sys
 
 
 class TokenUsageTracker:
@@ -32,6 +33,8 @@ class TokenUsageTracker:
 
         self.logger = logging.getLogger(__name__)
         self.usage_records: List[Dict] = []
+        # モデル料金のキャッシュ（(モデル名, 'INPUT'/'OUTPUT') -> 料金）
+        self._price_cache: Dict[Tuple[str, str], Optional[float]] = {}
         self._initialized = True
 
     def record_usage(
@@ -82,6 +85,11 @@ class TokenUsageTracker:
         Returns:
             料金（USD per 1M tokens）、設定されていない場合はNone
         """
+        # サマリー集計ではレコードごとに呼ばれるため、モデル単位でキャッシュ
+        cache_key = (model, token_type)
+        if cache_key in self._price_cache:
+            return self._price_cache[cache_key]
+
         # モデル名のバージョン記号を正規化
         # 例: claude-sonnet-4-5@20250929 -> claude-sonnet-4-5
         model_key = model.split('@')[0]
@@ -89,13 +97,15 @@ class TokenUsageTracker:
         env_key = f"PRICE_{model_key}_{token_type}"
         price_str = os.getenv(env_key)
 
+        price = None
         if price_str:
             try:
-                return float(price_str)
+                price = float(price_str)
             except ValueError:
                 self.logger.warning(f"Invalid price value for {env_key}: {price_str}")
-                return None
-        return None
+
+        self._price_cache[cache_key] = price
+        return price
 
     def _calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> Optional[float]:
         """
@@ -115,11 +125,8 @@ class TokenUsageTracker:
         if input_price is None or output_price is None:
             return None
 
-        # 1M tokens あたりの料金から実際のコストを計算
-        input_cost = (input_tokens / 1_000_000) * input_price
-        output_cost = (output_tokens / 1_000_000) * output_price
-
-        return input_cost + output_cost
+        # 1M tokens あたりの料金から実際のコストを計算（除算は1回にまとめる）
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
 
     def _get_filtered_summary(self) -> Dict:
         """
@@ -278,76 +285,61 @@ class TokenUsageTracker:
 
     def print_summary(self):
         """トークン使用量サマリーを標準出力に表示（接続テストを除く）"""
-        summary = self.get_summary()
-
         # 接続テストを除外したサマリーを計算
         filtered_summary = self._get_filtered_summary()
 
-        print("=" * 80)
-        print("トークン使用量レポート")
-        print("=" * 80)
-        print()
-
-        # 総計（接続テスト除く）
-        print(f"総API呼び出し回数: {filtered_summary['call_count']:,}回")
-        print(f"総入力トークン数:   {filtered_summary['total_input_tokens']:,} tokens")
-        print(f"総出力トークン数:   {filtered_summary['total_output_tokens']:,} tokens")
-        print(f"総トークン数:       {filtered_summary['total_tokens']:,} tokens")
+        # レポート全体を組み立ててから1回で出力
+        lines = [
+            "=" * 80,
+            "トークン使用量レポート",
+            "=" * 80,
+            "",
+            # 総計（接続テスト除く）
+            f"総API呼び出し回数: {filtered_summary['call_count']:,}回",
+            f"総入力トークン数:   {filtered_summary['total_input_tokens']:,} tokens",
+            f"総出力トークン数:   {filtered_summary['total_output_tokens']:,} tokens",
+            f"総トークン数:       {filtered_summary['total_tokens']:,} tokens",
+        ]
         if filtered_summary['total_cost'] > 0:
-            print(f"総コスト:           ${filtered_summary['total_cost']:.4f} USD")
-        print()
-
-        # Phase別（接続テスト除く）
-        if filtered_summary['by_phase']:
-            print("-" * 80)
-            print("Phase別使用量:")
-            print("-" * 80)
-            for phase, stats in sorted(filtered_summary['by_phase'].items()):
-                cost_str = f" | コスト: ${stats['cost']:.4f}" if stats['cost'] > 0 else ""
-                print(f"{phase:20s}: {stats['calls']:3d}回 | "
-                      f"入力: {stats['input']:8,} | "
-                      f"出力: {stats['output']:8,} | "
-                      f"合計: {stats['total']:8,} tokens{cost_str}")
-            print()
-
-        # プロバイダー別（接続テスト除く）
-        if filtered_summary['by_provider']:
-            print("-" * 80)
-            print("プロバイダー別使用量:")
-            print("-" * 80)
-            for provider, stats in sorted(filtered_summary['by_provider'].items()):
-                cost_str = f" | コスト: ${stats['cost']:.4f}" if stats['cost'] > 0 else ""
-                print(f"{provider.upper():20s}: {stats['calls']:3d}回 | "
-                      f"入力: {stats['input']:8,} | "
-                      f"出力: {stats['output']:8,} | "
-                      f"合計: {stats['total']:8,} tokens{cost_str}")
-            print()
-
-        # モデル別（接続テスト除く）
-        if filtered_summary['by_model']:
-            print("-" * 80)
-            print("モデル別使用量:")
-            print("-" * 80)
-            for model, stats in sorted(filtered_summary['by_model'].items()):
+            lines.append(f"総コスト:           ${filtered_summary['total_cost']:.4f} USD")
+        lines.append("")
+
+        # Phase別・プロバイダー別・モデル別（接続テスト除く）
+        sections = (
+            ('by_phase', "Phase別使用量:", 20, str),
+            ('by_provider', "プロバイダー別使用量:", 20, str.upper),
+            ('by_model', "モデル別使用量:", 40, str),
+        )
+        for key, title, width, label in sections:
+            if not filtered_summary[key]:
+                continue
+            lines += ["-" * 80, title, "-" * 80]
+            for name, stats in sorted(filtered_summary[key].items()):
                 cost_str = f" | コスト: ${stats['cost']:.4f}" if stats['cost'] > 0 else ""
-                print(f"{model:40s}: {stats['calls']:3d}回 | "
-                      f"入力: {stats['input']:8,} | "
-                      f"出力: {stats['output']:8,} | "
-                      f"合計: {stats['total']:8,} tokens{cost_str}")
-            print()
+                lines.append(
+                    f"{label(name):{width}s}: {stats['calls']:3d}回 | "
+                    f"入力: {stats['input']:8,} | "
+                    f"出力: {stats['output']:8,} | "
+                    f"合計: {stats['total']:8,} tokens{cost_str}"
+                )
+            lines.append("")
 
         # コスト情報の注釈
         if filtered_summary['total_cost'] > 0:
-            print("-" * 80)
-            print("※ コストは.envで設定されたPRICE_*変数に基づいて計算されています")
-            print("※ 料金が設定されていないモデルのコストは0として表示されます")
-            print()
+            lines += [
+                "-" * 80,
+                "※ コストは.envで設定されたPRICE_*変数に基づいて計算されています",
+                "※ 料金が設定されていないモデルのコストは0として表示されます",
+                "",
+            ]
 
-        print("=" * 80)
+        lines.append("=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def reset(self):
-        """記録をリセット"""
+        """記録をリセット（料金のキャッシュも破棄）"""
         self.usage_records = []
+        self._price_cache = {}
         self.logger.info("Token usage records reset")
 
 
@@ -33,7 +33,7 @@ print(f"Win rate: {results['win_rate']:.2f}%")
 【作成日】2025-10-23
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta, date
 import logging
 import pandas as pd
@@ -66,7 +66,8 @@ class BacktestEngine:
         sampling_interval_hours: int = 24,  # サンプリング間隔（時間）
         risk_percent: Optional[float] = None,
         csv_path: Optional[str] = None,  # CSVファイルパス（指定時はCSVを使用）
-        skip_api_check: bool = False  # API接続チェックをスキップ（リセット専用時など）
+        skip_api_check: bool = False,  # API接続チェックをスキップ（リセット専用時など）
+        stream: bool = False  # CSVをチャンク単位で読み込む（メモリ使用量を抑える）
     ):
         """
         バックテストエンジンの初期化
@@ -81,6 +82,7 @@ class BacktestEngine:
             risk_percent: リスク許容率（%、Noneの場合は.envから取得）
             csv_path: CSVファイルパス（指定時はCSVからデータ読み込み、未指定時はMT5または.envから取得）
             skip_api_check: API接続チェックをスキップ（リセット専用時など、デフォルト: False）
+            stream: CSV読み込み時にファイル全体を展開せず、チャンク単位で期間内のティックのみ保持する
         """
         from src.utils.config import get_config
 
@@ -102,6 +104,7 @@ class BacktestEngine:
         self.sampling_interval = timedelta(hours=sampling_interval_hours)
         self.risk_percent = risk_percent if risk_percent is not None else config.risk_per_trade
         self.csv_path = csv_path if csv_path is not None else config.backtest_csv_path
+        self.stream_csv = stream
         self.rule_generation_interval_hours = config.rule_generation_interval_hours
         self.logger = logging.getLogger(__name__)
 
@@ -136,6 +139,9 @@ class BacktestEngine:
         # レポートデータ保存用
         self.daily_reports: Dict[str, Dict] = {}  # 日付ごとのレポート
 
+        # 読み込み済みティックデータ（開始日時, 終了日時, ティックリスト）
+        self._tick_data_cache: Optional[Tuple[datetime, datetime, List[Dict]]] = None
+
         # DB接続情報
         self.db_config = {
             'host': os.getenv('DB_HOST', 'localhost'),
@@ -464,74 +470,7 @@ class BacktestEngine:
         # AI分析用に30日前からのデータを読み込む
         extended_start = self.start_date - timedelta(days=30)
 
-        # まずDBキャッシュをチェック
-        tick_data = None
-        try:
-            print("   DBキャッシュを確認中...")
-            tick_data = self.tick_data_loader.load_date_range(
-                symbol=self.symbol,
-                start_date=extended_start,
-                end_date=self.end_date
-            )
-
-            # キャッシュ使用統計を表示
-            stats = self.tick_data_loader.last_cache_stats
-            if stats and stats['hit_rate'] >= 100.0:
-                # 100%キャッシュヒット
-                print(f"✓ {len(tick_data):,}ティック読み込み完了（DBキャッシュ） | "
-                      f"キャッシュヒット: {stats['cache_hits']}/{stats['total_days']}日 (100.0%)")
-                print("")
-            elif stats and stats['hit_rate'] > 0:
-                # 一部キャッシュヒット - ZIPから読み込んだデータもある
-                print(f"✓ {len(tick_data):,}ティック読み込み完了（DBキャッシュ + ZIP） | "
-                      f"キャッシュヒット: {stats['cache_hits']}/{stats['total_days']}日 ({stats['hit_rate']:.1f}%) | "
-                      f"ZIPロード: {stats['months_loaded']}ヶ月")
-                print("")
-            else:
-                # キャッシュミス（例外発生）
-                raise Exception("DBキャッシュにデータがありません")
-
-        except Exception as e:
-            # DBキャッシュからの読み込みに失敗した場合、CSVから読み込む
-            if self.has_csv_backup:
-                print(f"   DBキャッシュ読み込み失敗: {e}")
-                print(f"   CSVファイルから読み込み中...")
-
-                # CSVファイルから読み込み（AI分析用に30日のバッファを含む）
-                tick_df = self.csv_loader.load_ticks(
-                    start_date=extended_start.strftime('%Y-%m-%d'),
-                    end_date=self.end_date.strftime('%Y-%m-%d'),
-                    history_days=0  # extended_startで既に30日前から指定している
-                )
-
-                # DataFrameをリストに変換
-                tick_data = []
-                for idx, row in tick_df.iterrows():
-                    tick_data.append({
-                        'timestamp': row['timestamp'],
-                        'time': row['timestamp'],
-                        'bid': row['bid'],
-                        'ask': row['ask'],
-                        'volume': row.get('volume', 0)
-                    })
-
-                print(f"✓ {len(tick_data):,}ティック読み込み完了（CSV）")
-
-                # CSVから読み込んだデータをDBキャッシュに保存
-                print("   DBキャッシュに保存中...")
-                self._save_ticks_to_cache(tick_data, extended_start.date(), self.end_date.date())
-                print("   ✓ DBキャッシュに保存完了")
-                print("")
-            else:
-                # CSVもない場合はエラー
-                self.logger.error(f"❌ データ読み込み失敗: {e}")
-                self.logger.error("   DBキャッシュにデータがなく、CSVパスも設定されていません")
-                return {}
-
-        # 時刻キーの統一（'timestamp' に変換）
-        if tick_data and 'timestamp' in tick_data[0]:
-            for tick in tick_data:
-                tick['time'] = tick['timestamp']
+        tick_data = self._load_tick_data(extended_start)
 
         if not tick_data:
             self.logger.error("❌ データ読み込み失敗")
@@ -705,6 +644,185 @@ class BacktestEngine:
 
         return stats
 
+    def _load_tick_data(self, extended_start: datetime) -> Optional[List[Dict]]:
+        """
+        バックテスト期間のティックデータを読み込む
+
+        読み込んだデータはエンジン内に保持し、reset()後の再実行で
+        期間が読み込み済みの範囲に収まる場合はI/Oなしで再利用します。
+
+        Args:
+            extended_start: 読み込み開始日時（AI分析用のバッファを含む）
+
+        Returns:
+            ティックデータのリスト（読み込み失敗時はNone）
+        """
+        # 読み込み済みの範囲に収まる場合は再利用
+        if self._tick_data_cache is not None:
+            cached_start, cached_end, cached_ticks = self._tick_data_cache
+            if cached_start <= extended_start and self.end_date <= cached_end:
+                start_day = extended_start.date()
+                end_day = self.end_date.date()
+                tick_data = [
+                    tick for tick in cached_ticks
+                    if start_day <= tick['time'].date() <= end_day
+                ]
+                print(f"✓ {len(tick_data):,}ティック読み込み完了（メモリ再利用）")
+                print("")
+                return tick_data
+
+        # まずDBキャッシュをチェック
+        tick_data = None
+        try:
+            print("   DBキャッシュを確認中...")
+            tick_data = self.tick_data_loader.load_date_range(
+                symbol=self.symbol,
+                start_date=extended_start,
+                end_date=self.end_date
+            )
+
+            # キャッシュ使用統計を表示
+            stats = self.tick_data_loader.last_cache_stats
+            if stats and stats['hit_rate'] >= 100.0:
+                # 100%キャッシュヒット
+                print(f"✓ {len(tick_data):,}ティック読み込み完了（DBキャッシュ） | "
+                      f"キャッシュヒット: {stats['cache_hits']}/{stats['total_days']}日 (100.0%)")
+                print("")
+            elif stats and stats['hit_rate'] > 0:
+                # 一部キャッシュヒット - ZIPから読み込んだデータもある
+                print(f"✓ {len(tick_data):,}ティック読み込み完了（DBキャッシュ + ZIP） | "
+                      f"キャッシュヒット: {stats['cache_hits']}/{stats['total_days']}日 ({stats['hit_rate']:.1f}%) | "
+                      f"ZIPロード: {stats['months_loaded']}ヶ月")
+                print("")
+            else:
+                # キャッシュミス（例外発生）
+                raise Exception("DBキャッシュにデータがありません")
+
+        except Exception as e:
+            # DBキャッシュからの読み込みに失敗した場合、CSVから読み込む
+            if self.has_csv_backup:
+                print(f"   DBキャッシュ読み込み失敗: {e}")
+                print(f"   CSVファイルから読み込み中...")
+
+                if self.stream_csv:
+                    # チャンク単位で読み込み、期間内のティックのみ保持
+                    tick_data = []
+                    for chunk in self.csv_loader.iter_ticks(
+                        start_date=extended_start.strftime('%Y-%m-%d'),
+                        end_date=self.end_date.strftime('%Y-%m-%d')
+                    ):
+                        tick_data.extend(
+                            {'timestamp': ts, 'time': ts, 'bid': bid, 'ask': ask, 'volume': volume}
+                            for ts, bid, ask, volume in zip(
+                                chunk['timestamp'].dt.to_pydatetime(),
+                                chunk['bid'].tolist(),
+                                chunk['ask'].tolist(),
+                                chunk['volume'].tolist()
+                            )
+                        )
+                    return self._finish_csv_load(tick_data, extended_start)
+
+                # CSVファイルから読み込み（AI分析用に30日のバッファを含む）
+                tick_df = self.csv_loader.load_ticks(
+                    start_date=extended_start.strftime('%Y-%m-%d'),
+                    end_date=self.end_date.strftime('%Y-%m-%d'),
+                    history_days=0  # extended_startで既に30日前から指定している
+                )
+
+                # DataFrameをリストに変換
+                tick_data = []
+                for idx, row in tick_df.iterrows():
+                    tick_data.append({
+                        'timestamp': row['timestamp'],
+                        'time': row['timestamp'],
+                        'bid': row['bid'],
+                        'ask': row['ask'],
+                        'volume': row.get('volume', 0)
+                    })
+
+                return self._finish_csv_load(tick_data, extended_start)
+            else:
+                # CSVもない場合はエラー
+                self.logger.error(f"❌ データ読み込み失敗: {e}")
+                self.logger.error("   DBキャッシュにデータがなく、CSVパスも設定されていません")
+                return None
+
+        # 時刻キーの統一（'timestamp' に変換）
+        if tick_data and 'timestamp' in tick_data[0]:
+            for tick in tick_data:
+                tick['time'] = tick['timestamp']
+
+        if tick_data:
+            self._tick_data_cache = (extended_start, self.end_date, tick_data)
+
+        return tick_data
+
+    def _finish_csv_load(self, tick_data: List[Dict], extended_start: datetime) -> List[Dict]:
+        """
+        CSVから読み込んだティックデータをDBキャッシュに保存し、エンジン内に保持
+
+        Args:
+            tick_data: ティックデータのリスト
+            extended_start: 読み込み開始日時
+
+        Returns:
+            ティックデータのリスト
+        """
+        print(f"✓ {len(tick_data):,}ティック読み込み完了（CSV）")
+
+        # CSVから読み込んだデータをDBキャッシュに保存
+        print("   DBキャッシュに保存中...")
+        self._save_ticks_to_cache(tick_data, extended_start.date(), self.end_date.date())
+        print("   ✓ DBキャッシュに保存完了")
+        print("")
+
+        if tick_data:
+            self._tick_data_cache = (extended_start, self.end_date, tick_data)
+
+        return tick_data
+
+    def reset(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        initial_balance: Optional[float] = None
+    ):
+        """
+        バックテスト状態をリセット（期間・残高の変更）
+
+        読み込み済みのティックデータ・データローダー・LLMクライアントは保持したまま、
+        シミュレーターとトレード履歴のみを初期化します。
+        期間や残高を変えて繰り返し実行する場合に、再構築のコストを省けます。
+
+        Args:
+            start_date: 開始日（YYYY-MM-DD、Noneの場合は現在の値を維持）
+            end_date: 終了日（YYYY-MM-DD、Noneの場合は現在の値を維持）
+            initial_balance: 初期残高（Noneの場合は現在の値を維持）
+        """
+        if start_date is not None:
+            self.start_date = datetime.strptime(start_date, '%Y-%m-%d')
+        if end_date is not None:
+            self.end_date = datetime.strptime(end_date, '%Y-%m-%d')
+        if initial_balance is not None:
+            self.initial_balance = initial_balance
+
+        self.simulator = TradeSimulator(
+            initial_balance=self.initial_balance,
+            symbol=self.symbol,
+            backtest_start_date=self.start_date.date(),
+            backtest_end_date=self.end_date.date()
+        )
+
+        # バックテスト実行状態
+        self.current_time = None
+        self.trade_history = []
+        self.daily_reports = {}
+
+        # 異常検知の比較基準
+        for attr in ('_last_price', '_last_check_time'):
+            if hasattr(self, attr):
+                delattr(self, attr)
+
     def _analyze_at_time(self, timestamp: datetime) -> Optional[Dict]:
         """
         指定時刻でAI分析を実行
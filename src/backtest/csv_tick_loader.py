@@ -25,12 +25,16 @@ df = loader.load_ticks(
     end_date='2024-09-30'
 )
 
+# Stream in chunks (constant memory regardless of file size)
+for chunk in loader.iter_ticks(start_date='2024-09-23', end_date='2024-09-30'):
+    ...
+
 Created: 2025-10-23
 """
 
 import pandas as pd
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterator, List, Optional
 import logging
 import os
 import zipfile
@@ -44,6 +48,9 @@ class CSVTickLoader:
     Loads tick data from CSV files for backtesting.
     """
 
+    # Rows per chunk when streaming (iter_ticks)
+    STREAM_CHUNK_SIZE = 200_000
+
     def __init__(self, csv_path: str, symbol: str = 'USDJPY'):
         """
         Initialize CSV Tick Loader
@@ -110,6 +117,126 @@ class CSVTickLoader:
 
         return df
 
+    def iter_ticks(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        chunksize: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream tick data in chunks, filtered to the date range
+
+        Unlike load_ticks(), files are read chunk by chunk and rows outside
+        the date range are dropped before the next chunk is read, so the
+        full (unfiltered) file is never held in memory.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD format), optional
+            end_date: End date (YYYY-MM-DD format, inclusive), optional
+            chunksize: Number of CSV rows per chunk
+
+        Yields:
+            pd.DataFrame: Tick data chunk with columns: timestamp, bid, ask, volume
+
+        Raises:
+            FileNotFoundError: If CSV file not found
+            ValueError: If CSV format is invalid or data is insufficient
+        """
+        if os.path.isfile(self.csv_path):
+            files = [self.csv_path]
+        elif os.path.isdir(self.csv_path):
+            all_files = [
+                f for f in os.listdir(self.csv_path)
+                if f.endswith('.csv') or f.endswith('.zip')
+            ]
+            if not all_files:
+                raise FileNotFoundError(
+                    f"No CSV or ZIP files found in: {self.csv_path}"
+                )
+            data_files = self._filter_files_by_date(all_files, start_date, end_date) or all_files
+            files = [os.path.join(self.csv_path, f) for f in sorted(data_files)]
+        else:
+            raise FileNotFoundError(
+                f"CSV path not found: {self.csv_path}"
+            )
+
+        start_dt = pd.to_datetime(start_date) if start_date else None
+        end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1) if end_date else None  # Include end date
+
+        # Earliest/latest streamed timestamps (chunks are only sorted individually)
+        min_ts = None
+        max_ts = None
+        rows = 0
+
+        for filepath in files:
+            self.logger.info(f"Streaming file: {filepath}")
+            for i, chunk in enumerate(self._iter_file_chunks(filepath, chunksize)):
+                # Log the column normalization once per file, not once per chunk
+                chunk = self._standardize(chunk, log_columns=(i == 0))
+                if start_dt is not None:
+                    chunk = chunk[chunk['timestamp'] >= start_dt]
+                if end_dt is not None:
+                    chunk = chunk[chunk['timestamp'] < end_dt]
+                if chunk.empty:
+                    continue
+
+                chunk_min = chunk['timestamp'].min()
+                chunk_max = chunk['timestamp'].max()
+                if min_ts is None or chunk_min < min_ts:
+                    min_ts = chunk_min
+                if max_ts is None or chunk_max > max_ts:
+                    max_ts = chunk_max
+                rows += len(chunk)
+                yield chunk
+
+        if min_ts is None:
+            raise ValueError(
+                f"No tick data loaded from: {self.csv_path}"
+            )
+
+        self.logger.info(f"Streamed {rows:,} ticks from {len(files)} file(s)")
+
+        # Validate data coverage (only the min/max timestamps are needed)
+        self._validate_data_coverage(
+            pd.DataFrame({'timestamp': [min_ts, max_ts]}), start_date, end_date
+        )
+
+    def _iter_file_chunks(self, filepath: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV or ZIP file in raw chunks
+
+        Args:
+            filepath: Path to CSV or ZIP file
+            chunksize: Number of rows per chunk
+
+        Yields:
+            pd.DataFrame: Raw (not yet normalized) CSV rows
+        """
+        if filepath.lower().endswith('.zip'):
+            with zipfile.ZipFile(filepath, 'r') as zip_ref:
+                csv_files = [f for f in zip_ref.namelist() if f.endswith('.csv')]
+                if not csv_files:
+                    raise ValueError(f"No CSV files found in ZIP: {filepath}")
+                if len(csv_files) > 1:
+                    self.logger.warning(
+                        f"Multiple CSV files found in ZIP. Using first one: {csv_files[0]}"
+                    )
+                with zip_ref.open(csv_files[0]) as f:
+                    yield from self._read_chunks(f, chunksize)
+        else:
+            with open(filepath, 'rb') as f:
+                yield from self._read_chunks(f, chunksize)
+
+    @staticmethod
+    def _read_chunks(f, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Read chunks from a binary file object (tab- or comma-separated)"""
+        # Detect separator from the header line (tab-separated is preferred)
+        header = f.readline()
+        f.seek(0)
+        sep = '\t' if b'\t' in header else ','
+
+        yield from pd.read_csv(f, sep=sep, chunksize=chunksize)
+
     def _validate_data_coverage(
         self,
         df: pd.DataFrame,
@@ -175,7 +302,7 @@ class CSVTickLoader:
 
         self.logger.debug("Data coverage validation: PASSED")
 
-    def _normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _normalize_columns(self, df: pd.DataFrame, log_columns: bool = True) -> pd.DataFrame:
         """
         Normalize CSV column names to standard format
 
@@ -193,13 +320,16 @@ class CSVTickLoader:
 
         Args:
             df: Input dataframe
+            log_columns: Log the detected format/renaming at INFO (DEBUG otherwise)
 
         Returns:
             pd.DataFrame: Dataframe with normalized column names
         """
+        log = self.logger.info if log_columns else self.logger.debug
+
         # Handle MT5 CSV format with <DATE> and <TIME>
         if '<DATE>' in df.columns and '<TIME>' in df.columns:
-            self.logger.info("Detected MT5 CSV format with <DATE> and <TIME>")
+            log("Detected MT5 CSV format with <DATE> and <TIME>")
 
             # Combine <DATE> and <TIME> into timestamp
             df['timestamp'] = pd.to_datetime(
@@ -219,7 +349,7 @@ class CSVTickLoader:
 
             if column_map:
                 df = df.rename(columns=column_map)
-                self.logger.info(f"Normalized MT5 columns: {column_map}")
+                log(f"Normalized MT5 columns: {column_map}")
 
             return df
 
@@ -245,10 +375,52 @@ class CSVTickLoader:
         # Apply renaming
         if column_map:
             df = df.rename(columns=column_map)
-            self.logger.info(f"Normalized columns: {column_map}")
+            log(f"Normalized columns: {column_map}")
 
         return df
 
+    def _standardize(self, df: pd.DataFrame, log_columns: bool = True) -> pd.DataFrame:
+        """
+        Normalize, validate and sort raw CSV rows
+
+        Args:
+            df: Raw dataframe read from CSV
+            log_columns: Log the column normalization at INFO (DEBUG otherwise)
+
+        Returns:
+            pd.DataFrame: Tick data with columns: timestamp, bid, ask, volume
+
+        Raises:
+            ValueError: If required columns are missing
+        """
+        # Normalize column names (auto-rename common variations)
+        df = self._normalize_columns(df, log_columns)
+
+        # Validate columns
+        required_cols = ['timestamp', 'bid', 'ask']
+        missing_cols = [col for col in required_cols if col not in df.columns]
+
+        if missing_cols:
+            available_cols = list(df.columns)
+            raise ValueError(
+                f"Missing required columns: {missing_cols}. "
+                f"Available columns: {available_cols}. "
+                f"CSV must have: timestamp (or time/datetime), bid, ask (volume is optional)"
+            )
+
+        # Convert timestamp to datetime
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+
+        # Add volume column if not present
+        if 'volume' not in df.columns:
+            df['volume'] = 0
+
+        # Select and order columns
+        df = df[['timestamp', 'bid', 'ask', 'volume']].copy()
+
+        # Sort by timestamp
+        return df.sort_values('timestamp').reset_index(drop=True)
+
     def _load_csv_file(self, filepath: str) -> pd.DataFrame:
         """
         Load single CSV file (supports .csv and .zip files)
@@ -275,33 +447,7 @@ class CSVTickLoader:
                 except Exception:
                     df = pd.read_csv(filepath, sep=',')
 
-            # Normalize column names (auto-rename common variations)
-            df = self._normalize_columns(df)
-
-            # Validate columns
-            required_cols = ['timestamp', 'bid', 'ask']
-            missing_cols = [col for col in required_cols if col not in df.columns]
-
-            if missing_cols:
-                available_cols = list(df.columns)
-                raise ValueError(
-                    f"Missing required columns: {missing_cols}. "
-                    f"Available columns: {available_cols}. "
-                    f"CSV must have: timestamp (or time/datetime), bid, ask (volume is optional)"
-                )
-
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-
-            # Add volume column if not present
-            if 'volume' not in df.columns:
-                df['volume'] = 0
-
-            # Select and order columns
-            df = df[['timestamp', 'bid', 'ask', 'volume']].copy()
-
-            # Sort by timestamp
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            df = self._standardize(df)
 
             self.logger.info(f"Loaded {len(df):,} rows from {filepath}")
 
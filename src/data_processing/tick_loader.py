@@ -41,7 +41,6 @@ CSVカラム: <DATE>, <TIME>, <BID>, <ASK>, <LAST>, <VOLUME>
 
 import zipfile
 import csv
-import io
 from datetime import datetime
 from typing import List, Dict, Optional
 import logging
@@ -65,6 +64,9 @@ class TickDataLoader:
         load_from_zip: zipファイルからティックデータを読み込む
     """
 
+    # CSVの必須列（<DATE>, <TIME>, <BID>, <ASK>の順）
+    REQUIRED_COLUMNS = ('<DATE>', '<TIME>', '<BID>', '<ASK>')
+
     def __init__(self, data_dir: str = "data/tick_data", use_cache: bool = True):
         """
         TickDataLoaderの初期化
@@ -379,50 +381,63 @@ class TickDataLoader:
 
                 self.logger.debug(f"CSV読み込み: {csv_filename}")
 
-                # zipファイル内のCSVファイルを開く
-                with zip_ref.open(csv_filename) as f:
-                    # UTF-8エンコーディングでテキストラッパーを適用
-                    text_wrapper = io.TextIOWrapper(f, encoding='utf-8')
-                    # タブ区切り（TSV）として読み込み
-                    reader = csv.DictReader(text_wrapper, delimiter='\t')
-
-                    # 各行を処理
-                    for row_num, row in enumerate(reader, start=1):
-                        try:
-                            # <DATE> と <TIME> を結合してタイムスタンプを作成
-                            # フォーマット: "2024.01.01" + " " + "20:11:15.408"
-                            date_str = row['<DATE>'].strip()
-                            time_str = row['<TIME>'].strip()
-
-                            # "2024.01.01 20:11:15.408" → datetime
-                            # まず、"."を"-"に変換して標準形式にする
-                            date_str = date_str.replace('.', '-')
-                            timestamp_str = f"{date_str} {time_str}"
-                            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
-
-                            # Bid/Ask価格を取得
-                            bid = float(row['<BID>'].strip())
-                            ask = float(row['<ASK>'].strip())
-
-                            # Volumeを取得（空の場合は0）
-                            volume_str = row.get('<VOLUME>', '').strip()
-                            volume = int(float(volume_str)) if volume_str else 0
-
-                            # ティックデータの構築
-                            tick = {
-                                'timestamp': timestamp,
-                                'bid': bid,
-                                'ask': ask,
-                                'volume': volume
-                            }
-                            tick_data.append(tick)
-
-                        except (ValueError, KeyError) as e:
-                            # データパースエラー（スキップして続行）
-                            self.logger.warning(
-                                f"行 {row_num} のパースに失敗: {e} - データ: {row}"
-                            )
-                            continue
+                # zipファイル内のCSVを一括で読み込み、UTF-8でまとめてデコード
+                # （TextIOWrapperによる逐次デコードより高速）
+                lines = zip_ref.read(csv_filename).decode('utf-8').splitlines()
+
+            # タブ区切り（TSV）として読み込み
+            # （DictReaderは行ごとに辞書を生成するため、ヘッダーの列位置で参照する）
+            reader = csv.reader(lines, delimiter='\t')
+            header = next(reader, [])
+            columns = {name: i for i, name in enumerate(header)}
+
+            missing = [name for name in self.REQUIRED_COLUMNS if name not in columns]
+            if missing:
+                self.logger.error(f"必須列が見つかりません: {missing} - ヘッダー: {header}")
+                return tick_data
+
+            date_i, time_i, bid_i, ask_i = (columns[name] for name in self.REQUIRED_COLUMNS)
+            # <VOLUME>列は任意（存在しない場合は0）
+            volume_i = columns.get('<VOLUME>')
+
+            # 各行を処理
+            for row_num, row in enumerate(reader, start=1):
+                try:
+                    # <DATE> と <TIME> を結合してタイムスタンプを作成
+                    # フォーマット: "2024.01.01" + " " + "20:11:15.408"
+                    date_str = row[date_i].strip()
+                    time_str = row[time_i].strip()
+
+                    # "2024.01.01 20:11:15.408" → datetime
+                    # まず、"."を"-"に変換してISO 8601形式にする
+                    # （fromisoformatはstrptimeより大幅に高速。小数秒の桁数可変はPython 3.11以降）
+                    date_str = date_str.replace('.', '-')
+                    timestamp_str = f"{date_str} {time_str}"
+                    timestamp = datetime.fromisoformat(timestamp_str)
+
+                    # Bid/Ask価格を取得
+                    bid = float(row[bid_i].strip())
+                    ask = float(row[ask_i].strip())
+
+                    # Volumeを取得（空の場合は0）
+                    volume_str = row[volume_i].strip() if volume_i is not None and volume_i < len(row) else ''
+                    volume = int(float(volume_str)) if volume_str else 0
+
+                    # ティックデータの構築
+                    tick = {
+                        'timestamp': timestamp,
+                        'bid': bid,
+                        'ask': ask,
+                        'volume': volume
+                    }
+                    tick_data.append(tick)
+
+                except (ValueError, IndexError) as e:
+                    # データパースエラー（スキップして続行）
+                    self.logger.warning(
+                        f"行 {row_num} のパースに失敗: {e} - データ: {row}"
+                    )
+                    continue
 
             # 読み込み成功
             self.logger.debug(
@@ -61,6 +61,8 @@ class Layer1EmergencyMonitor:
         self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
+        # 監視ループ開始通知（wait_until_started()で使用）
+        self.loop_started = threading.Event()
 
         # 初期口座残高を記録
         self.initial_balance = self._get_account_balance()
@@ -88,6 +90,7 @@ class Layer1EmergencyMonitor:
         self.logger.info("Starting Layer 1 Emergency Monitor...")
         self.is_running = True
         self.stop_event.clear()
+        self.loop_started.clear()
 
         # 監視スレッドを開始
         self.monitor_thread = threading.Thread(
@@ -102,6 +105,18 @@ class Layer1EmergencyMonitor:
             f"(interval: {self.MONITOR_INTERVAL * 1000}ms)"
         )
 
+    def wait_until_started(self, timeout: Optional[float] = None) -> bool:
+        """
+        監視ループが開始されるまで待機
+
+        Args:
+            timeout: 最大待機時間（秒）。Noneの場合は無期限
+
+        Returns:
+            bool: True=監視ループ開始済み、False=タイムアウト
+        """
+        return self.loop_started.wait(timeout=timeout)
+
     def stop(self):
         """
         監視を停止
@@ -129,6 +144,7 @@ class Layer1EmergencyMonitor:
         100ms間隔で全ポジションを監視し、緊急停止条件をチェックします。
         """
         self.logger.info("Layer 1 monitor loop started")
+        self.loop_started.set()
 
         while self.is_running and not self.stop_event.is_set():
             try:
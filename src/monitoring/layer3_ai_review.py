@@ -68,6 +68,8 @@ class Layer3AIReviewMonitor:
         self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
+        # 監視ループ開始通知（wait_until_started()で使用）
+        self.loop_started = threading.Event()
 
         # ポジションのエントリー判断を記録（判断反転検知用）
         self.position_entry_judgments: Dict[int, Dict] = {}
@@ -95,6 +97,7 @@ class Layer3AIReviewMonitor:
         self.logger.info("Starting Layer 3 AI Review Monitor...")
         self.is_running = True
         self.stop_event.clear()
+        self.loop_started.clear()
 
         # 監視スレッドを開始
         self.monitor_thread = threading.Thread(
@@ -109,6 +112,18 @@ class Layer3AIReviewMonitor:
             f"(interval: {self.MONITOR_INTERVAL}s)"
         )
 
+    def wait_until_started(self, timeout: Optional[float] = None) -> bool:
+        """
+        監視ループが開始されるまで待機
+
+        Args:
+            timeout: 最大待機時間（秒）。Noneの場合は無期限
+
+        Returns:
+            bool: True=監視ループ開始済み、False=タイムアウト
+        """
+        return self.loop_started.wait(timeout=timeout)
+
     def stop(self):
         """
         監視を停止
@@ -136,6 +151,7 @@ class Layer3AIReviewMonitor:
         30分間隔で全ポジションを監視し、AI判断を再評価します。
         """
         self.logger.info("Layer 3 monitor loop started")
+        self.loop_started.set()
 
         while self.is_running and not self.stop_event.is_set():
             try:
@@ -47,6 +47,7 @@ orchestrator.stop_all()
 【作成日】2025-10-23
 """
 
+import time
 import logging
 from typing import Dict, Optional
 from datetime import datetime
@@ -182,6 +183,28 @@ class MonitorOrchestrator:
         self.logger.info("=" * 80)
         self.logger.info("")
 
+    def wait_until_running(self, timeout: float = 10.0) -> bool:
+        """
+        有効な全モニターの監視ループが開始されるまで待機
+
+        固定時間のsleepの代わりに使用し、全Layerが開始した時点で即座に戻ります。
+
+        Args:
+            timeout: 全Layer合計の最大待機時間（秒）
+
+        Returns:
+            bool: True=全Layer開始済み、False=タイムアウト
+        """
+        deadline = time.monotonic() + timeout
+
+        for monitor in (self.layer1, self.layer2, self.layer3):
+            if monitor is None:
+                continue
+            if not monitor.wait_until_started(max(0.0, deadline - time.monotonic())):
+                return False
+
+        return True
+
     def stop_all(self):
         """
         全モニターを停止
@@ -14,6 +14,7 @@
 1. エントリー条件の検証（価格ゾーン、インジケーター、時間フィルター）
 2. 決済条件の検証（TP、SL、インジケーター決済、時間制約）
 3. リスク管理パラメータの適用
+4. エントリー条件の一括検証（DataFrameの全行をベクトル演算で判定）
 
 【使用例】
 ```python
@@ -25,6 +26,9 @@ market_data = get_current_market_data()
 
 if engine.check_entry_conditions(market_data, rule):
     execute_trade()
+
+# バックテスト等で多数の足をまとめて判定
+mask = engine.check_entry_conditions_batch(market_df, rule)
 ```
 
 【作成日】2025-01-15
@@ -32,8 +36,27 @@ if engine.check_entry_conditions(market_data, rule):
 
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, time
+from functools import lru_cache
 import logging
 
+import numpy as np
+import pandas as pd
+
+
+@lru_cache(maxsize=2048)
+def _parse_minutes(value: str) -> int:
+    """
+    'HH:MM'形式の時刻を0時からの経過分に変換
+
+    ルールの時刻指定や現在時刻は同じ文字列が繰り返し渡されるため、
+    解析結果をキャッシュしてティックごとのstrptimeを省略します。
+
+    Raises:
+        TypeError, ValueError: 'HH:MM'形式でない場合
+    """
+    parsed = datetime.strptime(value, "%H:%M")
+    return parsed.hour * 60 + parsed.minute
+
 
 class StructuredRuleEngine:
     """
@@ -250,9 +273,9 @@ class StructuredRuleEngine:
     ) -> bool:
         """現在時刻が指定範囲内かチェック"""
         try:
-            current = datetime.strptime(current_time, "%H:%M").time()
-            start = datetime.strptime(start_time, "%H:%M").time()
-            end = datetime.strptime(end_time, "%H:%M").time()
+            current = _parse_minutes(current_time)
+            start = _parse_minutes(start_time)
+            end = _parse_minutes(end_time)
 
             if start <= end:
                 return start <= current <= end
@@ -263,6 +286,142 @@ class StructuredRuleEngine:
             self.logger.error(f"Time parsing error: {e}")
             return False
 
+    def check_entry_conditions_batch(
+        self,
+        market_df: pd.DataFrame,
+        rule: Dict
+    ) -> np.ndarray:
+        """
+        エントリー条件を複数の市場データに対して一括チェック
+
+        check_entry_conditions()と同じ判定を、1行=1時点のDataFrameに対して
+        列単位の比較演算で行います。ルールの値は最初に一度だけ取り出します。
+        時間足ごとの値は「{時間足}_{キー}」形式の列名で参照します。
+
+        Args:
+            market_df: 市場データ（1行=1時点）
+                列: current_price, spread, current_time ('HH:MM'),
+                    M15_rsi, M15_ema_20, M15_macd_histogram, M15_prev_close, ...
+            rule: 構造化トレードルール
+
+        Returns:
+            np.ndarray: 行ごとのエントリー可否（bool配列）
+        """
+        n = len(market_df)
+        entry_cond = rule.get('entry_conditions', {})
+
+        # 1. should_tradeチェック
+        if not entry_cond.get('should_trade', False) or 'current_price' not in market_df:
+            return np.zeros(n, dtype=bool)
+
+        def column(name: str) -> np.ndarray:
+            """列をfloat配列で取得（列がない場合はすべてNaN）"""
+            if name not in market_df:
+                return np.full(n, np.nan)
+            return market_df[name].to_numpy(dtype=float)
+
+        # 2. 価格ゾーンチェック（NaNとの比較はFalseになるため価格なしは不可）
+        current_price = column('current_price')
+        mask = ~np.isnan(current_price)
+
+        price_zone = entry_cond.get('price_zone', {})
+        min_price = price_zone.get('min')
+        max_price = price_zone.get('max')
+        if min_price and max_price:
+            mask &= (current_price >= min_price) & (current_price <= max_price)
+
+        # 3. スプレッドチェック（スプレッドがない行はチェックしない）
+        max_spread = entry_cond.get('spread', {}).get('max_pips')
+        if max_spread:
+            spread = column('spread')
+            mask &= np.isnan(spread) | (spread <= max_spread)
+
+        # 4. インジケーターチェック
+        indicators = entry_cond.get('indicators', {})
+
+        # RSIチェック
+        if 'rsi' in indicators:
+            rsi_rule = indicators['rsi']
+            rsi = column(f"{rsi_rule.get('timeframe', 'M15')}_rsi")
+            mask &= ~np.isnan(rsi)
+            if rsi_rule.get('min') is not None:
+                mask &= rsi >= rsi_rule['min']
+            if rsi_rule.get('max') is not None:
+                mask &= rsi <= rsi_rule['max']
+
+        # EMAチェック
+        if 'ema' in indicators:
+            ema_rule = indicators['ema']
+            timeframe = ema_rule.get('timeframe', 'M15')
+            condition = ema_rule.get('condition')
+            ema = column(f"{timeframe}_ema_{ema_rule.get('period')}")
+            mask &= ~np.isnan(ema)
+
+            if condition == 'price_above':
+                mask &= current_price > ema
+            elif condition == 'price_below':
+                mask &= current_price < ema
+            elif condition == 'cross_above':
+                prev_close = column(f"{timeframe}_prev_close")
+                mask &= (prev_close <= ema) & (ema < current_price)
+            elif condition == 'cross_below':
+                prev_close = column(f"{timeframe}_prev_close")
+                mask &= (prev_close >= ema) & (ema > current_price)
+
+        # MACDチェック
+        if 'macd' in indicators:
+            macd_rule = indicators['macd']
+            timeframe = macd_rule.get('timeframe', 'M15')
+            condition = macd_rule.get('condition')
+
+            if condition == 'histogram_positive':
+                mask &= column(f"{timeframe}_macd_histogram") > 0
+            elif condition == 'histogram_negative':
+                mask &= column(f"{timeframe}_macd_histogram") < 0
+            elif condition in ('signal_cross_above', 'signal_cross_below'):
+                macd_line = column(f"{timeframe}_macd_line")
+                signal_line = column(f"{timeframe}_macd_signal")
+                prev_macd = column(f"{timeframe}_prev_macd_line")
+                prev_signal = column(f"{timeframe}_prev_macd_signal")
+                if condition == 'signal_cross_above':
+                    mask &= (prev_macd <= prev_signal) & (macd_line > signal_line)
+                else:
+                    mask &= (prev_macd >= prev_signal) & (macd_line < signal_line)
+
+        # 5. 時間フィルターチェック（時刻は0時からの経過分で比較）
+        avoid_times = entry_cond.get('time_filter', {}).get('avoid_times', [])
+        if avoid_times and 'current_time' in market_df:
+            # 時刻の種類は最大1440通りのため、ユニークな値だけを解析して展開
+            codes, uniques = pd.factorize(market_df['current_time'])
+            unique_minutes = np.array(
+                [self._to_minutes(value) for value in uniques] + [np.nan]
+            )
+            minutes = unique_minutes[codes]  # 欠損値（codes=-1）は末尾のNaN
+
+            for avoid in avoid_times:
+                try:
+                    start_min = _parse_minutes(avoid['start'])
+                    end_min = _parse_minutes(avoid['end'])
+                except Exception as e:
+                    self.logger.error(f"Time parsing error: {e}")
+                    continue
+
+                if start_min <= end_min:
+                    in_range = (minutes >= start_min) & (minutes <= end_min)
+                else:
+                    # 日付をまたぐ場合（例: 23:00-01:00）
+                    in_range = (minutes >= start_min) | (minutes <= end_min)
+                mask &= ~in_range
+
+        return mask
+
+    def _to_minutes(self, value) -> float:
+        """'HH:MM'形式の時刻を0時からの経過分に変換（解析できない場合はNaN）"""
+        try:
+            return _parse_minutes(value)
+        except (TypeError, ValueError):
+            return np.nan
+
     def check_exit_conditions(
         self,
         position: Dict,
@@ -346,11 +505,18 @@ class StructuredRuleEngine:
 
         if force_close_time:
             current_time = market_data.get('current_time')
-            if current_time and current_time >= force_close_time:
+            if current_time and self._is_at_or_after(current_time, force_close_time):
                 return True, f"Force close time: {current_time}", "close_all"
 
         return False, "No exit conditions met", "none"
 
+    def _is_at_or_after(self, current_time: str, target_time: str) -> bool:
+        """現在時刻が指定時刻以降かチェック（'HH:MM'形式でない場合は文字列で比較）"""
+        try:
+            return _parse_minutes(current_time) >= _parse_minutes(target_time)
+        except (TypeError, ValueError):
+            return current_time >= target_time
+
     def _check_indicator_exit(
         self,
         market_data: Dict,
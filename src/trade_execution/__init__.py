@@ -30,10 +30,12 @@ result = manager.process_ai_judgment(ai_judgment)
 
 if result['success']:
     print(f"Trade executed: {result['ticket']}")
+
+manager.close()  # トレード記録を書き込んでから資源を解放
 ```
 """
 
-from src.trade_execution.mt5_executor import MT5Executor
+from src.trade_execution.mt5_executor import MT5Executor, Position
 from src.trade_execution.position_manager import PositionManager
 
-__all__ = ['MT5Executor', 'PositionManager']
+__all__ = ['MT5Executor', 'Position', 'PositionManager']
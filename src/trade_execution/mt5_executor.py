@@ -40,12 +40,20 @@ ticket = executor.execute_trade(
 """
 
 import MetaTrader5 as mt5
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import os
 import logging
+from collections import namedtuple
 from datetime import datetime
 
 
+# MT5ポジション（get_positions() の戻り値の要素）
+# 辞書が必要な場合は Position._asdict() を使用する
+Position = namedtuple(
+    'Position',
+    'ticket symbol type volume open_price current_price sl tp profit open_time magic'
+)
+
 class MT5Executor:
     """
     MT5でトレードを実行するクラス
@@ -60,6 +68,9 @@ class MT5Executor:
     # 注文デビエーション（価格のずれ許容範囲、ポイント）
     DEVIATION = 10
 
+    # MT5認証情報のキャッシュ（login, password, server）
+    _credentials: Optional[Tuple[str, str, str]] = None
+
     def __init__(self, auto_login: bool = True):
         """
         MT5Executorの初期化
@@ -71,6 +82,12 @@ class MT5Executor:
         self.is_initialized = False
         self.is_logged_in = False
 
+        # シンボル別Filling Modeのキャッシュ（ブローカー設定はほぼ固定のため）
+        self._filling_mode_cache: Dict[str, int] = {}
+
+        # シンボル情報のキャッシュ（point等の静的な値の参照用）
+        self._symbol_info_cache: Dict[str, object] = {}
+
         if auto_login:
             try:
                 self.initialize_mt5()
@@ -86,6 +103,12 @@ class MT5Executor:
             True: 初期化成功
             False: 初期化失敗
         """
+        # 起動チェック等で初期化済みの場合は再初期化しない
+        if mt5.terminal_info() is not None:
+            self.is_initialized = True
+            self.logger.info("MT5 already initialized, reusing session")
+            return True
+
         if not mt5.initialize():
             error = mt5.last_error()
             self.logger.error(f"MT5 initialization failed: {error}")
@@ -111,21 +134,18 @@ class MT5Executor:
         if not self.is_initialized:
             self.initialize_mt5()
 
-        # 環境変数から取得
-        login_str = os.getenv('MT5_LOGIN')
-        password = os.getenv('MT5_PASSWORD')
-        server = os.getenv('MT5_SERVER')
+        # 環境変数から取得（再接続時はキャッシュを利用）
+        login_str, password, server = self._get_credentials()
 
-        if not all([login_str, password, server]):
+        if not (login_str and password and server):
             raise ValueError(
                 "MT5 credentials not set. "
                 "Please set MT5_LOGIN, MT5_PASSWORD, MT5_SERVER in .env file"
             )
 
-        try:
-            login = int(login_str)
-        except ValueError:
+        if not login_str.strip().isdecimal():
             raise ValueError(f"MT5_LOGIN must be a number, got: {login_str}")
+        login = int(login_str)
 
         # ログイン実行
         authorized = mt5.login(login, password, server)
@@ -139,6 +159,29 @@ class MT5Executor:
         self.logger.info(f"MT5 login successful: account={login}, server={server}")
         return True
 
+    @classmethod
+    def _get_credentials(cls) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        MT5認証情報を環境変数から取得
+
+        全て揃っている場合のみクラス単位でキャッシュし、
+        以降のログイン・再接続では環境変数を読み直しません。
+
+        Returns:
+            (MT5_LOGIN, MT5_PASSWORD, MT5_SERVER)
+        """
+        if cls._credentials is not None:
+            return cls._credentials
+
+        credentials = (
+            os.getenv('MT5_LOGIN'),
+            os.getenv('MT5_PASSWORD'),
+            os.getenv('MT5_SERVER')
+        )
+        if all(credentials):
+            cls._credentials = credentials
+        return credentials
+
     def execute_trade(self,
                      symbol: str,
                      action: str,
@@ -167,19 +210,20 @@ class MT5Executor:
 
         # アクション検証
         if action not in ['BUY', 'SELL']:
-            self.logger.error(f"Invalid action: {action}")
+            self.logger.error("Invalid action: %s", action)
             return None
 
         # シンボル情報を取得
         symbol_info = mt5.symbol_info(symbol)
         if symbol_info is None:
-            self.logger.error(f"Symbol {symbol} not found")
+            self.logger.error("Symbol %s not found", symbol)
             return None
+        self._symbol_info_cache[symbol] = symbol_info
 
         # シンボルが表示されていない場合は表示する
         if not symbol_info.visible:
             if not mt5.symbol_select(symbol, True):
-                self.logger.error(f"Failed to select {symbol}")
+                self.logger.error("Failed to select %s", symbol)
                 return None
 
         # 注文タイプを決定
@@ -188,7 +232,7 @@ class MT5Executor:
         # 現在価格を取得
         tick = mt5.symbol_info_tick(symbol)
         if tick is None:
-            self.logger.error(f"Failed to get tick for {symbol}")
+            self.logger.error("Failed to get tick for %s", symbol)
             return None
 
         price = tick.ask if action == 'BUY' else tick.bid
@@ -209,36 +253,35 @@ class MT5Executor:
         min_stop_distance = stops_level * point
 
         # SL/TPが指定されている場合、最小距離を確認
-        if sl and sl > 0:
-            sl_distance = abs(price - sl)
-            if min_stop_distance > 0 and sl_distance < min_stop_distance:
+        if min_stop_distance > 0 and (sl or tp):
+            # 売買方向の符号（BUY: SLは下・TPは上 / SELL: SLは上・TPは下）
+            direction = -1.0 if action == 'BUY' else 1.0
+            offset = direction * min_stop_distance
+
+            if sl and sl > 0 and abs(price - sl) < min_stop_distance:
                 # 最小距離を満たさない場合はSLを調整
-                if action == 'BUY':
-                    sl = price - min_stop_distance
-                else:
-                    sl = price + min_stop_distance
+                sl = price + offset
                 self.logger.warning(
-                    f"SL adjusted to meet minimum stop level: {sl:.5f} "
-                    f"(min distance: {min_stop_distance:.5f})"
+                    "SL adjusted to meet minimum stop level: %.5f "
+                    "(min distance: %.5f)",
+                    sl, min_stop_distance
                 )
 
-        if tp and tp > 0:
-            tp_distance = abs(price - tp)
-            if min_stop_distance > 0 and tp_distance < min_stop_distance:
+            if tp and tp > 0 and abs(price - tp) < min_stop_distance:
                 # 最小距離を満たさない場合はTPを調整
-                if action == 'BUY':
-                    tp = price + min_stop_distance
-                else:
-                    tp = price - min_stop_distance
+                tp = price - offset
                 self.logger.warning(
-                    f"TP adjusted to meet minimum stop level: {tp:.5f} "
-                    f"(min distance: {min_stop_distance:.5f})"
+                    "TP adjusted to meet minimum stop level: %.5f "
+                    "(min distance: %.5f)",
+                    tp, min_stop_distance
                 )
 
         # Filling Modeを決定（ブローカーによって対応が異なる）
-        print(f"\n[DEBUG] Calling _get_filling_mode for {symbol}...")
-        filling_type = self._get_filling_mode(symbol_info)
-        print(f"[DEBUG] Selected filling_type: {filling_type}")
+        filling_type = self._filling_mode_cache.get(symbol)
+        if filling_type is None:
+            filling_type = self._get_filling_mode(symbol_info)
+            self._filling_mode_cache[symbol] = filling_type
+        self.logger.debug("Selected filling_type for %s: %s", symbol, filling_type)
 
         # 注文リクエストを作成
         request = {
@@ -258,8 +301,8 @@ class MT5Executor:
 
         # 注文を送信
         self.logger.info(
-            f"Sending order: {action} {volume} {symbol} @ {price} "
-            f"(SL={sl}, TP={tp})"
+            "Sending order: %s %s %s @ %s (SL=%s, TP=%s)",
+            action, volume, symbol, price, sl, tp
         )
 
         result = mt5.order_send(request)
@@ -271,25 +314,26 @@ class MT5Executor:
         # 結果を確認
         if result.retcode == mt5.TRADE_RETCODE_DONE:
             self.logger.info(
-                f"Trade executed successfully: "
-                f"ticket={result.order}, {action} {volume} {symbol} @ {result.price}"
+                "Trade executed successfully: ticket=%s, %s %s %s @ %s",
+                result.order, action, volume, symbol, result.price
             )
             return result.order
         else:
             # エラー詳細をログ
-            error_msg = f"Trade failed: retcode={result.retcode}, comment={result.comment}"
+            parts = [f"Trade failed: retcode={result.retcode}, comment={result.comment}"]
 
             # エラーコード10016（Invalid stops）の場合は詳細情報を追加
             if result.retcode == 10016:
-                error_msg += (
-                    f"\n  Stop level error details:"
-                    f"\n    Current price: {price:.5f}"
-                    f"\n    SL: {sl:.5f}" if sl else ""
-                    f"\n    TP: {tp:.5f}" if tp else ""
-                    f"\n    Min stop distance: {min_stop_distance:.5f}"
-                    f"\n    Stops level (points): {stops_level}"
-                )
-
+                parts.append("  Stop level error details:")
+                parts.append(f"    Current price: {price:.5f}")
+                if sl:
+                    parts.append(f"    SL: {sl:.5f}")
+                if tp:
+                    parts.append(f"    TP: {tp:.5f}")
+                parts.append(f"    Min stop distance: {min_stop_distance:.5f}")
+                parts.append(f"    Stops level (points): {stops_level}")
+
+            error_msg = "\n".join(parts)
             self.logger.error(error_msg)
             return None
 
@@ -309,13 +353,11 @@ class MT5Executor:
             return False
 
         # ポジション情報を取得
-        position = mt5.positions_get(ticket=ticket)
-        if position is None or len(position) == 0:
-            self.logger.error(f"Position {ticket} not found")
+        position = self._position_by_ticket(ticket)
+        if position is None:
+            self.logger.error("Position %s not found", ticket)
             return False
 
-        position = position[0]
-
         # 反対売買のタイプを決定
         order_type = mt5.ORDER_TYPE_SELL if position.type == mt5.ORDER_TYPE_BUY \
                      else mt5.ORDER_TYPE_BUY
@@ -323,7 +365,7 @@ class MT5Executor:
         # 現在価格を取得
         tick = mt5.symbol_info_tick(position.symbol)
         if tick is None:
-            self.logger.error(f"Failed to get tick for {position.symbol}")
+            self.logger.error("Failed to get tick for %s", position.symbol)
             return False
 
         price = tick.bid if position.type == mt5.ORDER_TYPE_BUY else tick.ask
@@ -344,7 +386,7 @@ class MT5Executor:
         }
 
         # 決済を実行
-        self.logger.info(f"Closing position: ticket={ticket}")
+        self.logger.info("Closing position: ticket=%s", ticket)
         result = mt5.order_send(request)
 
         if result is None:
@@ -352,16 +394,33 @@ class MT5Executor:
             return False
 
         if result.retcode == mt5.TRADE_RETCODE_DONE:
-            self.logger.info(f"Position closed successfully: ticket={ticket}")
+            self.logger.info("Position closed successfully: ticket=%s", ticket)
             return True
         else:
             self.logger.error(
-                f"Close failed: retcode={result.retcode}, "
-                f"comment={result.comment}"
+                "Close failed: retcode=%s, comment=%s",
+                result.retcode, result.comment
             )
             return False
 
-    def get_positions(self, symbol: Optional[str] = None) -> List[Dict]:
+    def _position_by_ticket(self, ticket: int):
+        """
+        ticket番号でポジションを1件取得
+
+        MT5のticket指定検索を使い、最初に一致したポジションを返します。
+
+        Args:
+            ticket: ポジションのticket番号
+
+        Returns:
+            ポジション（TradePosition）、見つからない場合はNone
+        """
+        positions = mt5.positions_get(ticket=ticket)
+        if not positions:
+            return None
+        return positions[0]
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Position]:
         """
         現在のポジションを取得
 
@@ -369,7 +428,7 @@ class MT5Executor:
             symbol: 通貨ペア（Noneの場合は全て）
 
         Returns:
-            ポジションリスト
+            ポジションリスト（Position）
         """
         if not self.is_logged_in:
             self.logger.error("Not logged in to MT5")
@@ -383,23 +442,51 @@ class MT5Executor:
         if positions is None:
             return []
 
-        position_list = []
-        for pos in positions:
-            position_list.append({
-                'ticket': pos.ticket,
-                'symbol': pos.symbol,
-                'type': 'BUY' if pos.type == mt5.ORDER_TYPE_BUY else 'SELL',
-                'volume': pos.volume,
-                'open_price': pos.price_open,
-                'current_price': pos.price_current,
-                'sl': pos.sl,
-                'tp': pos.tp,
-                'profit': pos.profit,
-                'open_time': datetime.fromtimestamp(pos.time),
-                'magic': pos.magic
-            })
-
-        return position_list
+        order_type_buy = mt5.ORDER_TYPE_BUY
+        return [
+            Position(
+                pos.ticket,
+                pos.symbol,
+                'BUY' if pos.type == order_type_buy else 'SELL',
+                pos.volume,
+                pos.price_open,
+                pos.price_current,
+                pos.sl,
+                pos.tp,
+                pos.profit,
+                datetime.fromtimestamp(pos.time),
+                pos.magic
+            )
+            for pos in positions
+        ]
+
+    def get_positions_count(self, symbol: Optional[str] = None,
+                            magic: Optional[int] = None) -> int:
+        """
+        現在のポジション数を取得
+
+        ポジション辞書を組み立てずに件数だけを数えます。
+
+        Args:
+            symbol: 通貨ペア（Noneの場合は全て）
+            magic: Magic Number（Noneの場合はこのシステムのMAGIC_NUMBER）
+
+        Returns:
+            ポジション数
+        """
+        if not self.is_logged_in:
+            self.logger.error("Not logged in to MT5")
+            return 0
+
+        if magic is None:
+            magic = self.MAGIC_NUMBER
+
+        if symbol:
+            positions = mt5.positions_get(symbol=symbol)
+        else:
+            positions = mt5.positions_get()
+
+        return sum(1 for pos in positions or () if pos.magic == magic)
 
     def get_spread(self, symbol: str) -> Optional[float]:
         """
@@ -411,23 +498,46 @@ class MT5Executor:
         Returns:
             スプレッド（pips）、エラー時はNone
         """
+        symbol_info = self._get_cached_symbol_info(symbol)
+        if symbol_info is None:
+            return None
+
         tick = mt5.symbol_info_tick(symbol)
         if tick is None:
             return None
 
         # スプレッド = (Ask - Bid) / Point
-        symbol_info = mt5.symbol_info(symbol)
-        if symbol_info is None:
-            return None
-
         spread_pips = (tick.ask - tick.bid) / symbol_info.point / 10
 
         return spread_pips
 
+    def _get_cached_symbol_info(self, symbol: str):
+        """
+        キャッシュ済みのシンボル情報を取得
+
+        point・ロット単位などの静的な値を参照する用途向けです。
+        未取得の場合のみMT5に問い合わせます。
+
+        Args:
+            symbol: 通貨ペア
+
+        Returns:
+            シンボル情報、取得できない場合はNone
+        """
+        symbol_info = self._symbol_info_cache.get(symbol)
+        if symbol_info is None:
+            symbol_info = mt5.symbol_info(symbol)
+            if symbol_info is not None:
+                self._symbol_info_cache[symbol] = symbol_info
+        return symbol_info
+
     def _get_filling_mode(self, symbol_info) -> int:
         """
         シンボルに適したFilling Modeを取得
 
+        Filling Modeはシンボルごとにほぼ固定のため、
+        呼び出し側で結果をキャッシュし、ログ出力は初回解決時のみ行われます。
+
         Args:
             symbol_info: シンボル情報
 
@@ -437,12 +547,6 @@ class MT5Executor:
         # シンボルがサポートするFilling Modeを確認
         filling_mode = symbol_info.filling_mode
 
-        # デバッグ出力（確実に表示）
-        print(f"  Filling mode flags: {filling_mode}")
-        print(f"    FOK (2) supported: {bool(filling_mode & 2)}")
-        print(f"    IOC (1) supported: {bool(filling_mode & 1)}")
-        print(f"    RETURN (4) supported: {bool(filling_mode & 4)}")
-
         # デバッグログ
         self.logger.info(f"Symbol filling_mode flags: {filling_mode}")
         self.logger.info(f"  FOK supported: {bool(filling_mode & 2)}")
@@ -452,24 +556,20 @@ class MT5Executor:
         # 優先順位: RETURN > FOK > IOC
         # RETURN (Return) - 最も一般的、OANDAなどで推奨
         if filling_mode & 4:  # ORDER_FILLING_RETURN
-            print(f"  → Selected: ORDER_FILLING_RETURN (value=0)")
             self.logger.info("Selected filling mode: ORDER_FILLING_RETURN")
             return 0  # mt5.ORDER_FILLING_RETURN
 
         # FOK (Fill or Kill) - 全量約定または全量キャンセル
         if filling_mode & 2:  # ORDER_FILLING_FOK
-            print(f"  → Selected: ORDER_FILLING_FOK (value=1)")
             self.logger.info("Selected filling mode: ORDER_FILLING_FOK")
             return 1  # mt5.ORDER_FILLING_FOK
 
         # IOC (Immediate or Cancel) - 即時約定可能な分だけ約定
         if filling_mode & 1:  # ORDER_FILLING_IOC
-            print(f"  → Selected: ORDER_FILLING_IOC (value=2)")
             self.logger.info("Selected filling mode: ORDER_FILLING_IOC")
             return 2  # mt5.ORDER_FILLING_IOC
 
         # デフォルトはRETURN（最も互換性が高い）
-        print(f"  → Selected: ORDER_FILLING_RETURN (default, value=0)")
         self.logger.warning("No filling mode detected, using default: ORDER_FILLING_RETURN")
         return 0  # mt5.ORDER_FILLING_RETURN
 
@@ -512,4 +612,4 @@ class MT5Executor:
 
 
 # モジュールのエクスポート
-__all__ = ['MT5Executor']
+__all__ = ['MT5Executor', 'Position']
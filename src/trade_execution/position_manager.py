@@ -25,16 +25,26 @@ from src.trade_execution import PositionManager
 
 manager = PositionManager()
 result = manager.process_ai_judgment(ai_judgment)
+
+# 終了時はキューに残ったトレード記録を書き込んでから資源を解放
+manager.close()
 ```
 
 【作成日】2025-10-22
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Iterator, Tuple
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
+import queue
+import threading
+import time
+import weakref
 from datetime import datetime
 import psycopg2
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import os
 
 from src.rule_engine.trading_rules import TradingRules
@@ -42,6 +52,17 @@ from src.trade_execution.mt5_executor import MT5Executor
 from src.utils.trade_mode import get_trade_mode_config
 
 
+# NUMERIC列をDecimalではなくfloatで受け取るための型変換
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    'DEC2FLOAT',
+    lambda value, cursor: float(value) if value is not None else None
+)
+
+# DB書き込みスレッドへの終了通知（close()がキューに投入する）
+_WRITER_STOP = object()
+
+
 class PositionManager:
     """
     ポジション管理クラス
@@ -49,6 +70,26 @@ class PositionManager:
     AI判断からトレード実行、ポジション管理までを統合的に制御します。
     """
 
+    # DBコネクションプールのサイズ
+    DB_POOL_MIN_CONN = 2
+    DB_POOL_MAX_CONN = 8
+
+    # DB書き込みキューの設定
+    WRITE_QUEUE_SIZE = 1024
+    WRITE_BATCH_SIZE = 64
+
+    # get_open_positions() が返す辞書のキー（SELECT列の順序と一致）
+    OPEN_POSITION_COLUMNS = (
+        'ticket', 'symbol', 'type', 'volume', 'open_price',
+        'sl', 'tp', 'open_time', 'profit'
+    )
+
+    # 口座残高キャッシュの有効期間（秒）
+    BALANCE_CACHE_TTL = 2.0
+
+    # DB接続情報のキャッシュ（環境変数から初回のみ読み込む）
+    _db_env: Optional[Dict] = None
+
     def __init__(self,
                  symbol: str = 'USDJPY',
                  risk_percent: float = 1.0,
@@ -88,24 +129,92 @@ class PositionManager:
 
         # DB接続情報
         self.db_config = {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'port': int(os.getenv('DB_PORT', 5432)),
-            'database': os.getenv('DB_NAME', 'fx_autotrade'),
-            'user': os.getenv('DB_USER', 'postgres'),
-            'password': os.getenv('DB_PASSWORD', ''),
-            'client_encoding': 'UTF8'
+            **self._get_db_env(),
+            'client_encoding': 'UTF8',
+            'application_name': 'fx-ai-autotrade',
+            # プール内の長寿命接続が無通信で切断されないようにTCP keepaliveを有効化
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'keepalives_interval': 5,
+            'keepalives_count': 3,
+            'tcp_user_timeout': 3000
         }
 
+        # DBコネクションプール（初回利用時に生成）
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # 初期化済みの接続（接続が破棄されると自動的に外れる）
+        self._initialized_conns = weakref.WeakSet()
+
+        # トレード記録はキュー経由でバックグラウンドスレッドが書き込む
+        # （daemonスレッドのため、終了前に close() でキューを書き切ること）
+        self._closed = False
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(
+            target=self._db_writer_loop,
+            daemon=True,
+            name="PositionDBWriter"
+        )
+        self._writer_thread.start()
+
+        # 口座残高キャッシュ（取得時刻, 残高）
+        self._balance_cache: Optional[Tuple[float, float]] = None
+
+        # MT5への注文送信専用スレッド（送信順序を保つため1スレッド）
+        self._order_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='mt5-send'
+        )
+
         self.logger.info(
             f"PositionManager initialized: "
             f"symbol={symbol}, risk={risk_percent}%, "
             f"mode={self.mode_config.get_mode().value}, mt5={self.use_mt5}"
         )
 
+    @classmethod
+    def _get_db_env(cls) -> Dict:
+        """
+        DB接続情報を環境変数から取得
+
+        初回のみ環境変数を読み込み、以降はクラス単位のキャッシュを返します。
+
+        Returns:
+            host/port/database/user/passwordの辞書
+        """
+        if cls._db_env is None:
+            cls._db_env = {
+                'host': os.getenv('DB_HOST', 'localhost'),
+                'port': int(os.getenv('DB_PORT', 5432)),
+                'database': os.getenv('DB_NAME', 'fx_autotrade'),
+                'user': os.getenv('DB_USER', 'postgres'),
+                'password': os.getenv('DB_PASSWORD', '')
+            }
+        return cls._db_env
+
     def process_ai_judgment(self, ai_judgment: Dict) -> Dict:
         """
         AI判断を処理してトレードを実行
 
+        process_ai_judgment_async() の完了を待つ同期版です。
+
+        Args:
+            ai_judgment: AI判断結果（process_ai_judgment_async() を参照）
+
+        Returns:
+            実行結果（process_ai_judgment_async() を参照）
+        """
+        return self.process_ai_judgment_async(ai_judgment).result()
+
+    def process_ai_judgment_async(self, ai_judgment: Dict) -> Future:
+        """
+        AI判断を処理してトレードを実行（非同期）
+
+        MT5使用時は、ポジション数の確認からルール検証・注文送信までを
+        注文送信専用スレッド（1スレッド）に投入して即座にFutureを返します。
+        先行する注文の送信完了後にポジション数を確認するため、連続した判断でも
+        最大ポジション数の制限を超えず、MT5への呼び出しも並行しません。
+
         【処理フロー】
         1. ルール検証
         2. スプレッド取得
@@ -126,19 +235,60 @@ class PositionManager:
                 }
 
         Returns:
-            実行結果
+            実行結果を返すFuture
                 {
                     'success': True/False,
                     'ticket': ticket番号 or None,
                     'message': メッセージ,
+                    'open_time': 判断時刻,
                     'validation': ルール検証結果
                 }
         """
+        # 判断時刻（DB記録のopen_timeにも使用）
+        judged_at = datetime.now()
+
         self.logger.info(
-            f"Processing AI judgment: {ai_judgment.get('action')} "
-            f"(confidence: {ai_judgment.get('confidence')}%)"
+            "Processing AI judgment: %s (confidence: %s%%)",
+            ai_judgment.get('action'), ai_judgment.get('confidence')
         )
 
+        # HOLDは注文が発生しないため、MT5/DBへの問い合わせを行わずに返す
+        if ai_judgment.get('action', 'HOLD') == 'HOLD':
+            message = "AI判断がHOLDのため実行不可"
+            return self._completed_future({
+                'success': False,
+                'ticket': None,
+                'message': message,
+                'open_time': judged_at,
+                'validation': {
+                    'passed': False,
+                    'reason': message,
+                    'current_positions': None,
+                    'spread': None
+                }
+            })
+
+        # MT5への問い合わせ・検証・注文送信は注文送信スレッドで順番に実行
+        if self.use_mt5 and self.executor:
+            return self._order_executor.submit(
+                self._process_judgment, ai_judgment, judged_at
+            )
+
+        return self._completed_future(self._process_judgment(ai_judgment, judged_at))
+
+    def _process_judgment(self, ai_judgment: Dict, judged_at: datetime) -> Dict:
+        """
+        ルール検証からトレード実行・DB記録までを行う
+
+        MT5使用時は注文送信スレッドで実行されます。
+
+        Args:
+            ai_judgment: AI判断結果
+            judged_at: 判断時刻
+
+        Returns:
+            実行結果（process_ai_judgment_async() を参照）
+        """
         # 1. 現在のポジション数を取得
         current_positions = self._get_current_positions_count()
 
@@ -158,6 +308,7 @@ class PositionManager:
             'success': False,
             'ticket': None,
             'message': validation_message,
+            'open_time': judged_at,
             'validation': {
                 'passed': is_valid,
                 'reason': validation_message,
@@ -168,7 +319,7 @@ class PositionManager:
 
         # ルール検証失敗
         if not is_valid:
-            self.logger.warning(f"Trade validation failed: {validation_message}")
+            self.logger.warning("Trade validation failed: %s", validation_message)
             self._save_trade_record(ai_judgment, result)
             return result
 
@@ -177,55 +328,124 @@ class PositionManager:
 
         # 5. トレード実行
         if self.use_mt5 and self.executor:
-            ticket = self._execute_trade(ai_judgment, position_size)
-            if ticket:
-                result['success'] = True
-                result['ticket'] = ticket
-                result['message'] = f"Trade executed successfully: ticket={ticket}"
-                self.logger.info(result['message'])
-            else:
-                result['message'] = "Trade execution failed"
-                self.logger.error(result['message'])
-        else:
-            # デモモード
+            return self._execute_and_record(ai_judgment, position_size, result)
+
+        # デモモード
+        result['success'] = True
+        result['ticket'] = 'DEMO'
+        result['message'] = f"Demo mode: Would execute {ai_judgment['action']} {position_size} lots"
+        self.logger.info(result['message'])
+
+        # 6. DB記録
+        self._save_trade_record(ai_judgment, result)
+
+        return result
+
+    def _execute_and_record(self, ai_judgment: Dict, position_size: float, result: Dict) -> Dict:
+        """
+        MT5でトレードを実行し、結果をDB記録に回す
+
+        Args:
+            ai_judgment: AI判断結果
+            position_size: ロット数
+            result: ルール検証済みの実行結果
+
+        Returns:
+            実行結果
+        """
+        ticket = self._execute_trade(ai_judgment, position_size)
+        if ticket:
+            self._invalidate_balance_cache()
             result['success'] = True
-            result['ticket'] = 'DEMO'
-            result['message'] = f"Demo mode: Would execute {ai_judgment['action']} {position_size} lots"
+            result['ticket'] = ticket
+            result['message'] = f"Trade executed successfully: ticket={ticket}"
             self.logger.info(result['message'])
+        else:
+            result['message'] = "Trade execution failed"
+            self.logger.error(result['message'])
 
         # 6. DB記録
         self._save_trade_record(ai_judgment, result)
 
         return result
 
+    @staticmethod
+    def _completed_future(result: Dict) -> Future:
+        """結果が確定済みのFutureを作成"""
+        future: Future = Future()
+        future.set_result(result)
+        return future
+
+    @contextmanager
+    def _conn(self) -> Iterator:
+        """
+        プールからDB接続を借り、処理後にプールへ返却する
+
+        プールは初回呼び出し時に生成されるため、DBを使わない
+        経路では接続が発生しません。
+
+        Yields:
+            psycopg2の接続オブジェクト
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        self.DB_POOL_MIN_CONN,
+                        self.DB_POOL_MAX_CONN,
+                        **self.db_config
+                    )
+
+        conn = self._pool.getconn()
+        try:
+            if conn not in self._initialized_conns:
+                self._init_connection(conn)
+            yield conn
+        finally:
+            # 切断済みの接続はプールに戻さず破棄する
+            self._pool.putconn(conn, close=bool(conn.closed))
+
+    def _init_connection(self, conn) -> None:
+        """
+        プール内の接続を初回利用時に初期化する
+
+        - NUMERIC列をfloatで受け取る型変換を接続単位で登録
+        - 頻繁に実行するSQLをPREPAREし、以降はEXECUTEで呼び出すことで
+          毎回のSQLパース・プラン作成を省略
+
+        Args:
+            conn: psycopg2の接続オブジェクト
+        """
+        psycopg2.extensions.register_type(DEC2FLOAT, conn)
+
+        table_name = self.table_names['positions']
+
+        with conn.cursor() as cursor:
+            cursor.execute(f"""
+                PREPARE count_open_positions AS
+                SELECT COUNT(*)
+                FROM {table_name}
+                WHERE symbol = $1 AND status = 'OPEN'
+            """)
+        conn.commit()
+
+        self._initialized_conns.add(conn)
+
     def _get_current_positions_count(self) -> int:
         """現在のポジション数を取得（モード別テーブル）"""
         if self.use_mt5 and self.executor:
-            positions = self.executor.get_positions(symbol=self.symbol)
-            # Magic Numberでフィルタ
-            ai_positions = [p for p in positions if p['magic'] == MT5Executor.MAGIC_NUMBER]
-            return len(ai_positions)
+            # Magic Numberでフィルタした件数のみ取得
+            return self.executor.get_positions_count(
+                symbol=self.symbol,
+                magic=MT5Executor.MAGIC_NUMBER
+            )
         else:
             # バックテスト/デモモード：DBから取得
             try:
-                conn = psycopg2.connect(**self.db_config)
-                # エンコーディングを明示的に設定
-                conn.set_client_encoding('UTF8')
-                cursor = conn.cursor()
-
-                # モード別のテーブル名を取得
-                table_name = self.table_names['positions']
-
-                query = f"""
-                    SELECT COUNT(*)
-                    FROM {table_name}
-                    WHERE symbol = %s AND status = 'OPEN'
-                """
-                cursor.execute(query, (self.symbol,))
-                count = cursor.fetchone()[0]
-
-                cursor.close()
-                conn.close()
+                # モード別テーブルへのクエリは接続ごとにPREPARE済み
+                with self._conn() as conn, conn.cursor() as cursor:
+                    cursor.execute("EXECUTE count_open_positions (%s)", (self.symbol,))
+                    count = cursor.fetchone()[0]
 
                 return count
             except Exception as e:
@@ -262,15 +482,8 @@ class PositionManager:
         # SLまでのpips数を計算
         stop_loss_pips = abs(entry_price - stop_loss) * 100  # USDJPY想定
 
-        # 口座残高を取得
-        if self.use_mt5 and self.executor:
-            account_info = self.executor.get_account_info()
-            if account_info:
-                balance = account_info['balance']
-            else:
-                balance = 100000  # デフォルト
-        else:
-            balance = 100000  # デモモード
+        # 口座残高を取得（短時間はキャッシュを利用）
+        balance = self._get_account_balance()
 
         # ポジションサイズを計算
         position_size = self.rules.calculate_position_size(
@@ -282,6 +495,36 @@ class PositionManager:
 
         return position_size
 
+    def _get_account_balance(self) -> float:
+        """
+        口座残高を取得
+
+        残高はポジションの決済や約定でしか変わらないため、
+        BALANCE_CACHE_TTL秒の間はMT5に問い合わせずキャッシュを返します。
+
+        Returns:
+            口座残高
+        """
+        if not (self.use_mt5 and self.executor):
+            return 100000  # デモモード
+
+        now = time.monotonic()
+        cached = self._balance_cache
+        if cached is not None and now - cached[0] < self.BALANCE_CACHE_TTL:
+            return cached[1]
+
+        account_info = self.executor.get_account_info()
+        if not account_info:
+            return 100000  # デフォルト
+
+        balance = account_info['balance']
+        self._balance_cache = (now, balance)
+        return balance
+
+    def _invalidate_balance_cache(self):
+        """口座残高キャッシュを破棄（約定・決済後に呼び出す）"""
+        self._balance_cache = None
+
     def _execute_trade(self, ai_judgment: Dict, volume: float) -> Optional[int]:
         """
         MT5でトレードを実行
@@ -301,14 +544,14 @@ class PositionManager:
         tp = ai_judgment.get('take_profit')
 
         # デバッグ: 価格の妥当性チェック
-        print(f"\n[DEBUG] AI judgment prices:")
-        print(f"  Entry: {ai_judgment.get('entry_price')}")
-        print(f"  SL: {sl}")
-        print(f"  TP: {tp}")
+        self.logger.debug(
+            "AI judgment prices: entry=%s, SL=%s, TP=%s",
+            ai_judgment.get('entry_price'), sl, tp
+        )
 
         # 一時的にSL/TPを無効化（テスト用）
         # TODO: 本番では現在価格ベースで再計算する必要がある
-        print(f"[DEBUG] Disabling SL/TP for testing (AI prices are from 2024-09, current is 2025-10)")
+        self.logger.debug("Disabling SL/TP for testing (AI prices are from 2024-09, current is 2025-10)")
         sl = None
         tp = None
 
@@ -325,62 +568,186 @@ class PositionManager:
 
     def _save_trade_record(self, ai_judgment: Dict, result: Dict) -> bool:
         """
-        トレード記録をDBに保存（モード別テーブル）
+        トレード記録をDB書き込みキューに投入（モード別テーブル）
+
+        実際の書き込みはバックグラウンドスレッドが行うため、
+        呼び出し元はDBのコミットを待たずに処理を継続できます。
+        戻り値はキューへの投入結果であり、DBへの保存完了を意味しません。
+        保存完了を待つ場合は flush_trade_records() / close() を呼び出してください。
 
         Args:
             ai_judgment: AI判断
             result: 実行結果
 
         Returns:
-            True: 保存成功, False: 保存失敗
+            True: キュー投入成功（書き込み不要を含む）, False: キュー満杯
         """
+        # positionsテーブルに保存するのは実トレードのみ
+        if not result['success'] or result['ticket'] == 'DEMO':
+            return True
+
+        row = (
+            result['ticket'],
+            self.symbol,
+            ai_judgment['action'],
+            0.01,  # ダミー値（実際はMT5から取得すべき）
+            ai_judgment.get('entry_price', 0),
+            ai_judgment.get('stop_loss'),
+            ai_judgment.get('take_profit'),
+            result['open_time'],
+            'OPEN'
+        )
+
         try:
-            conn = psycopg2.connect(**self.db_config)
-            # エンコーディングを明示的に設定
-            conn.set_client_encoding('UTF8')
-            cursor = conn.cursor()
-
-            # モード別のテーブル名を取得
-            table_name = self.table_names['positions']
-
-            # positionsテーブルに保存
-            if result['success'] and result['ticket'] != 'DEMO':
-                insert_query = f"""
-                    INSERT INTO {table_name}
-                    (ticket, symbol, type, volume, open_price, sl, tp, open_time, status)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
+            self._write_queue.put_nowait(row)
+        except queue.Full:
+            self.logger.error(
+                f"Failed to save trade record: write queue is full "
+                f"(ticket={result['ticket']})"
+            )
+            return False
 
-                cursor.execute(insert_query, (
-                    result['ticket'],
-                    self.symbol,
-                    ai_judgment['action'],
-                    0.01,  # ダミー値（実際はMT5から取得すべき）
-                    ai_judgment.get('entry_price', 0),
-                    ai_judgment.get('stop_loss'),
-                    ai_judgment.get('take_profit'),
-                    datetime.now(),
-                    'OPEN'
-                ))
-
-            conn.commit()
-            cursor.close()
-            conn.close()
-
-            self.logger.info(f"Trade record saved to database ({table_name})")
-            return True
+        return True
+
+    def _db_writer_loop(self):
+        """
+        DB書き込みループ（バックグラウンドスレッド）
+
+        キューから記録を取り出し、最大WRITE_BATCH_SIZE件をまとめて
+        1回の複数行INSERTで書き込みます。
+        終了通知（_WRITER_STOP）を受け取ると、取り出し済みの記録を
+        書き込んでからループを抜けます。
+        """
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._write_queue.get()
+            while True:
+                if item is _WRITER_STOP:
+                    stopping = True
+                    self._write_queue.task_done()
+                    break
+                batch.append(item)
+                if len(batch) >= self.WRITE_BATCH_SIZE:
+                    break
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if not batch:
+                continue
 
-        except Exception as e:
-            # エラーメッセージの安全なデコード
-            error_msg = str(e)
             try:
-                if isinstance(e.args[0] if e.args else '', bytes):
-                    error_msg = e.args[0].decode('utf-8', errors='replace')
-            except:
-                error_msg = repr(e)
-            self.logger.error(f"Failed to save trade record: {error_msg}")
+                self._write_trade_records(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    def _write_trade_records(self, rows: List[tuple]) -> bool:
+        """
+        トレード記録をまとめてDBに保存
+
+        まず全件を1回の複数行INSERTで書き込み、失敗した場合は
+        1行ずつ書き込み直して、不正な行（ticket重複など）以外を保存します。
+
+        Args:
+            rows: positionsテーブルの行タプルのリスト
+
+        Returns:
+            True: 全件保存成功, False: 保存できなかった行あり
+        """
+        # モード別のテーブル名を取得
+        table_name = self.table_names['positions']
+        query = f"""
+            INSERT INTO {table_name}
+            (ticket, symbol, type, volume, open_price, sl, tp, open_time, status)
+            VALUES %s
+        """
+
+        try:
+            with self._conn() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        execute_values(cursor, query, rows, page_size=self.WRITE_BATCH_SIZE)
+                    conn.commit()
+                    self.logger.info(
+                        f"Trade records saved to database ({table_name}): {len(rows)} rows"
+                    )
+                    return True
+                except Exception as e:
+                    conn.rollback()
+                    if len(rows) == 1:
+                        raise
+                    self.logger.warning(
+                        f"Batch insert failed, retrying row by row: {self._error_message(e)}"
+                    )
+
+                # 1行ずつ書き込み、失敗した行のみ破棄する
+                saved = 0
+                for row in rows:
+                    try:
+                        with conn.cursor() as cursor:
+                            execute_values(cursor, query, [row])
+                        conn.commit()
+                        saved += 1
+                    except Exception as e:
+                        conn.rollback()
+                        self.logger.error(
+                            f"Failed to save trade record (ticket={row[0]}): "
+                            f"{self._error_message(e)}"
+                        )
+
+            self.logger.info(
+                f"Trade records saved to database ({table_name}): {saved}/{len(rows)} rows"
+            )
+            return saved == len(rows)
+
+        except Exception as e:
+            self.logger.error(f"Failed to save trade record: {self._error_message(e)}")
             return False
 
+    @staticmethod
+    def _error_message(e: Exception) -> str:
+        """エラーメッセージの安全なデコード"""
+        error_msg = str(e)
+        try:
+            if isinstance(e.args[0] if e.args else '', bytes):
+                error_msg = e.args[0].decode('utf-8', errors='replace')
+        except:
+            error_msg = repr(e)
+        return error_msg
+
+    def flush_trade_records(self):
+        """キューに残っているトレード記録の書き込み完了を待つ"""
+        self._write_queue.join()
+
+    def close(self):
+        """
+        PositionManagerを終了する
+
+        送信中の注文の完了を待ち、キューに残っているトレード記録を
+        書き込んでから、DB書き込みスレッド・注文送信スレッド・
+        コネクションプールを解放します。複数回呼び出しても安全です。
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        # 送信中の注文を完了させる（完了時にトレード記録がキューに投入される）
+        self._order_executor.shutdown(wait=True)
+
+        # 書き込みスレッドに終了を通知し、残りの記録の書き込み完了を待つ
+        self._write_queue.put(_WRITER_STOP)
+        self._writer_thread.join()
+
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
+        self.logger.info("PositionManager closed")
+
     def get_open_positions(self) -> List[Dict]:
         """
         オープンポジションを取得（モード別テーブル）
@@ -389,53 +756,30 @@ class PositionManager:
             ポジションリスト
         """
         if self.use_mt5 and self.executor:
-            return self.executor.get_positions(symbol=self.symbol)
+            positions = self.executor.get_positions(symbol=self.symbol)
+            return [position._asdict() for position in positions]
         else:
             # バックテスト/デモモード：DBから取得
             try:
-                conn = psycopg2.connect(**self.db_config)
-                # エンコーディングを明示的に設定
-                conn.set_client_encoding('UTF8')
-                cursor = conn.cursor()
-
                 # モード別のテーブル名を取得
                 table_name = self.table_names['positions']
 
+                # NUMERIC列は接続に登録した型変換でfloatになる
+                # 0→None等の正規化はSQL側で行う
                 query = f"""
-                    SELECT ticket, symbol, type, volume, open_price, sl, tp, open_time, profit
+                    SELECT ticket, symbol, type, volume, open_price,
+                           NULLIF(sl, 0), NULLIF(tp, 0), open_time,
+                           COALESCE(profit, 0)
                     FROM {table_name}
                     WHERE symbol = %s AND status = 'OPEN'
                     ORDER BY open_time DESC
                 """
-                cursor.execute(query, (self.symbol,))
-                rows = cursor.fetchall()
+                with self._conn() as conn, conn.cursor() as cursor:
+                    cursor.execute(query, (self.symbol,))
+                    rows = cursor.fetchall()
 
-                positions = []
-                for row in rows:
-                    # テキストフィールドの安全なデコード
-                    try:
-                        ticket = row[0] if not isinstance(row[0], bytes) else row[0].decode('utf-8', errors='replace')
-                        symbol = row[1] if not isinstance(row[1], bytes) else row[1].decode('utf-8', errors='replace')
-                        trade_type = row[2] if not isinstance(row[2], bytes) else row[2].decode('utf-8', errors='replace')
-                    except:
-                        ticket = str(row[0])
-                        symbol = str(row[1])
-                        trade_type = str(row[2])
-
-                    positions.append({
-                        'ticket': ticket,
-                        'symbol': symbol,
-                        'type': trade_type,
-                        'volume': float(row[3]),
-                        'open_price': float(row[4]),
-                        'sl': float(row[5]) if row[5] else None,
-                        'tp': float(row[6]) if row[6] else None,
-                        'open_time': row[7],
-                        'profit': float(row[8]) if row[8] else 0.0
-                    })
-
-                cursor.close()
-                conn.close()
+                # client_encoding=UTF8のため、テキスト列は常にstrで返る
+                positions = [dict(zip(self.OPEN_POSITION_COLUMNS, row)) for row in rows]
 
                 return positions
 
@@ -461,7 +805,10 @@ class PositionManager:
             True: 決済成功, False: 決済失敗
         """
         if self.use_mt5 and self.executor:
-            return self.executor.close_position(ticket)
+            closed = self.executor.close_position(ticket)
+            if closed:
+                self._invalidate_balance_cache()
+            return closed
         else:
             self.logger.warning("Demo mode: Cannot close position")
             return False
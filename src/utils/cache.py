@@ -0,0 +1,44 @@
+"""
+========================================
+キャッシュディレクトリモジュール
+========================================
+
+ファイル名: cache.py
+パス: src/utils/cache.py
+
+【概要】
+接続テスト結果やAI応答など、ファイルに保存するキャッシュの
+保存先ディレクトリを一元管理します。
+
+【保存先】
+$XDG_CACHE_HOME/fx-autotrade/<subdir>（未設定時は ~/.cache）
+
+【使用例】
+```python
+from src.utils.cache import cache_dir
+
+path = os.path.join(cache_dir('openai_responses'), f"{key}.json")
+```
+
+【作成日】2025-10-23
+"""
+
+import os
+
+
+def cache_dir(subdir: str = '') -> str:
+    """
+    キャッシュディレクトリのパスを取得（ディレクトリは作成しない）
+
+    Args:
+        subdir: fx-autotrade配下のサブディレクトリ名（省略時はfx-autotrade直下）
+
+    Returns:
+        str: キャッシュディレクトリのパス
+    """
+    cache_home = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'fx-autotrade', subdir)
+
+
+# モジュールのエクスポート
+__all__ = ['cache_dir']
@@ -24,15 +24,18 @@ print(config.rsi_period)  # 14
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
 from dataclasses import dataclass
-from dotenv import load_dotenv
+
+from src.utils.env_loader import ensure_env_loaded, get_env_value
 
 # 環境変数を読み込み（.envファイルの値を強制的に優先）
-load_dotenv(override=True)
+ensure_env_loaded()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """
     システム設定を保持するデータクラス
@@ -143,51 +146,41 @@ class Config:
     debug_mode: bool
 
 
-def _get_env_str(key: str, default: str) -> str:
-    """環境変数を文字列として取得"""
-    value = os.getenv(key, default)
-    if value is None:
-        return default
-    # コメントを除去
-    if '#' in value:
-        value = value.split('#')[0]
-    return value.strip()
+# 真と判定する文字列（小文字）
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _get_env_str(key: str, default: str, env: Mapping[str, str] = os.environ) -> str:
+    """環境変数を文字列として取得（未設定または空の場合はデフォルト値）"""
+    return get_env_value(key, env) or default
 
 
-def _get_env_int(key: str, default: int) -> int:
+def _get_env_int(key: str, default: int, env: Mapping[str, str] = os.environ) -> int:
     """環境変数を整数として取得"""
-    value_str = _get_env_str(key, str(default))
+    value_str = _get_env_str(key, str(default), env)
     try:
         return int(value_str)
     except ValueError:
         return default
 
 
-def _get_env_float(key: str, default: float) -> float:
+def _get_env_float(key: str, default: float, env: Mapping[str, str] = os.environ) -> float:
     """環境変数を浮動小数点数として取得"""
-    value_str = _get_env_str(key, str(default))
+    value_str = _get_env_str(key, str(default), env)
     try:
         return float(value_str)
     except ValueError:
         return default
 
 
-def _get_env_bool(key: str, default: bool) -> bool:
+def _get_env_bool(key: str, default: bool, env: Mapping[str, str] = os.environ) -> bool:
     """環境変数を真偽値として取得"""
-    value_str = _get_env_str(key, str(default)).lower()
-    return value_str in ('true', '1', 'yes', 'on')
+    return _get_env_str(key, str(default), env).lower() in _TRUTHY
 
 
-def _get_env_optional_int(key: str) -> Optional[int]:
+def _get_env_optional_int(key: str, env: Mapping[str, str] = os.environ) -> Optional[int]:
     """環境変数をOptional[int]として取得（未設定の場合はNone）"""
-    value_str = os.getenv(key)
-    if value_str is None or value_str.strip() == '':
-        return None
-    # コメントを除去
-    if '#' in value_str:
-        value_str = value_str.split('#')[0]
-    value_str = value_str.strip()
-    if value_str == '':
+    if (value_str := get_env_value(key, env)) is None:
         return None
     try:
         return int(value_str)
@@ -195,114 +188,134 @@ def _get_env_optional_int(key: str) -> Optional[int]:
         return None
 
 
-def _get_env_optional_str(key: str) -> Optional[str]:
+def _get_env_optional_str(key: str, env: Mapping[str, str] = os.environ) -> Optional[str]:
     """環境変数をOptional[str]として取得（未設定の場合はNone）"""
-    value_str = os.getenv(key)
-    if value_str is None or value_str.strip() == '':
-        return None
-    # コメントを除去
-    if '#' in value_str:
-        value_str = value_str.split('#')[0]
-    value_str = value_str.strip()
-    if value_str == '':
-        return None
-    return value_str
+    return get_env_value(key, env)
+
+
+def _get_env_first_str(keys: Tuple[str, ...], default: str, env: Mapping[str, str] = os.environ) -> str:
+    """複数の環境変数を順に参照し、最初に設定されている値を文字列として取得"""
+    for key in keys:
+        value = get_env_value(key, env)
+        if value:
+            return value
+    return default
+
+
+# 型名 → 取得関数（引数: キー, デフォルト値, 環境変数）
+_PARSERS: Mapping[str, Callable[[Any, Any, Mapping[str, str]], Any]] = MappingProxyType({
+    'str': _get_env_str,
+    'int': _get_env_int,
+    'float': _get_env_float,
+    'bool': _get_env_bool,
+    'first_str': _get_env_first_str,
+    'optional_str': lambda key, default, env: _get_env_optional_str(key, env),
+    'optional_int': lambda key, default, env: _get_env_optional_int(key, env),
+})
+
+# 設定スキーマ: (フィールド名, 環境変数名, 型名, デフォルト値)
+_SCHEMA: Tuple[Tuple[str, Any, str, Any], ...] = (
+    # トレードモード
+    ('trade_mode', 'TRADE_MODE', 'str', 'demo'),
+
+    # バックテスト設定
+    ('backtest_start_date', 'BACKTEST_START_DATE', 'str', '2024-09-01'),
+    ('backtest_end_date', 'BACKTEST_END_DATE', 'str', '2024-09-30'),
+    ('backtest_symbol', 'BACKTEST_SYMBOL', 'str', 'USDJPY'),
+    ('backtest_initial_balance', 'BACKTEST_INITIAL_BALANCE', 'float', 1000000.0),
+    ('backtest_csv_path', 'BACKTEST_CSV_PATH', 'optional_str', None),
+
+    # ルール生成設定
+    ('rule_generation_interval_hours', 'RULE_GENERATION_INTERVAL_HOURS', 'int', 1),
+
+    # LLM API Keys
+    ('gemini_api_key', 'GEMINI_API_KEY', 'str', ''),
+    ('openai_api_key', 'OPENAI_API_KEY', 'str', ''),
+    ('anthropic_api_key', 'ANTHROPIC_API_KEY', 'str', ''),
+
+    # LLM Models（新環境変数、後方互換性あり）
+    # 注: .envファイルで必ず設定してください。デフォルト値は提供しません。
+    ('model_daily_analysis', ('MODEL_DAILY_ANALYSIS', 'GEMINI_MODEL_DAILY_ANALYSIS'), 'first_str', ''),
+    ('model_periodic_update', ('MODEL_PERIODIC_UPDATE', 'GEMINI_MODEL_PERIODIC_UPDATE'), 'first_str', ''),
+    ('model_position_monitor', ('MODEL_POSITION_MONITOR', 'GEMINI_MODEL_POSITION_MONITOR'), 'first_str', ''),
+    ('model_emergency_evaluation', 'MODEL_EMERGENCY_EVALUATION', 'str', ''),
+
+    # 後方互換性のため保持（非推奨）
+    ('gemini_model_daily_analysis', 'GEMINI_MODEL_DAILY_ANALYSIS', 'optional_str', None),
+    ('gemini_model_periodic_update', 'GEMINI_MODEL_PERIODIC_UPDATE', 'optional_str', None),
+    ('gemini_model_position_monitor', 'GEMINI_MODEL_POSITION_MONITOR', 'optional_str', None),
+
+    # AI分析パラメータ
+    ('ai_temperature_daily_analysis', 'AI_TEMPERATURE_DAILY_ANALYSIS', 'float', 0.3),
+    ('ai_temperature_periodic_update', 'AI_TEMPERATURE_PERIODIC_UPDATE', 'float', 0.3),
+    ('ai_temperature_position_monitor', 'AI_TEMPERATURE_POSITION_MONITOR', 'float', 0.2),
+    ('ai_temperature_emergency_evaluation', 'AI_TEMPERATURE_EMERGENCY_EVALUATION', 'float', 0.3),
+    ('ai_max_tokens_daily_analysis', 'AI_MAX_TOKENS_DAILY_ANALYSIS', 'optional_int', None),
+    ('ai_max_tokens_periodic_update', 'AI_MAX_TOKENS_PERIODIC_UPDATE', 'optional_int', None),
+    ('ai_max_tokens_position_monitor', 'AI_MAX_TOKENS_POSITION_MONITOR', 'optional_int', None),
+    ('ai_max_tokens_emergency_evaluation', 'AI_MAX_TOKENS_EMERGENCY_EVALUATION', 'optional_int', None),
+
+    # リスク管理
+    ('position_size_default', 'POSITION_SIZE_DEFAULT', 'float', 0.1),
+    ('max_positions', 'MAX_POSITIONS', 'int', 3),
+    ('risk_per_trade', 'RISK_PER_TRADE', 'float', 2.0),
+    ('default_stop_loss_pips', 'DEFAULT_STOP_LOSS_PIPS', 'float', 50.0),
+    ('default_take_profit_pips', 'DEFAULT_TAKE_PROFIT_PIPS', 'float', 100.0),
+
+    # テクニカル指標
+    ('ema_short_period', 'EMA_SHORT_PERIOD', 'int', 20),
+    ('ema_long_period', 'EMA_LONG_PERIOD', 'int', 50),
+    ('rsi_period', 'RSI_PERIOD', 'int', 14),
+    ('rsi_overbought', 'RSI_OVERBOUGHT', 'int', 70),
+    ('rsi_oversold', 'RSI_OVERSOLD', 'int', 30),
+    ('macd_fast', 'MACD_FAST', 'int', 12),
+    ('macd_slow', 'MACD_SLOW', 'int', 26),
+    ('macd_signal', 'MACD_SIGNAL', 'int', 9),
+    ('atr_period', 'ATR_PERIOD', 'int', 14),
+    ('bollinger_period', 'BOLLINGER_PERIOD', 'int', 20),
+    ('bollinger_std_dev', 'BOLLINGER_STD_DEV', 'float', 2.0),
+    ('support_resistance_window', 'SUPPORT_RESISTANCE_WINDOW', 'int', 20),
+
+    # Layer 3監視
+    ('layer3a_monitor_interval', 'LAYER3A_MONITOR_INTERVAL', 'int', 15),
+    ('anomaly_price_change_threshold', 'ANOMALY_PRICE_CHANGE_THRESHOLD', 'float', 0.5),
+    ('anomaly_spread_multiplier', 'ANOMALY_SPREAD_MULTIPLIER', 'float', 3.0),
+    ('anomaly_volatility_multiplier', 'ANOMALY_VOLATILITY_MULTIPLIER', 'float', 2.0),
+    ('anomaly_drawdown_threshold', 'ANOMALY_DRAWDOWN_THRESHOLD', 'float', 3.0),
+
+    # データベース
+    ('db_host', 'DB_HOST', 'str', 'localhost'),
+    ('db_port', 'DB_PORT', 'int', 5432),
+    ('db_name', 'DB_NAME', 'str', 'fx_autotrade'),
+    ('db_user', 'DB_USER', 'str', 'postgres'),
+    ('db_password', 'DB_PASSWORD', 'str', ''),
+
+    # ロギング
+    ('log_level', 'LOG_LEVEL', 'str', 'INFO'),
+    ('log_file', 'LOG_FILE', 'str', 'logs/fx_autotrade.log'),
+    ('debug_mode', 'DEBUG_MODE', 'bool', False),
+)
 
 
 def load_config() -> Config:
     """
     環境変数から設定を読み込む
 
+    _SCHEMA の定義に従って各フィールドの値を取得します。
+
     Returns:
         Config: 設定オブジェクト
     """
-    return Config(
-        # トレードモード
-        trade_mode=_get_env_str('TRADE_MODE', 'demo'),
-
-        # バックテスト設定
-        backtest_start_date=_get_env_str('BACKTEST_START_DATE', '2024-09-01'),
-        backtest_end_date=_get_env_str('BACKTEST_END_DATE', '2024-09-30'),
-        backtest_symbol=_get_env_str('BACKTEST_SYMBOL', 'USDJPY'),
-        backtest_initial_balance=_get_env_float('BACKTEST_INITIAL_BALANCE', 1000000.0),
-        backtest_csv_path=_get_env_str('BACKTEST_CSV_PATH', '') or None,
-
-        # ルール生成設定
-        rule_generation_interval_hours=_get_env_int('RULE_GENERATION_INTERVAL_HOURS', 1),
-
-        # LLM API Keys
-        gemini_api_key=_get_env_str('GEMINI_API_KEY', ''),
-        openai_api_key=_get_env_str('OPENAI_API_KEY', ''),
-        anthropic_api_key=_get_env_str('ANTHROPIC_API_KEY', ''),
-
-        # LLM Models（新環境変数、後方互換性あり）
-        # 注: .envファイルで必ず設定してください。デフォルト値は提供しません。
-        model_daily_analysis=_get_env_str('MODEL_DAILY_ANALYSIS', '') or _get_env_str('GEMINI_MODEL_DAILY_ANALYSIS', ''),
-        model_periodic_update=_get_env_str('MODEL_PERIODIC_UPDATE', '') or _get_env_str('GEMINI_MODEL_PERIODIC_UPDATE', ''),
-        model_position_monitor=_get_env_str('MODEL_POSITION_MONITOR', '') or _get_env_str('GEMINI_MODEL_POSITION_MONITOR', ''),
-        model_emergency_evaluation=_get_env_str('MODEL_EMERGENCY_EVALUATION', ''),
-
-        # 後方互換性のため保持（非推奨）
-        gemini_model_daily_analysis=_get_env_optional_str('GEMINI_MODEL_DAILY_ANALYSIS'),
-        gemini_model_periodic_update=_get_env_optional_str('GEMINI_MODEL_PERIODIC_UPDATE'),
-        gemini_model_position_monitor=_get_env_optional_str('GEMINI_MODEL_POSITION_MONITOR'),
-
-        # AI分析パラメータ
-        ai_temperature_daily_analysis=_get_env_float('AI_TEMPERATURE_DAILY_ANALYSIS', 0.3),
-        ai_temperature_periodic_update=_get_env_float('AI_TEMPERATURE_PERIODIC_UPDATE', 0.3),
-        ai_temperature_position_monitor=_get_env_float('AI_TEMPERATURE_POSITION_MONITOR', 0.2),
-        ai_temperature_emergency_evaluation=_get_env_float('AI_TEMPERATURE_EMERGENCY_EVALUATION', 0.3),
-        ai_max_tokens_daily_analysis=_get_env_optional_int('AI_MAX_TOKENS_DAILY_ANALYSIS'),
-        ai_max_tokens_periodic_update=_get_env_optional_int('AI_MAX_TOKENS_PERIODIC_UPDATE'),
-        ai_max_tokens_position_monitor=_get_env_optional_int('AI_MAX_TOKENS_POSITION_MONITOR'),
-        ai_max_tokens_emergency_evaluation=_get_env_optional_int('AI_MAX_TOKENS_EMERGENCY_EVALUATION'),
-
-        # リスク管理
-        position_size_default=_get_env_float('POSITION_SIZE_DEFAULT', 0.1),
-        max_positions=_get_env_int('MAX_POSITIONS', 3),
-        risk_per_trade=_get_env_float('RISK_PER_TRADE', 2.0),
-        default_stop_loss_pips=_get_env_float('DEFAULT_STOP_LOSS_PIPS', 50.0),
-        default_take_profit_pips=_get_env_float('DEFAULT_TAKE_PROFIT_PIPS', 100.0),
-
-        # テクニカル指標
-        ema_short_period=_get_env_int('EMA_SHORT_PERIOD', 20),
-        ema_long_period=_get_env_int('EMA_LONG_PERIOD', 50),
-        rsi_period=_get_env_int('RSI_PERIOD', 14),
-        rsi_overbought=_get_env_int('RSI_OVERBOUGHT', 70),
-        rsi_oversold=_get_env_int('RSI_OVERSOLD', 30),
-        macd_fast=_get_env_int('MACD_FAST', 12),
-        macd_slow=_get_env_int('MACD_SLOW', 26),
-        macd_signal=_get_env_int('MACD_SIGNAL', 9),
-        atr_period=_get_env_int('ATR_PERIOD', 14),
-        bollinger_period=_get_env_int('BOLLINGER_PERIOD', 20),
-        bollinger_std_dev=_get_env_float('BOLLINGER_STD_DEV', 2.0),
-        support_resistance_window=_get_env_int('SUPPORT_RESISTANCE_WINDOW', 20),
-
-        # Layer 3監視
-        layer3a_monitor_interval=_get_env_int('LAYER3A_MONITOR_INTERVAL', 15),
-        anomaly_price_change_threshold=_get_env_float('ANOMALY_PRICE_CHANGE_THRESHOLD', 0.5),
-        anomaly_spread_multiplier=_get_env_float('ANOMALY_SPREAD_MULTIPLIER', 3.0),
-        anomaly_volatility_multiplier=_get_env_float('ANOMALY_VOLATILITY_MULTIPLIER', 2.0),
-        anomaly_drawdown_threshold=_get_env_float('ANOMALY_DRAWDOWN_THRESHOLD', 3.0),
-
-        # データベース
-        db_host=_get_env_str('DB_HOST', 'localhost'),
-        db_port=_get_env_int('DB_PORT', 5432),
-        db_name=_get_env_str('DB_NAME', 'fx_autotrade'),
-        db_user=_get_env_str('DB_USER', 'postgres'),
-        db_password=_get_env_str('DB_PASSWORD', ''),
-
-        # ロギング
-        log_level=_get_env_str('LOG_LEVEL', 'INFO'),
-        log_file=_get_env_str('LOG_FILE', 'logs/fx_autotrade.log'),
-        debug_mode=_get_env_bool('DEBUG_MODE', False),
-    )
-
-
-# グローバルインスタンス（シングルトン）
-_config_instance: Optional[Config] = None
+    # 環境変数を一度だけ辞書にコピーし、以降の参照はこの辞書から行う
+    env = dict(os.environ)
+
+    return Config(**{
+        name: _PARSERS[type_name](key, default, env)
+        for name, key, type_name, default in _SCHEMA
+    })
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """
     設定のグローバルインスタンスを取得
@@ -312,12 +325,7 @@ def get_config() -> Config:
     Returns:
         Config: 設定オブジェクト
     """
-    global _config_instance
-
-    if _config_instance is None:
-        _config_instance = load_config()
-
-    return _config_instance
+    return load_config()
 
 
 def reload_config() -> Config:
@@ -329,12 +337,10 @@ def reload_config() -> Config:
     Returns:
         Config: 新しい設定オブジェクト
     """
-    global _config_instance
-
-    load_dotenv(override=True)  # 環境変数を再読み込み
-    _config_instance = load_config()
+    get_config.cache_clear()
+    ensure_env_loaded(force=True)  # 環境変数を再読み込み
 
-    return _config_instance
+    return get_config()
 
 
 # モジュールのエクスポート
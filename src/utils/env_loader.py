@@ -0,0 +1,133 @@
+"""
+========================================
+環境変数読み込みモジュール
+========================================
+
+ファイル名: env_loader.py
+パス: src/utils/env_loader.py
+
+【概要】
+.envファイルの読み込みを一元管理します。
+複数モジュールのimport時に.envが重複して解析されないよう、
+プロセス内で一度だけ読み込みます。
+単純な KEY=value 形式の.envは軽量な独自パーサーで解析し、
+それ以外の構文を含む場合はpython-dotenvにフォールバックします。
+
+【使用例】
+```python
+from src.utils.env_loader import ensure_env_loaded
+
+ensure_env_loaded()             # 初回のみ.envを読み込む
+ensure_env_loaded(force=True)   # .envを強制的に再読み込み
+
+value = get_env_value('TRADE_MODE')  # コメント・空白除去済みの値（未設定/空はNone）
+```
+
+【作成日】2025-10-23
+"""
+
+import os
+import re
+from typing import Dict, Mapping, Optional
+
+# .env読み込み済みフラグ
+_loaded = False
+
+# 値の末尾コメント（空白 + # 以降）
+_INLINE_COMMENT = re.compile(r'\s+#.*$')
+
+
+def _parse_simple_env(text: str) -> Optional[Dict[str, str]]:
+    """
+    単純な KEY=value 形式の.envを解析
+
+    python-dotenvの正規表現パーサーを使わずに行単位で解析します。
+    変数展開・export・エスケープ・複数行の値など、
+    単純な形式で表現できない行が含まれる場合はNoneを返します。
+
+    Args:
+        text: .envファイルの内容
+
+    Returns:
+        Optional[Dict[str, str]]: 解析結果（単純な形式でない場合はNone）
+    """
+    values = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        if not sep or not key or ' ' in key or '$' in value or '\\' in value:
+            return None
+
+        value = value.strip()
+        if value[:1] in ('"', "'"):
+            # クォートされた値（閉じクォート以降はコメントのみ許可）
+            quote = value[0]
+            end = value.find(quote, 1)
+            if end == -1:
+                return None
+            rest = value[end + 1:].strip()
+            if rest and not rest.startswith('#'):
+                return None
+            value = value[1:end]
+        else:
+            value = _INLINE_COMMENT.sub('', value)
+
+        values[key] = value
+    return values
+
+
+def ensure_env_loaded(force: bool = False) -> None:
+    """
+    .envファイルを読み込む（プロセス内で一度だけ）
+
+    .envファイルの値は既存の環境変数より優先されます。
+
+    Args:
+        force: Trueの場合、読み込み済みでも再読み込みする
+    """
+    global _loaded
+
+    if _loaded and not force:
+        return
+
+    # python-dotenvは実際に読み込む時点でimportする（import時のコストを避ける）
+    from dotenv import find_dotenv, load_dotenv
+
+    dotenv_path = find_dotenv()
+    if dotenv_path:
+        with open(dotenv_path, encoding='utf-8') as f:
+            values = _parse_simple_env(f.read())
+
+        if values is None:
+            # 高度な構文を含む場合はpython-dotenvで読み込む
+            load_dotenv(dotenv_path, override=True)
+        else:
+            os.environ.update(values)
+
+    _loaded = True
+
+
+def get_env_value(key: str, env: Mapping[str, str] = os.environ) -> Optional[str]:
+    """
+    環境変数をクリーンアップして取得
+
+    インラインコメント（#以降）と前後の空白を除去します。
+
+    Args:
+        key: 環境変数名
+        env: 参照する環境変数のマッピング（省略時はos.environ）
+
+    Returns:
+        Optional[str]: クリーンアップ後の値（未設定または空の場合はNone）
+    """
+    if not (value := env.get(key)):
+        return None
+    return value.partition('#')[0].strip() or None
+
+
+# モジュールのエクスポート
+__all__ = ['ensure_env_loaded', 'get_env_value']
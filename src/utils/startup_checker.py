@@ -41,12 +41,13 @@ if not is_ok:
 【作成日】2025-10-23
 """
 
+import io
 import os
-import psycopg2
+import sys
+from contextlib import closing
 from typing import Tuple, List
-import MetaTrader5 as mt5
-from datetime import datetime
 
+from src.utils.env_loader import get_env_value
 from src.utils.trade_mode import get_trade_mode_config, TradeMode
 
 
@@ -57,11 +58,31 @@ class StartupChecker:
     モード別に必要な項目をチェックし、問題があれば詳細なエラーを返します。
     """
 
-    def __init__(self):
-        """初期化"""
+    def __init__(self, keep_mt5_open: bool = False):
+        """
+        初期化
+
+        Args:
+            keep_mt5_open: Trueの場合、MT5接続テスト成功後にshutdownせず
+                           セッションを維持する（後続処理で再利用するため）
+        """
         self.mode_config = get_trade_mode_config()
+        self.keep_mt5_open = keep_mt5_open
         self.errors = []
         self.warnings = []
+        # 出力バッファ（check_all終了時にまとめて標準出力へ書き出す）
+        self._output = io.StringIO()
+
+    def _print(self, message: str = "") -> None:
+        """出力バッファへ1行追加"""
+        self._output.write(message)
+        self._output.write("\n")
+
+    def _flush_output(self) -> None:
+        """出力バッファの内容を標準出力へまとめて書き出す"""
+        sys.stdout.write(self._output.getvalue())
+        sys.stdout.flush()
+        self._output = io.StringIO()
 
     def check_all(self) -> Tuple[bool, List[str]]:
         """
@@ -70,13 +91,25 @@ class StartupChecker:
         Returns:
             Tuple[bool, List[str]]: (チェック成功, エラーメッセージリスト)
         """
-        print("=" * 80)
-        print("  システム起動チェック")
-        print("=" * 80)
-        print()
-        print(f"モード: {self.mode_config.get_mode().value.upper()}")
-        print(f"説明: {self.mode_config.get_data_source_description()}")
-        print()
+        try:
+            return self._run_checks()
+        finally:
+            # 途中で例外が発生した場合もそれまでの出力を書き出す
+            self._flush_output()
+
+    def _run_checks(self) -> Tuple[bool, List[str]]:
+        """チェック本体（出力はバッファに蓄積）"""
+        # モードは一度だけ取得して各チェックで使い回す
+        mode = self.mode_config.mode
+        mode_name = mode.value.upper()
+
+        self._print("=" * 80)
+        self._print("  システム起動チェック")
+        self._print("=" * 80)
+        self._print()
+        self._print(f"モード: {mode_name}")
+        self._print(f"説明: {self.mode_config.get_data_source_description()}")
+        self._print()
 
         # 共通チェック
         self._check_environment_variables()
@@ -84,46 +117,42 @@ class StartupChecker:
         self._check_gemini_api_key()
 
         # モード別チェック
-        if self.mode_config.is_backtest():
+        if mode is TradeMode.BACKTEST:
             self._check_backtest_requirements()
-        elif self.mode_config.is_demo() or self.mode_config.is_live():
-            self._check_mt5_requirements()
+        elif mode is TradeMode.DEMO or mode is TradeMode.LIVE:
+            self._check_mt5_requirements(mode_name)
 
         # 結果表示
-        print("-" * 80)
+        self._print("-" * 80)
         if self.warnings:
-            print("⚠ 警告:")
+            self._print("⚠ 警告:")
             for warning in self.warnings:
-                print(f"  - {warning}")
-            print()
+                self._print(f"  - {warning}")
+            self._print()
 
         if self.errors:
-            print("✗ エラー:")
+            self._print("✗ エラー:")
             for error in self.errors:
-                print(f"  - {error}")
-            print()
-            print("=" * 80)
+                self._print(f"  - {error}")
+            self._print()
+            self._print("=" * 80)
             return False, self.errors
         else:
-            print("✓ すべてのチェックが成功しました")
-            print("=" * 80)
-            print()
+            self._print("✓ すべてのチェックが成功しました")
+            self._print("=" * 80)
+            self._print()
             return True, []
 
     def _check_environment_variables(self):
         """環境変数の基本チェック"""
-        print("[1/6] 環境変数チェック...")
+        self._print("[1/6] 環境変数チェック...")
 
         # TRADE_MODE
-        trade_mode = os.getenv('TRADE_MODE')
+        # 値をクリーンアップして取得（コメント除去、空白除去）
+        trade_mode = get_env_value('TRADE_MODE')
         if not trade_mode:
             self.errors.append("TRADE_MODE が設定されていません")
         else:
-            # 値をクリーンアップ（コメント除去、空白除去）
-            if '#' in trade_mode:
-                trade_mode = trade_mode.split('#')[0]
-            trade_mode = trade_mode.strip()
-
             # 検証
             if trade_mode not in ['backtest', 'demo', 'live']:
                 self.errors.append(
@@ -131,7 +160,7 @@ class StartupChecker:
                     f"(有効な値: backtest, demo, live)"
                 )
             else:
-                print(f"  ✓ TRADE_MODE: {trade_mode}")
+                self._print(f"  ✓ TRADE_MODE: {trade_mode}")
 
         # データベース設定
         db_vars = ['DB_HOST', 'DB_PORT', 'DB_NAME', 'DB_USER']
@@ -140,56 +169,66 @@ class StartupChecker:
                 self.errors.append(f"{var} が設定されていません")
 
         if all(os.getenv(var) for var in db_vars):
-            print(f"  ✓ データベース設定: OK")
+            self._print(f"  ✓ データベース設定: OK")
 
     def _check_database_connection(self):
         """データベース接続チェック"""
-        print("[2/6] データベース接続チェック...")
+        self._print("[2/6] データベース接続チェック...")
+
+        # DBチェック時のみ読み込む
+        import psycopg2
 
         try:
-            conn = psycopg2.connect(
+            with closing(psycopg2.connect(
                 host=os.getenv('DB_HOST', 'localhost'),
                 port=int(os.getenv('DB_PORT', 5432)),
                 database=os.getenv('DB_NAME', 'fx_autotrade'),
                 user=os.getenv('DB_USER', 'postgres'),
                 password=os.getenv('DB_PASSWORD', ''),
                 connect_timeout=5
-            )
-
-            # テーブル存在確認
-            cursor = conn.cursor()
-            table_names = self.mode_config.get_table_names()
-
-            for table_type, table_name in table_names.items():
-                cursor.execute(
-                    "SELECT EXISTS (SELECT FROM information_schema.tables "
-                    "WHERE table_name = %s)",
-                    (table_name,)
-                )
-                exists = cursor.fetchone()[0]
-
-                if not exists:
-                    self.errors.append(
-                        f"テーブル '{table_name}' が存在しません。"
-                        f"database_schema_extended.sql を実行してください。"
-                    )
-                else:
-                    print(f"  ✓ テーブル '{table_name}': 存在")
-
-            cursor.close()
-            conn.close()
-
-            if not any(f"テーブル" in e for e in self.errors):
-                print(f"  ✓ データベース接続: 成功")
+            )) as conn:
+                self._check_tables(conn)
 
         except psycopg2.OperationalError as e:
             self.errors.append(f"データベース接続エラー: {e}")
         except Exception as e:
             self.errors.append(f"データベースチェックエラー: {e}")
 
+    def _check_tables(self, conn):
+        """
+        必要なテーブルの存在確認
+
+        Args:
+            conn: psycopg2接続
+        """
+        table_names = self.mode_config.get_table_names()
+
+        # 必要なテーブルの存在を1クエリでまとめて確認
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_name = ANY(%s)",
+                (list(table_names.values()),)
+            )
+            existing_tables = {row[0] for row in cursor.fetchall()}
+
+        had_table_error = False
+        for table_type, table_name in table_names.items():
+            if table_name not in existing_tables:
+                had_table_error = True
+                self.errors.append(
+                    f"テーブル '{table_name}' が存在しません。"
+                    f"database_schema_extended.sql を実行してください。"
+                )
+            else:
+                self._print(f"  ✓ テーブル '{table_name}': 存在")
+
+        if not had_table_error:
+            self._print(f"  ✓ データベース接続: 成功")
+
     def _check_gemini_api_key(self):
         """Gemini APIキーチェック"""
-        print("[3/6] Gemini APIキーチェック...")
+        self._print("[3/6] Gemini APIキーチェック...")
 
         api_key = os.getenv('GEMINI_API_KEY')
         if not api_key:
@@ -201,51 +240,52 @@ class StartupChecker:
             if len(api_key) < 20:
                 self.warnings.append("GEMINI_API_KEY が短すぎる可能性があります")
             else:
-                print(f"  ✓ GEMINI_API_KEY: 設定済み")
+                self._print(f"  ✓ GEMINI_API_KEY: 設定済み")
 
     def _check_backtest_requirements(self):
         """バックテストモード固有のチェック"""
-        print("[4/6] バックテスト設定チェック...")
+        self._print("[4/6] バックテスト設定チェック...")
 
         # 期間設定チェック
         try:
             start_date, end_date = self.mode_config.get_backtest_period()
             symbol = self.mode_config.get_backtest_symbol()
 
-            print(f"  ✓ バックテスト期間: {start_date.date()} ～ {end_date.date()}")
-            print(f"  ✓ 対象シンボル: {symbol}")
+            self._print(f"  ✓ バックテスト期間: {start_date.date()} ～ {end_date.date()}")
+            self._print(f"  ✓ 対象シンボル: {symbol}")
 
         except ValueError as e:
             self.errors.append(f"バックテスト設定エラー: {e}")
             return
 
         # データファイル存在チェック
-        print("[5/6] データファイルチェック...")
+        self._print("[5/6] データファイルチェック...")
 
         data_dir = f"data/tick_data/{symbol}"
-        if not os.path.exists(data_dir):
+        if not os.path.isdir(data_dir):
             self.errors.append(
                 f"データディレクトリが存在しません: {data_dir}"
             )
             return
 
-        # 必要な月のリストを生成
-        months_needed = []
-        current = start_date.replace(day=1)
-        while current <= end_date:
-            months_needed.append((current.year, current.month))
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # 必要な月のリストを生成（年*12+月の通し番号で列挙）
+        start_index = start_date.year * 12 + start_date.month - 1
+        end_index = end_date.year * 12 + end_date.month - 1
+        months_needed = [
+            (year, month + 1)
+            for year, month in (divmod(i, 12) for i in range(start_index, end_index + 1))
+        ]
+
+        # ディレクトリを1回だけ走査してファイル名を取得
+        with os.scandir(data_dir) as entries:
+            present_files = {entry.name for entry in entries if entry.is_file()}
 
         # 各月のファイル存在確認
         missing_files = []
         for year, month in months_needed:
             filename = f"ticks_{symbol}-oj5k_{year:04d}-{month:02d}.zip"
-            filepath = os.path.join(data_dir, filename)
 
-            if not os.path.exists(filepath):
+            if filename not in present_files:
                 missing_files.append(f"{year}-{month:02d}")
 
         if missing_files:
@@ -254,17 +294,22 @@ class StartupChecker:
                 f"{', '.join(missing_files)}"
             )
         else:
-            print(f"  ✓ データファイル: {len(months_needed)}ヶ月分すべて存在")
+            self._print(f"  ✓ データファイル: {len(months_needed)}ヶ月分すべて存在")
+
+        self._print("[6/6] MT5接続チェック...")
+        self._print(f"  - バックテストモードはMT5不要: スキップ")
 
-        print("[6/6] MT5接続チェック...")
-        print(f"  - バックテストモードはMT5不要: スキップ")
+    def _check_mt5_requirements(self, mode_name: str):
+        """
+        DEMO/本番モード固有のチェック
 
-    def _check_mt5_requirements(self):
-        """DEMO/本番モード固有のチェック"""
-        print("[4/6] データファイルチェック...")
-        print(f"  - {self.mode_config.get_mode().value.upper()}モードはデータファイル不要: スキップ")
+        Args:
+            mode_name: 表示用のモード名（例: DEMO）
+        """
+        self._print("[4/6] データファイルチェック...")
+        self._print(f"  - {mode_name}モードはデータファイル不要: スキップ")
 
-        print("[5/6] MT5設定チェック...")
+        self._print("[5/6] MT5設定チェック...")
 
         # MT5接続情報チェック
         try:
@@ -283,15 +328,18 @@ class StartupChecker:
                 self.errors.append("MT5_SERVER が初期値のままです")
                 return
 
-            print(f"  ✓ MT5ログイン: {credentials['login']}")
-            print(f"  ✓ MT5サーバー: {credentials['server']}")
+            self._print(f"  ✓ MT5ログイン: {credentials['login']}")
+            self._print(f"  ✓ MT5サーバー: {credentials['server']}")
 
         except ValueError as e:
             self.errors.append(f"MT5設定エラー: {e}")
             return
 
         # MT5接続テスト
-        print("[6/6] MT5接続テスト...")
+        self._print("[6/6] MT5接続テスト...")
+
+        # MT5ネイティブライブラリはDEMO/本番モードでのみ読み込む
+        import MetaTrader5 as mt5
 
         # MT5初期化チェック
         if not mt5.initialize():
@@ -302,7 +350,7 @@ class StartupChecker:
             )
             return
 
-        print(f"  ✓ MT5起動: 確認")
+        self._print(f"  ✓ MT5起動: 確認")
 
         # MT5ログインチェック
         try:
@@ -324,12 +372,15 @@ class StartupChecker:
             # 口座情報取得
             account_info = mt5.account_info()
             if account_info:
-                print(f"  ✓ MT5ログイン: 成功")
-                print(f"    口座番号: {account_info.login}")
-                print(f"    残高: {account_info.balance:,.0f} {account_info.currency}")
-                print(f"    サーバー: {account_info.server}")
-
-            mt5.shutdown()
+                self._print(f"  ✓ MT5ログイン: 成功")
+                self._print(f"    口座番号: {account_info.login}")
+                self._print(f"    残高: {account_info.balance:,.0f} {account_info.currency}")
+                self._print(f"    サーバー: {account_info.server}")
+
+            # keep_mt5_open時はshutdownしない
+            # （MT5Executorがterminal_info()で既存セッションを検出して再利用する）
+            if not self.keep_mt5_open:
+                mt5.shutdown()
 
         except Exception as e:
             self.errors.append(f"MT5接続テストエラー: {e}")
@@ -20,12 +20,15 @@
 
 import os
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from datetime import datetime
-from dotenv import load_dotenv
 
-# 環境変数を読み込み
-load_dotenv()
+from src.utils.env_loader import ensure_env_loaded, get_env_value
+
+# 環境変数を読み込み（読み込み済みの場合はスキップ）
+ensure_env_loaded()
 
 
 class TradeMode(Enum):
@@ -35,6 +38,42 @@ class TradeMode(Enum):
     LIVE = "live"
 
 
+# 有効なモード文字列
+_VALID_MODES = frozenset(mode.value for mode in TradeMode)
+
+
+# モード別テーブル名のマッピング（読み取り専用）
+_TABLE_MAPPING: Mapping[TradeMode, Mapping[str, str]] = MappingProxyType({
+    TradeMode.BACKTEST: MappingProxyType({
+        'ai_judgments': 'backtest_ai_judgments',
+        'positions': 'backtest_positions',
+        'reviews': 'backtest_daily_reviews',
+        'strategies': 'backtest_daily_strategies',
+        'periodic_updates': 'backtest_periodic_updates',
+        'layer3a_monitoring': 'backtest_layer3a_monitoring',
+        'layer3b_emergency': 'backtest_layer3b_emergency'
+    }),
+    TradeMode.DEMO: MappingProxyType({
+        'ai_judgments': 'demo_ai_judgments',
+        'positions': 'demo_positions',
+        'reviews': 'demo_daily_reviews',
+        'strategies': 'demo_daily_strategies',
+        'periodic_updates': 'demo_periodic_updates',
+        'layer3a_monitoring': 'demo_layer3a_monitoring',
+        'layer3b_emergency': 'demo_layer3b_emergency'
+    }),
+    TradeMode.LIVE: MappingProxyType({
+        'ai_judgments': 'ai_judgments',
+        'positions': 'positions',
+        'reviews': 'daily_reviews',
+        'strategies': 'daily_strategies',
+        'periodic_updates': 'periodic_updates',
+        'layer3a_monitoring': 'layer3a_monitoring',
+        'layer3b_emergency': 'layer3b_emergency'
+    })
+})
+
+
 class TradeModeConfig:
     """
     トレードモード設定クラス
@@ -44,21 +83,11 @@ class TradeModeConfig:
 
     def __init__(self):
         """初期化"""
-        # 環境変数からモードを取得
-        mode_str = os.getenv('TRADE_MODE', 'demo')
-
-        # 値をクリーンアップ（前後の空白除去、コメント除去、小文字変換）
-        if mode_str:
-            # コメント（#）以降を削除
-            if '#' in mode_str:
-                mode_str = mode_str.split('#')[0]
-            # 前後の空白を除去して小文字に変換
-            mode_str = mode_str.strip().lower()
-        else:
-            mode_str = 'demo'
+        # 環境変数からモードを取得（コメント・空白除去済み、未設定の場合はdemo）
+        mode_str = (get_env_value('TRADE_MODE') or 'demo').lower()
 
         # モードの検証
-        if mode_str not in ['backtest', 'demo', 'live']:
+        if mode_str not in _VALID_MODES:
             raise ValueError(
                 f"Invalid TRADE_MODE: '{mode_str}'. "
                 f"Must be one of: backtest, demo, live"
@@ -66,6 +95,10 @@ class TradeModeConfig:
 
         self.mode = TradeMode(mode_str)
 
+        # 解析済みバックテスト期間のキャッシュ（(開始日文字列, 終了日文字列), 期間）
+        # 環境変数の文字列が変わった場合は再解析する（エラー時はキャッシュしない）
+        self._backtest_period: Optional[Tuple[Tuple[str, str], Tuple[datetime, datetime]]] = None
+
     def get_mode(self) -> TradeMode:
         """
         現在のトレードモードを取得
@@ -87,12 +120,12 @@ class TradeModeConfig:
         """本番モードか判定"""
         return self.mode == TradeMode.LIVE
 
-    def get_table_names(self) -> Dict[str, str]:
+    def get_table_names(self) -> Mapping[str, str]:
         """
         モードに応じたテーブル名を取得
 
         Returns:
-            Dict[str, str]: テーブル名のマッピング
+            Mapping[str, str]: テーブル名のマッピング（読み取り専用）
                 {
                     'ai_judgments': テーブル名,
                     'positions': テーブル名,
@@ -103,37 +136,7 @@ class TradeModeConfig:
                     'layer3b_emergency': テーブル名
                 }
         """
-        table_mapping = {
-            TradeMode.BACKTEST: {
-                'ai_judgments': 'backtest_ai_judgments',
-                'positions': 'backtest_positions',
-                'reviews': 'backtest_daily_reviews',
-                'strategies': 'backtest_daily_strategies',
-                'periodic_updates': 'backtest_periodic_updates',
-                'layer3a_monitoring': 'backtest_layer3a_monitoring',
-                'layer3b_emergency': 'backtest_layer3b_emergency'
-            },
-            TradeMode.DEMO: {
-                'ai_judgments': 'demo_ai_judgments',
-                'positions': 'demo_positions',
-                'reviews': 'demo_daily_reviews',
-                'strategies': 'demo_daily_strategies',
-                'periodic_updates': 'demo_periodic_updates',
-                'layer3a_monitoring': 'demo_layer3a_monitoring',
-                'layer3b_emergency': 'demo_layer3b_emergency'
-            },
-            TradeMode.LIVE: {
-                'ai_judgments': 'ai_judgments',
-                'positions': 'positions',
-                'reviews': 'daily_reviews',
-                'strategies': 'daily_strategies',
-                'periodic_updates': 'periodic_updates',
-                'layer3a_monitoring': 'layer3a_monitoring',
-                'layer3b_emergency': 'layer3b_emergency'
-            }
-        }
-
-        return table_mapping[self.mode]
+        return _TABLE_MAPPING[self.mode]
 
     def get_backtest_period(self) -> Tuple[datetime, datetime]:
         """
@@ -152,6 +155,11 @@ class TradeModeConfig:
         start_date_str = os.getenv('BACKTEST_START_DATE')
         end_date_str = os.getenv('BACKTEST_END_DATE')
 
+        # 環境変数が前回と同じ場合は解析済みの期間を返す
+        cached = self._backtest_period
+        if cached is not None and cached[0] == (start_date_str, end_date_str):
+            return cached[1]
+
         if not start_date_str or not end_date_str:
             raise ValueError(
                 "BACKTEST_START_DATE and BACKTEST_END_DATE must be set in .env "
@@ -169,7 +177,9 @@ class TradeModeConfig:
         if start_date > end_date:
             raise ValueError("BACKTEST_START_DATE must be before or equal to BACKTEST_END_DATE")
 
-        return start_date, end_date
+        period = (start_date, end_date)
+        self._backtest_period = ((start_date_str, end_date_str), period)
+        return period
 
     def get_backtest_symbol(self) -> str:
         """
@@ -181,8 +191,7 @@ class TradeModeConfig:
         if not self.is_backtest():
             raise ValueError("get_backtest_symbol() can only be called in BACKTEST mode")
 
-        symbol = os.getenv('BACKTEST_SYMBOL', 'USDJPY')
-        return symbol
+        return os.getenv('BACKTEST_SYMBOL', 'USDJPY')
 
     def get_mt5_credentials(self) -> Dict[str, str]:
         """
@@ -277,10 +286,7 @@ class TradeModeConfig:
         return self.__str__()
 
 
-# グローバルインスタンス（シングルトンとして使用）
-_config_instance: Optional[TradeModeConfig] = None
-
-
+@lru_cache(maxsize=1)
 def get_trade_mode_config() -> TradeModeConfig:
     """
     トレードモード設定のグローバルインスタンスを取得
@@ -288,17 +294,26 @@ def get_trade_mode_config() -> TradeModeConfig:
     Returns:
         TradeModeConfig: 設定インスタンス
     """
-    global _config_instance
+    return TradeModeConfig()
 
-    if _config_instance is None:
-        _config_instance = TradeModeConfig()
 
-    return _config_instance
+def reload_trade_mode_config() -> TradeModeConfig:
+    """
+    トレードモード設定を再読み込み
+
+    環境変数（TRADE_MODE等）が変更された場合に、新しいインスタンスを生成します。
+
+    Returns:
+        TradeModeConfig: 新しい設定インスタンス
+    """
+    get_trade_mode_config.cache_clear()
+    return get_trade_mode_config()
 
 
 # モジュールのエクスポート
 __all__ = [
     'TradeMode',
     'TradeModeConfig',
-    'get_trade_mode_config'
+    'get_trade_mode_config',
+    'reload_trade_mode_config'
 ]
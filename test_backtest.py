@@ -22,7 +22,13 @@ import sys
 import logging
 from datetime import datetime
 
-from src.backtest.backtest_engine import BacktestEngine
+
+# 総合評価の基準（上から順に判定）: (評価, リターン%以上, 勝率%以上, PF以上)
+RATINGS = (
+    ("優秀", 10, 60, 2.0),
+    ("良好", 5, 50, 1.5),
+    ("普通", 0, 40, 1.0),
+)
 
 
 def setup_logging():
@@ -33,12 +39,28 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
+    # 結果表示用のロガー（タイムスタンプなし、メッセージのみ）
+    banner = logging.getLogger('banner')
+    if not banner.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        banner.addHandler(handler)
+        banner.propagate = False
+
+
+def _emit(lines: list):
+    """複数行をまとめて1回のログ出力で表示（タイムスタンプなし）"""
+    logging.getLogger('banner').info("\n".join(lines))
+
 
 def main():
     """メインテスト処理"""
     setup_logging()
     logger = logging.getLogger(__name__)
 
+    # バックテストエンジンは実行時のみ読み込む（pandas等の読み込みが重いため）
+    from src.backtest.backtest_engine import BacktestEngine
+
     logger.info("=" * 80)
     logger.info("バックテストエンジン テスト開始")
     logger.info("=" * 80)
@@ -62,14 +84,16 @@ def main():
     # Option 3: MT5データ使用（csv_path=Noneにする）
     # csv_path = None
 
-    logger.info("テスト設定:")
-    logger.info(f"  Symbol: {symbol}")
-    logger.info(f"  Period: {start_date} to {end_date}")
-    logger.info(f"  Initial Balance: {initial_balance:,.0f} JPY")
-    logger.info(f"  AI Model: {ai_model}")
-    logger.info(f"  Sampling: {sampling_interval_hours} hours")
-    logger.info(f"  Data Source: {csv_path if csv_path else 'MT5'}")
-    logger.info("")
+    _emit([
+        "テスト設定:",
+        f"  Symbol: {symbol}",
+        f"  Period: {start_date} to {end_date}",
+        f"  Initial Balance: {initial_balance:,.0f} JPY",
+        f"  AI Model: {ai_model}",
+        f"  Sampling: {sampling_interval_hours} hours",
+        f"  Data Source: {csv_path if csv_path else 'MT5'}",
+        "",
+    ])
 
     # バックテストエンジン初期化
     logger.info("バックテストエンジンを初期化中...")
@@ -81,7 +105,8 @@ def main():
         ai_model=ai_model,
         sampling_interval_hours=sampling_interval_hours,
         risk_percent=1.0,
-        csv_path=csv_path  # CSVパス指定（Noneの場合はMT5使用）
+        csv_path=csv_path,  # CSVパス指定（Noneの場合はMT5使用）
+        stream=True  # CSVはチャンク単位で読み込み、期間内のティックのみ保持
     )
     logger.info("")
 
@@ -94,62 +119,61 @@ def main():
 
     # 結果の詳細表示
     if results:
-        logger.info("")
-        logger.info("=" * 80)
-        logger.info("テスト結果")
-        logger.info("=" * 80)
-        logger.info("")
-
-        # 基本情報
-        logger.info("[基本情報]")
-        logger.info(f"  初期残高: {results['initial_balance']:,.0f} JPY")
-        logger.info(f"  最終残高: {results['final_balance']:,.0f} JPY")
-        logger.info(f"  純利益: {results['net_profit']:+,.0f} JPY")
-        logger.info(f"  リターン: {results['return_pct']:+.2f}%")
-        logger.info("")
-
-        # トレード統計
-        logger.info("[トレード統計]")
-        logger.info(f"  総トレード数: {results['total_trades']}")
-        logger.info(f"  勝ちトレード: {results['winning_trades']}")
-        logger.info(f"  負けトレード: {results['losing_trades']}")
-        logger.info(f"  勝率: {results['win_rate']:.2f}%")
-        logger.info("")
-
-        # 損益詳細
-        logger.info("[損益詳細]")
-        logger.info(f"  総利益: {results['total_profit']:,.0f} JPY")
-        logger.info(f"  総損失: {results['total_loss']:,.0f} JPY")
-        logger.info(f"  平均利益: {results['avg_profit']:,.0f} JPY")
-        logger.info(f"  平均損失: {results['avg_loss']:,.0f} JPY")
-        logger.info(f"  プロフィットファクター: {results['profit_factor']:.2f}")
-        logger.info("")
-
-        # リスク指標
-        logger.info("[リスク指標]")
-        logger.info(f"  最大ドローダウン: {results['max_drawdown']:,.0f} JPY")
-        logger.info(f"  最大DD率: {results['max_drawdown_pct']:.2f}%")
-        logger.info("")
+        _emit([
+            "",
+            "=" * 80,
+            "テスト結果",
+            "=" * 80,
+            "",
+
+            # 基本情報
+            "[基本情報]",
+            f"  初期残高: {results['initial_balance']:,.0f} JPY",
+            f"  最終残高: {results['final_balance']:,.0f} JPY",
+            f"  純利益: {results['net_profit']:+,.0f} JPY",
+            f"  リターン: {results['return_pct']:+.2f}%",
+            "",
+
+            # トレード統計
+            "[トレード統計]",
+            f"  総トレード数: {results['total_trades']}",
+            f"  勝ちトレード: {results['winning_trades']}",
+            f"  負けトレード: {results['losing_trades']}",
+            f"  勝率: {results['win_rate']:.2f}%",
+            "",
+
+            # 損益詳細
+            "[損益詳細]",
+            f"  総利益: {results['total_profit']:,.0f} JPY",
+            f"  総損失: {results['total_loss']:,.0f} JPY",
+            f"  平均利益: {results['avg_profit']:,.0f} JPY",
+            f"  平均損失: {results['avg_loss']:,.0f} JPY",
+            f"  プロフィットファクター: {results['profit_factor']:.2f}",
+            "",
+
+            # リスク指標
+            "[リスク指標]",
+            f"  最大ドローダウン: {results['max_drawdown']:,.0f} JPY",
+            f"  最大DD率: {results['max_drawdown_pct']:.2f}%",
+            "",
+        ])
 
         # パフォーマンス評価
-        logger.info("[パフォーマンス評価]")
-
-        rating = "要改善"
-        if (results['return_pct'] >= 10 and
-            results['win_rate'] >= 60 and
-            results['profit_factor'] >= 2.0):
-            rating = "優秀"
-        elif (results['return_pct'] >= 5 and
-              results['win_rate'] >= 50 and
-              results['profit_factor'] >= 1.5):
-            rating = "良好"
-        elif (results['return_pct'] >= 0 and
-              results['win_rate'] >= 40 and
-              results['profit_factor'] >= 1.0):
-            rating = "普通"
-
-        logger.info(f"  総合評価: {rating}")
-        logger.info("")
+        rating = next(
+            (
+                name for name, min_return, min_win_rate, min_pf in RATINGS
+                if results['return_pct'] >= min_return
+                and results['win_rate'] >= min_win_rate
+                and results['profit_factor'] >= min_pf
+            ),
+            "要改善"
+        )
+
+        _emit([
+            "[パフォーマンス評価]",
+            f"  総合評価: {rating}",
+            "",
+        ])
 
         # 成功判定
         logger.info("=" * 80)
@@ -161,10 +185,12 @@ def main():
         logger.info("=" * 80)
         logger.info("")
 
-        logger.info("結果はbacktest_resultsテーブルに保存されました。")
-        logger.info("詳細はbacktest_summaryビューで確認できます：")
-        logger.info("  SELECT * FROM backtest_summary ORDER BY created_at DESC LIMIT 1;")
-        logger.info("")
+        _emit([
+            "結果はbacktest_resultsテーブルに保存されました。",
+            "詳細はbacktest_summaryビューで確認できます：",
+            "  SELECT * FROM backtest_summary ORDER BY created_at DESC LIMIT 1;",
+            "",
+        ])
 
     else:
         logger.error("")
@@ -14,6 +14,7 @@ Daily Review Function Test Script
 """
 
 import logging
+import os
 import sys
 from datetime import datetime, timedelta
 
@@ -29,6 +30,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _bullets(title: str, items: list, prefix: str) -> str:
+    """見出しと箇条書きを1つの複数行文字列にまとめる（末尾に空行）"""
+    return "\n".join([title] + [f"  {prefix} {item}" for item in items] + [""])
+
+
 def main():
     """メイン処理"""
     logger.info("=" * 80)
@@ -51,30 +57,25 @@ def main():
         logger.info("AIAnalyzer initialized successfully")
         logger.info("")
 
-        # サンプルデータ: 前日のトレード結果
+        # サンプルデータ: 前日のトレード結果（pips・損益は価格から列単位で計算）
         logger.info("Preparing sample trade data...")
-        previous_trades = [
-            {
-                'entry_time': '2024-09-20 10:30:00',
-                'exit_time': '2024-09-20 14:15:00',
-                'direction': 'BUY',
-                'entry_price': 149.60,
-                'exit_price': 149.75,
-                'pips': 15,
-                'profit_loss': 7500,
-                'exit_reason': 'take_profit_level_2'
-            },
-            {
-                'entry_time': '2024-09-20 16:00:00',
-                'exit_time': '2024-09-20 18:30:00',
-                'direction': 'SELL',
-                'entry_price': 149.80,
-                'exit_price': 149.85,
-                'pips': -5,
-                'profit_loss': -2500,
-                'exit_reason': 'stop_loss'
-            }
-        ]
+        import numpy as np
+        import pandas as pd
+
+        trades_df = pd.DataFrame({
+            'entry_time': ['2024-09-20 10:30:00', '2024-09-20 16:00:00'],
+            'exit_time': ['2024-09-20 14:15:00', '2024-09-20 18:30:00'],
+            'direction': ['BUY', 'SELL'],
+            'entry_price': [149.60, 149.80],
+            'exit_price': [149.75, 149.85],
+            'exit_reason': ['take_profit_level_2', 'stop_loss'],
+        })
+        price_diff = trades_df['exit_price'] - trades_df['entry_price']
+        trades_df['pips'] = (
+            np.where(trades_df['direction'] == 'BUY', price_diff, -price_diff) * 100
+        ).round(1)
+        trades_df['profit_loss'] = trades_df['pips'] * 500  # 0.05ロット相当（1pip = 500円）
+        previous_trades = trades_df.to_dict(orient='records')
 
         # サンプルデータ: 前日の予測
         prediction = {
@@ -93,13 +94,15 @@ def main():
         }
 
         # サンプルデータ: 統計情報
+        pips = trades_df['pips']
+        win_trades = int((pips > 0).sum())
         statistics = {
-            'total_pips': 10,
-            'win_rate': '50%',
-            'max_drawdown': '-5pips',
-            'total_trades': 2,
-            'win_trades': 1,
-            'loss_trades': 1
+            'total_pips': float(pips.sum()),
+            'win_rate': f"{(pips > 0).mean():.0%}",
+            'max_drawdown': f"{min(pips.min(), 0):g}pips",
+            'total_trades': len(trades_df),
+            'win_trades': win_trades,
+            'loss_trades': len(trades_df) - win_trades
         }
 
         logger.info(f"Sample data prepared: {len(previous_trades)} trades")
@@ -123,54 +126,38 @@ def main():
         logger.info("=" * 80)
         logger.info("")
 
-        # 結果表示
-        logger.info(f"Total Score: {review_result.get('score', {}).get('total', 'N/A')}")
-        logger.info(f"Comment: {review_result.get('score', {}).get('comment', 'N/A')}")
-        logger.info("")
-
-        # スコア詳細
+        # 結果表示・スコア詳細（まとめて1回で出力）
         score_breakdown = review_result.get('score', {})
-        logger.info("Score Breakdown:")
-        logger.info(f"  Direction: {score_breakdown.get('direction', 'N/A')}")
-        logger.info(f"  Entry Timing: {score_breakdown.get('entry_timing', 'N/A')}")
-        logger.info(f"  Exit Timing: {score_breakdown.get('exit_timing', 'N/A')}")
-        logger.info(f"  Risk Management: {score_breakdown.get('risk_management', 'N/A')}")
-        logger.info("")
-
-        # 分析結果
+        logger.info("\n".join([
+            f"Total Score: {score_breakdown.get('total', 'N/A')}",
+            f"Comment: {score_breakdown.get('comment', 'N/A')}",
+            "",
+            "Score Breakdown:",
+            f"  Direction: {score_breakdown.get('direction', 'N/A')}",
+            f"  Entry Timing: {score_breakdown.get('entry_timing', 'N/A')}",
+            f"  Exit Timing: {score_breakdown.get('exit_timing', 'N/A')}",
+            f"  Risk Management: {score_breakdown.get('risk_management', 'N/A')}",
+            "",
+        ]))
+
+        # 分析結果（各セクションを1回のログ出力にまとめる）
         analysis = review_result.get('analysis', {})
-        logger.info("What Worked:")
-        for item in analysis.get('what_worked', []):
-            logger.info(f"  ✓ {item}")
-        logger.info("")
-
-        logger.info("What Failed:")
-        for item in analysis.get('what_failed', []):
-            logger.info(f"  ✗ {item}")
-        logger.info("")
-
-        logger.info("Missed Signals:")
-        for item in analysis.get('missed_signals', []):
-            logger.info(f"  ! {item}")
-        logger.info("")
+        logger.info(_bullets("What Worked:", analysis.get('what_worked', []), "✓"))
+        logger.info(_bullets("What Failed:", analysis.get('what_failed', []), "✗"))
+        logger.info(_bullets("Missed Signals:", analysis.get('missed_signals', []), "!"))
 
         # 今日への教訓
-        logger.info("Lessons for Today:")
-        for i, lesson in enumerate(review_result.get('lessons_for_today', []), 1):
-            logger.info(f"  {i}. {lesson}")
-        logger.info("")
+        lessons = review_result.get('lessons_for_today', [])
+        logger.info("\n".join(
+            ["Lessons for Today:"]
+            + [f"  {i}. {lesson}" for i, lesson in enumerate(lessons, 1)]
+            + [""]
+        ))
 
         # パターン認識
         patterns = review_result.get('pattern_recognition', {})
-        logger.info("Success Patterns:")
-        for pattern in patterns.get('success_patterns', []):
-            logger.info(f"  ✓ {pattern}")
-        logger.info("")
-
-        logger.info("Failure Patterns:")
-        for pattern in patterns.get('failure_patterns', []):
-            logger.info(f"  ✗ {pattern}")
-        logger.info("")
+        logger.info(_bullets("Success Patterns:", patterns.get('success_patterns', []), "✓"))
+        logger.info(_bullets("Failure Patterns:", patterns.get('failure_patterns', []), "✗"))
 
         # エラーチェック
         if 'error' in review_result:
@@ -194,7 +181,11 @@ def main():
         return 130
 
     except Exception as e:
-        logger.error(f"Test failed with error: {e}", exc_info=True)
+        # トレースバックはFXAI_TB設定時のみ出力（バッチ実行時のログ肥大化を防ぐ）
+        show_traceback = bool(os.environ.get('FXAI_TB'))
+        logger.error(f"Test failed with error: {e}", exc_info=show_traceback)
+        if not show_traceback:
+            logger.error("Set FXAI_TB=1 for traceback")
         return 1
 
 
@@ -12,25 +12,103 @@
 """
 
 import os
+import re
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# 環境変数の読み込み
-load_dotenv()
-
 # ログ設定（エラーと警告のみ表示）
 logging.basicConfig(
     level=logging.WARNING,
     format='%(levelname)s: %(message)s'
 )
 
-from src.backtest.backtest_engine import BacktestEngine
+
+# 区切り線
+SEPARATOR = "=" * 80
+
+# 日付引数の形式（YYYY-MM-DD）
+DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# 接続テストで表示するPhase別ラベル（キーはPhase別クライアント名）
+PHASE_LABELS = {
+    'daily_analysis': "Phase 1,2   (デイリー分析)",
+    'periodic_update': "Phase 3     (定期更新)",
+    'position_monitor': "Phase 4     (ポジション監視)",
+    'emergency_evaluation': "Phase 5     (緊急評価)",
+}
+
+# 結果サマリーのテンプレート（結果にキーがない場合はRESULT_DEFAULTSの値を使用）
+RESULTS_TEMPLATE = """
+{line}
+テスト結果サマリー
+{line}
+
+【基本統計】
+  期間: {start} ～ {end}
+  初期残高: {initial_balance:,.0f}円
+  最終残高: {final_balance:,.0f}円
+  損益: {net_profit:,.0f}円 ({profit_percent:.2f}%)
+
+【トレード統計】
+  総トレード数: {total_trades}
+  勝ちトレード: {win_trades}
+  負けトレード: {loss_trades}
+  勝率: {win_rate:.2f}%
+  総pips: {total_pips:.1f}pips
+
+【リスク指標】
+  最大ドローダウン: {max_drawdown:.2f}%
+  最大連敗: {max_consecutive_losses}
+  最大連勝: {max_consecutive_wins}
+
+"""
+
+RESULT_DEFAULTS = {
+    'initial_balance': 0,
+    'final_balance': 0,
+    'net_profit': 0,
+    'profit_percent': 0,
+    'total_trades': 0,
+    'win_trades': 0,
+    'loss_trades': 0,
+    'win_rate': 0,
+    'total_pips': 0,
+    'max_drawdown': 0,
+    'max_consecutive_losses': 0,
+    'max_consecutive_wins': 0,
+}
+
+# 各フェーズの結果確認用コマンド
+DB_COMMANDS_BANNER = """\
+{line}
+データベース確認
+{line}
+
+以下のコマンドで各フェーズの結果を確認できます：
+
+# Phase 1: デイリーレビュー
+  psql -U postgres -d fx_autotrade -c "SELECT review_date, total_score FROM backtest_daily_reviews ORDER BY review_date DESC LIMIT 5;"
+
+# Phase 2: 朝の詳細分析
+  psql -U postgres -d fx_autotrade -c "SELECT strategy_date, daily_bias, confidence FROM backtest_daily_strategies ORDER BY strategy_date DESC LIMIT 5;"
+
+# Phase 3: 定期更新
+  psql -U postgres -d fx_autotrade -c "SELECT update_date, update_time, update_type FROM backtest_periodic_updates ORDER BY update_date DESC, update_time DESC LIMIT 10;"
+
+# Phase 4: Layer 3a監視
+  psql -U postgres -d fx_autotrade -c "SELECT check_timestamp, action, reason FROM backtest_layer3a_monitoring ORDER BY check_timestamp DESC LIMIT 10;"
+
+# Phase 5: Layer 3b緊急評価
+  psql -U postgres -d fx_autotrade -c "SELECT event_timestamp, severity, action FROM backtest_layer3b_emergency ORDER BY event_timestamp DESC LIMIT 5;"
+
+""".format(line=SEPARATOR)
+
 
 def parse_arguments():
     """コマンドライン引数を解析"""
@@ -47,16 +125,19 @@ def parse_arguments():
 
   # インタラクティブモード（引数なし）
   python test_full_integration.py
+
+  # 期間入力後の実行確認をスキップ
+  python test_full_integration.py --yes
         """
     )
     parser.add_argument(
         '--start-date',
-        type=str,
+        type=iso_date,
         help='開始日（YYYY-MM-DD形式）例: 2024-01-01'
     )
     parser.add_argument(
         '--end-date',
-        type=str,
+        type=iso_date,
         help='終了日（YYYY-MM-DD形式）例: 2024-01-31'
     )
     parser.add_argument(
@@ -71,45 +152,123 @@ def parse_arguments():
         default=100000.0,
         help='初期残高（デフォルト: 100000円）'
     )
+    parser.add_argument(
+        '--no-probe-cache',
+        action='store_true',
+        help='LLM接続テストのキャッシュを使わず毎回APIに接続する'
+    )
+    parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='実行確認をスキップ（--start-date/--end-date指定時は自動で有効）'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='エラー時にトレースバックを表示（環境変数FXAI_VERBOSEでも有効）'
+    )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    # 期間の前後関係も引数解析の段階で検証（重いモジュールの読み込み前に終了）
+    if args.start_date and args.end_date and args.end_date < args.start_date:
+        parser.error("終了日は開始日より後にしてください。")
+
+    return args
+
+
+def iso_date(value: str) -> datetime:
+    """argparse用の日付変換（不正な形式はargparseのエラーとして報告）"""
+    try:
+        return parse_date(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"日付形式が無効です。YYYY-MM-DD形式で指定してください。({e})")
 
-def get_date_range_interactive():
-    """インタラクティブに期間を取得"""
-    print("=" * 80)
-    print("テスト期間の設定")
-    print("=" * 80)
-    print()
-    print("バックテストを実行する期間を指定してください。")
-    print()
 
+def print_banner(title: str):
+    """区切り線で囲んだ見出しを表示"""
+    sys.stdout.write(f"{SEPARATOR}\n{title}\n{SEPARATOR}\n")
+
+
+def print_error(e: Exception, verbose: bool):
+    """例外の概要を1行で表示（verbose時はトレースバックも表示）"""
+    if verbose:
+        import traceback
+        print(f"❌ {type(e).__name__}: {e}")
+        traceback.print_exc()
+    else:
+        print(f"❌ {type(e).__name__}: {e}  (run with --verbose for traceback)")
+
+
+def parse_date(value: str) -> datetime:
+    """
+    YYYY-MM-DD形式の日付文字列を解析
+
+    Raises:
+        ValueError: YYYY-MM-DD形式でない場合
+    """
+    # 形式はコンパイル済みの正規表現で判定し、日付の妥当性はdatetimeで検証
+    match = DATE_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid date format: '{value}' (expected YYYY-MM-DD)")
+    return datetime(*map(int, match.groups()))
+
+
+def prompt_date(prompt: str) -> datetime:
+    """有効な日付が入力されるまでYYYY-MM-DD形式の日付を入力させる"""
     while True:
-        start_input = input("開始日 (YYYY-MM-DD 例: 2024-01-01): ").strip()
         try:
-            start_date = datetime.strptime(start_input, '%Y-%m-%d')
-            break
+            return parse_date(input(prompt).strip())
         except ValueError:
             print("❌ 無効な日付形式です。YYYY-MM-DD形式で入力してください。")
 
+
+def check_date_range(start_date: datetime, end_date: datetime) -> bool:
+    """終了日が開始日以降か確認（不正な場合はエラーを表示）"""
+    if end_date < start_date:
+        print("❌ 終了日は開始日より後にしてください。")
+        return False
+    return True
+
+
+def get_date_range_interactive():
+    """インタラクティブに期間を取得"""
+    print_banner("テスト期間の設定")
+    print()
+    print("バックテストを実行する期間を指定してください。")
+    print()
+
+    start_date = prompt_date("開始日 (YYYY-MM-DD 例: 2024-01-01): ")
     while True:
-        end_input = input("終了日 (YYYY-MM-DD 例: 2024-01-31): ").strip()
-        try:
-            end_date = datetime.strptime(end_input, '%Y-%m-%d')
-            if end_date < start_date:
-                print("❌ 終了日は開始日より後にしてください。")
-                continue
+        end_date = prompt_date("終了日 (YYYY-MM-DD 例: 2024-01-31): ")
+        if check_date_range(start_date, end_date):
             break
-        except ValueError:
-            print("❌ 無効な日付形式です。YYYY-MM-DD形式で入力してください。")
 
     return start_date, end_date
 
 
+def print_results(results: dict, start_date: datetime, end_date: datetime):
+    """バックテスト結果のサマリーを表示"""
+    values = {**RESULT_DEFAULTS, **results}
+    sys.stdout.write(RESULTS_TEMPLATE.format(
+        line=SEPARATOR,
+        start=start_date.date(),
+        end=end_date.date(),
+        **values
+    ))
+
+
 def main():
     """メイン処理"""
-    print("=" * 80)
-    print("全フェーズ統合テスト（Phase 1-5）")
-    print("=" * 80)
+    # コマンドライン引数を解析（--help時は重いモジュールを読み込まずに終了）
+    args = parse_arguments()
+    verbose = args.verbose or bool(os.environ.get('FXAI_VERBOSE'))
+
+    # 環境変数の読み込み
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    print_banner("全フェーズ統合テスト（Phase 1-5）")
     print()
 
     # 設定値を読み込んでモデル名を取得
@@ -124,22 +283,10 @@ def main():
     print(f"  ✓ Phase 5: Layer 3b緊急評価（異常検知時、{config.model_emergency_evaluation}）")
     print()
 
-    # コマンドライン引数を解析
-    args = parse_arguments()
-
     # 期間の取得（引数またはインタラクティブ）
     if args.start_date and args.end_date:
-        # コマンドライン引数から取得
-        try:
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d')
-            end_date = datetime.strptime(args.end_date, '%Y-%m-%d')
-            if end_date < start_date:
-                print("❌ エラー: 終了日は開始日より後にしてください。")
-                return 1
-        except ValueError as e:
-            print(f"❌ エラー: 日付形式が無効です。YYYY-MM-DD形式で指定してください。")
-            print(f"   詳細: {e}")
-            return 1
+        # コマンドライン引数から取得（形式・前後関係は解析時に検証済み）
+        start_date, end_date = args.start_date, args.end_date
     else:
         # インタラクティブモード
         start_date, end_date = get_date_range_interactive()
@@ -148,57 +295,77 @@ def main():
     initial_balance = args.balance
     days = (end_date - start_date).days + 1
 
+    # 期間の文字列表現（表示・環境変数・エンジン引数で共通に使用）
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+
     print()
-    print(f"テスト期間: {start_date.date()} ～ {end_date.date()} ({days}日間)")
+    print(f"テスト期間: {start_str} ～ {end_str} ({days}日間)")
     print(f"通貨ペア: {symbol}")
     print(f"初期残高: {initial_balance:,.0f}円")
     print()
 
-    # 環境変数をバックテストモードに設定
-    os.environ['TRADE_MODE'] = 'backtest'
-    os.environ['BACKTEST_START_DATE'] = start_date.strftime('%Y-%m-%d')
-    os.environ['BACKTEST_END_DATE'] = end_date.strftime('%Y-%m-%d')
-    os.environ['BACKTEST_SYMBOL'] = symbol
+    # 環境変数をバックテストモードに設定（src.ai_analysisの読み込み前にまとめて反映）
+    os.environ.update({
+        'TRADE_MODE': 'backtest',
+        'BACKTEST_START_DATE': start_str,
+        'BACKTEST_END_DATE': end_str,
+        'BACKTEST_SYMBOL': symbol,
+    })
 
     # Gemini API接続チェック
-    print("=" * 80)
-    print("環境チェック（LLM API接続）")
-    print("=" * 80)
+    print_banner("環境チェック（LLM API接続）")
     try:
         from src.ai_analysis import create_phase_clients
-        from src.utils.config import get_config
-
-        config = get_config()
-
-        # Phase別のLLMクライアントを生成・接続テスト
-        phase_clients = create_phase_clients()
-
-        # 各クライアントの接続テスト
-        all_connected = True
-        for phase_name, client in phase_clients.items():
-            provider = client.get_provider_name()
-            if phase_name == 'daily_analysis':
-                model = config.model_daily_analysis
-                label = "Phase 1,2   (デイリー分析)"
-            elif phase_name == 'periodic_update':
-                model = config.model_periodic_update
-                label = "Phase 3     (定期更新)"
-            elif phase_name == 'position_monitor':
-                model = config.model_position_monitor
-                label = "Phase 4     (ポジション監視)"
-            else:  # emergency_evaluation
-                model = config.model_emergency_evaluation
-                label = "Phase 5     (緊急評価)"
-
-            print(f"{label}: {model}")
-            print(f"  Provider: {provider.upper()}", end=' ')
-
-            # 実際の.envモデルでテスト
-            if not client.test_connection(verbose=False, model=model):
-                print(" ❌ 接続失敗")
-                all_connected = False
-            else:
-                print(" ✓ 接続成功")
+        from src.ai_analysis.llm_client_factory import detect_provider_from_model
+        from src.ai_analysis.probe_cache import cached_test_connection
+
+        # Phase別のテスト対象モデル（.envの設定値 config.model_<Phase名>）
+        phase_models = {
+            phase_name: getattr(config, f"model_{phase_name}")
+            for phase_name in PHASE_LABELS
+        }
+
+        # APIキー未設定のプロバイダーはAPIに接続せずに失敗とする
+        missing_keys = {}
+        for phase_name, model in phase_models.items():
+            provider = detect_provider_from_model(model)
+            if not getattr(config, f"{provider}_api_key"):
+                missing_keys[phase_name] = f"{provider.upper()}_API_KEY"
+
+        all_connected = not missing_keys
+        if missing_keys:
+            for phase_name, model in phase_models.items():
+                print(f"{PHASE_LABELS[phase_name]}: {model}")
+                if phase_name in missing_keys:
+                    print(f"  ❌ {missing_keys[phase_name]}が未設定")
+        else:
+            # Phase別のLLMクライアントを生成・接続テスト
+            phase_clients = create_phase_clients()
+
+            # 各クライアントの接続テストを並列実行（各テストは独立したAPI呼び出し）
+            with ThreadPoolExecutor(max_workers=len(phase_clients)) as executor:
+                futures = {
+                    phase_name: executor.submit(
+                        cached_test_connection,
+                        client,
+                        phase_models[phase_name],
+                        use_cache=not args.no_probe_cache
+                    )
+                    for phase_name, client in phase_clients.items()
+                }
+
+            # 結果はPhase順に表示
+            for phase_name, client in phase_clients.items():
+                model = phase_models[phase_name]
+                print(f"{PHASE_LABELS[phase_name]}: {model}")
+                print(f"  Provider: {client.get_provider_name().upper()}", end=' ')
+
+                if not futures[phase_name].result():
+                    print(" ❌ 接続失敗")
+                    all_connected = False
+                else:
+                    print(" ✓ 接続成功")
 
         if not all_connected:
             print("")
@@ -214,11 +381,10 @@ def main():
             return 1
 
     except Exception as e:
-        import traceback
         print(f"❌ LLM APIの初期化に失敗しました: {e}")
         print("")
         print("詳細なエラー情報：")
-        traceback.print_exc()
+        print_error(e, verbose)
         print("")
         print("   .envファイルを確認してください。")
         print("")
@@ -226,30 +392,30 @@ def main():
 
     print("")
 
-    print("=" * 80)
-    print("データ要件")
-    print("=" * 80)
+    print_banner("データ要件")
     print(f"  - CSVティックデータ: data/tick_data/{symbol}_*.csv")
-    print(f"  - 期間: {start_date.date()} ～ {end_date.date()}")
+    print(f"  - 期間: {start_str} ～ {end_str}")
     print()
 
-    response = input("テストを実行しますか？ (yes/no): ")
-    if response.lower() not in ['yes', 'y']:
-        print("テストをキャンセルしました。")
-        return 0
+    # 実行確認（--yes指定時・期間を引数で指定した場合はスキップ）
+    if not (args.yes or (args.start_date and args.end_date)):
+        response = input("テストを実行しますか？ (yes/no): ")
+        if response.lower() not in ['yes', 'y']:
+            print("テストをキャンセルしました。")
+            return 0
 
     print()
-    print("=" * 80)
-    print("バックテスト開始")
-    print("=" * 80)
+    print_banner("バックテスト開始")
     print()
 
     try:
-        # バックテストエンジン初期化
+        # バックテストエンジン初期化（実行時のみ読み込む）
+        from src.backtest.backtest_engine import BacktestEngine
+
         engine = BacktestEngine(
             symbol=symbol,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d'),
+            start_date=start_str,
+            end_date=end_str,
             initial_balance=initial_balance,
             ai_model='flash',  # 定期更新用（朝の分析はPro、監視はFlash-8B）
             sampling_interval_hours=24,
@@ -257,38 +423,28 @@ def main():
             csv_path=None  # MT5から取得（またはCSVパスを指定）
         )
 
-        # バックテスト実行
-        results = engine.run()
-
-        print()
-        print("=" * 80)
-        print("テスト結果サマリー")
-        print("=" * 80)
-        print()
-
-        # 基本統計
-        print("【基本統計】")
-        print(f"  期間: {start_date.date()} ～ {end_date.date()}")
-        print(f"  初期残高: {results.get('initial_balance', 0):,.0f}円")
-        print(f"  最終残高: {results.get('final_balance', 0):,.0f}円")
-        print(f"  損益: {results.get('net_profit', 0):,.0f}円 ({results.get('profit_percent', 0):.2f}%)")
-        print()
-
-        # トレード統計
-        print("【トレード統計】")
-        print(f"  総トレード数: {results.get('total_trades', 0)}")
-        print(f"  勝ちトレード: {results.get('win_trades', 0)}")
-        print(f"  負けトレード: {results.get('loss_trades', 0)}")
-        print(f"  勝率: {results.get('win_rate', 0):.2f}%")
-        print(f"  総pips: {results.get('total_pips', 0):.1f}pips")
-        print()
-
-        # リスク指標
-        print("【リスク指標】")
-        print(f"  最大ドローダウン: {results.get('max_drawdown', 0):.2f}%")
-        print(f"  最大連敗: {results.get('max_consecutive_losses', 0)}")
-        print(f"  最大連勝: {results.get('max_consecutive_wins', 0)}")
-        print()
+        # バックテスト実行（インタラクティブモードでは期間を変えて再実行可能）
+        while True:
+            results = engine.run()
+            print_results(results, start_date, end_date)
+
+            if args.start_date and args.end_date:
+                break
+
+            response = input("別の期間で再実行しますか？ (yes/no): ")
+            if response.lower() not in ['yes', 'y']:
+                break
+
+            # ティックデータ・LLMクライアントを保持したまま期間のみ変更
+            # （環境変数もエンジンと同じ文字列で更新し、期間の情報源を一致させる）
+            start_date, end_date = get_date_range_interactive()
+            start_str = start_date.strftime('%Y-%m-%d')
+            end_str = end_date.strftime('%Y-%m-%d')
+            os.environ.update({
+                'BACKTEST_START_DATE': start_str,
+                'BACKTEST_END_DATE': end_str,
+            })
+            engine.reset(start_date=start_str, end_date=end_str)
 
         # トークン使用量レポート
         from src.ai_analysis.token_usage_tracker import get_token_tracker
@@ -296,31 +452,9 @@ def main():
         tracker.print_summary()
 
         # データベース確認
-        print("=" * 80)
-        print("データベース確認")
-        print("=" * 80)
-        print()
-        print("以下のコマンドで各フェーズの結果を確認できます：")
-        print()
-        print("# Phase 1: デイリーレビュー")
-        print("  psql -U postgres -d fx_autotrade -c \"SELECT review_date, total_score FROM backtest_daily_reviews ORDER BY review_date DESC LIMIT 5;\"")
-        print()
-        print("# Phase 2: 朝の詳細分析")
-        print("  psql -U postgres -d fx_autotrade -c \"SELECT strategy_date, daily_bias, confidence FROM backtest_daily_strategies ORDER BY strategy_date DESC LIMIT 5;\"")
-        print()
-        print("# Phase 3: 定期更新")
-        print("  psql -U postgres -d fx_autotrade -c \"SELECT update_date, update_time, update_type FROM backtest_periodic_updates ORDER BY update_date DESC, update_time DESC LIMIT 10;\"")
-        print()
-        print("# Phase 4: Layer 3a監視")
-        print("  psql -U postgres -d fx_autotrade -c \"SELECT check_timestamp, action, reason FROM backtest_layer3a_monitoring ORDER BY check_timestamp DESC LIMIT 10;\"")
-        print()
-        print("# Phase 5: Layer 3b緊急評価")
-        print("  psql -U postgres -d fx_autotrade -c \"SELECT event_timestamp, severity, action FROM backtest_layer3b_emergency ORDER BY event_timestamp DESC LIMIT 5;\"")
-        print()
+        sys.stdout.write(DB_COMMANDS_BANNER)
 
-        print("=" * 80)
-        print("テスト完了")
-        print("=" * 80)
+        print_banner("テスト完了")
         print()
         print("✓ すべてのフェーズが正常に実行されました")
         print("✓ 詳細なログは上記を参照してください")
@@ -331,12 +465,8 @@ def main():
 
     except Exception as e:
         print()
-        print("=" * 80)
-        print("エラーが発生しました")
-        print("=" * 80)
-        print(f"エラー: {e}")
-        import traceback
-        traceback.print_exc()
+        print_banner("エラーが発生しました")
+        print_error(e, verbose)
         print()
         print("トラブルシューティング:")
         print("  1. .envファイルが正しく設定されているか確認")
@@ -348,4 +478,4 @@ def main():
 
 
 if __name__ == '__main__':
-    exit(main())
+    sys.exit(main())
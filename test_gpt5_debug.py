@@ -9,12 +9,16 @@ import sys
 import logging
 from dotenv import load_dotenv
 
-# ログレベルをDEBUGに設定して詳細情報を表示
+# SDKのHTTPヘッダー等のDEBUGログは抑制（INFO以上のみ表示）
+# （SDKの通信ログが必要な場合は OPENAI_LOG=debug を設定）
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Content要素で表示する属性
+CONTENT_ATTRS = ('type', 'text', 'annotations', 'logprobs')
+
 load_dotenv()
 
 # OpenAI SDKを直接使用してテスト
@@ -57,37 +61,42 @@ def test_gpt5_direct():
         print(f"Response status: {response.status}")
         print(f"Response model: {response.model}")
 
+        # 属性は一度だけ取得してローカル変数から参照
+        output = getattr(response, 'output', None) or []
+        output_text = getattr(response, 'output_text', None)
+        usage = getattr(response, 'usage', None)
+
         # output配列の内容を表示
-        print(f"\nOutput array length: {len(response.output)}")
-        for i, output_item in enumerate(response.output):
+        print(f"\nOutput array length: {len(output)}")
+        for i, output_item in enumerate(output):
             print(f"\n--- Output[{i}] ---")
             print(f"  Type: {output_item.type}")
-            if hasattr(output_item, 'role'):
-                print(f"  Role: {output_item.role}")
-            if hasattr(output_item, 'content'):
-                print(f"  Content length: {len(output_item.content)}")
-                for j, content_item in enumerate(output_item.content):
+            role = getattr(output_item, 'role', None)
+            if role is not None:
+                print(f"  Role: {role}")
+            content = getattr(output_item, 'content', None)
+            if content is not None:
+                print(f"  Content length: {len(content)}")
+                for j, content_item in enumerate(content):
                     print(f"\n  --- Content[{j}] ---")
-                    print(f"    Type: {content_item.type}")
-                    if hasattr(content_item, 'text'):
-                        print(f"    Text: {content_item.text}")
-                    # すべての属性を表示
-                    attrs = [attr for attr in dir(content_item) if not attr.startswith('_')]
-                    print(f"    Attributes: {attrs}")
+                    # 調査対象の属性のみ表示（dir()による全属性の走査は行わない）
+                    for name in CONTENT_ATTRS:
+                        value = getattr(content_item, name, None)
+                        if value is not None:
+                            print(f"    {name.capitalize()}: {value}")
 
         # output_textプロパティを確認
         print(f"\n--- output_text property ---")
-        if hasattr(response, 'output_text'):
-            output_text = response.output_text
+        if output_text is not None:
             print(f"output_text: '{output_text}'")
             print(f"output_text length: {len(output_text)}")
         else:
             print("No output_text property")
 
         # usageを表示
-        if hasattr(response, 'usage'):
+        if usage is not None:
             print(f"\n--- Usage ---")
-            print(f"Total tokens: {response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 'N/A'}")
+            print(f"Total tokens: {getattr(usage, 'total_tokens', 'N/A')}")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -6,104 +6,150 @@ gpt-5-miniとgpt-5-nanoの違いを調査
 
 import os
 import sys
-from dotenv import load_dotenv
-from openai import OpenAI
+import json
+import asyncio
+import hashlib
+import logging
+import argparse
+import importlib.util
+from src.utils.cache import cache_dir
+from src.utils.env_loader import ensure_env_loaded
+
+# HTTP/2はh2パッケージがインストールされている場合のみ使用（importはhttpxに任せる）
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+ensure_env_loaded()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# リクエストパラメータ（モデル名以外）
+REQUEST_PARAMS = {
+    'input': [
+        {"type": "message", "role": "user", "content": "Say OK"}
+    ],
+    'text': {
+        "format": {"type": "text"},
+        "verbosity": "medium"
+    },
+    'reasoning': {
+        "effort": "medium",
+        "summary": "auto"
+    },
+    'max_output_tokens': 100,
+}
+
+
+def response_cache_path(params):
+    """リクエストパラメータに対応するレスポンスキャッシュのパス"""
+    key = hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir('openai_responses'), f"{key}.json")
+
+
+async def request_model(client, model_name, use_cache=False):
+    """指定されたモデルにリクエストを送信（戻り値: (レスポンス, キャッシュから取得したか)）"""
+    params = {'model': model_name, **REQUEST_PARAMS}
+    path = response_cache_path(params)
+
+    if use_cache and os.path.exists(path):
+        from openai.types.responses import Response
+        with open(path, encoding='utf-8') as f:
+            return Response.model_validate_json(f.read()), True
+
+    response = await client.responses.create(**params)
+
+    if use_cache:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(response.model_dump_json())
+    return response, False
+
+
+async def request_models(api_key, models, use_cache=False):
+    """全モデルへのリクエストを並列実行（1つのクライアントの接続プールを共有）"""
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    # HTTP/2が使える場合は全リクエストを1つのTLS接続に多重化する
+    # （レスポンスのgzip圧縮はhttpxのデフォルトで有効）
+    http_client = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+    async with AsyncOpenAI(api_key=api_key, http_client=http_client) as client:
+        return await asyncio.gather(
+            *(request_model(client, model_name, use_cache) for model_name in models),
+            return_exceptions=True
+        )
 
-load_dotenv()
 
-def test_model(model_name):
-    """指定されたモデルをテスト"""
+def report_model(model_name, result):
+    """指定されたモデルのレスポンスを表示（例外の場合はエラーを表示）"""
     print(f"\n{'=' * 70}")
     print(f"Testing: {model_name}")
     print('=' * 70)
 
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key or api_key.startswith('your_'):
-        print("❌ OPENAI_API_KEY not configured")
+    if isinstance(result, Exception):
+        logger.error(f"❌ Error: {result}", exc_info=result)
         return False
 
-    client = OpenAI(api_key=api_key)
-
+    response, from_cache = result
     try:
-        response = client.responses.create(
-            model=model_name,
-            input=[
-                {"type": "message", "role": "user", "content": "Say OK"}
-            ],
-            text={
-                "format": {"type": "text"},
-                "verbosity": "medium"
-            },
-            reasoning={
-                "effort": "medium",
-                "summary": "auto"
-            },
-            max_output_tokens=100
-        )
-
-        print(f"\n✅ Response received!")
-        print(f"  Response ID: {response.id}")
-        print(f"  Status: {response.status}")
-        print(f"  Model: {response.model}")
-
-        # output配列
-        if hasattr(response, 'output'):
-            print(f"\n  Output: {response.output}")
-            print(f"  Output length: {len(response.output) if response.output else 0}")
-
-            if response.output:
-                for i, item in enumerate(response.output):
-                    print(f"\n  Output[{i}]:")
-                    print(f"    Type: {item.type if hasattr(item, 'type') else 'N/A'}")
-                    print(f"    ID: {item.id if hasattr(item, 'id') else 'N/A'}")
-
-                    if hasattr(item, 'role'):
-                        print(f"    Role: {item.role}")
-
-                    if hasattr(item, 'content'):
-                        print(f"    Content: {item.content}")
-                        print(f"    Content length: {len(item.content) if item.content else 0}")
-
-                        if item.content:
-                            for j, content in enumerate(item.content):
-                                print(f"\n    Content[{j}]:")
-                                print(f"      Type: {content.type if hasattr(content, 'type') else 'N/A'}")
-                                if hasattr(content, 'text'):
-                                    print(f"      Text: '{content.text}'")
-                                    print(f"      Text length: {len(content.text)}")
-        else:
-            print(f"\n  ⚠️  No 'output' attribute")
-
-        # output_textプロパティ
-        if hasattr(response, 'output_text'):
-            try:
-                output_text = response.output_text
-                print(f"\n  output_text: '{output_text}'")
-                print(f"  output_text length: {len(output_text)}")
-            except Exception as e:
-                print(f"\n  ⚠️  Error accessing output_text: {e}")
-        else:
-            print(f"\n  ⚠️  No 'output_text' property")
+        # レスポンスは1回だけdictに変換し、以降はdictから参照
+        dump = response.model_dump(exclude_none=True)
+        output = dump.get('output', [])
+
+        print(f"\n✅ Response received!{' (cached)' if from_cache else ''}")
+        print(f"  Response ID: {dump.get('id')}")
+        print(f"  Status: {dump.get('status')}")
+        print(f"  Model: {dump.get('model')}")
+
+        # output配列（構造をそのまま表示）
+        print(f"\n  Output length: {len(output)}")
+        print(json.dumps(output, indent=2, ensure_ascii=False))
+
+        # output_textプロパティ（フィールドではないためmodel_dumpには含まれない）
+        try:
+            output_text = response.output_text
+            print(f"\n  output_text: '{output_text}'")
+            print(f"  output_text length: {len(output_text)}")
+        except Exception as e:
+            print(f"\n  ⚠️  Error accessing output_text: {e}")
 
         # usage
-        if hasattr(response, 'usage') and response.usage:
+        usage = dump.get('usage')
+        if usage:
             print(f"\n  Usage:")
-            print(f"    Total tokens: {response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 'N/A'}")
+            print(f"    Total tokens: {usage.get('total_tokens', 'N/A')}")
 
         return True
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Error: {e}")
         return False
 
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='GPT-5 models comparison test')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='OPENAI_TEST_CACHE=1 でもキャッシュを使わずAPIを呼び出す')
+    args = parser.parse_args()
+
     models = ['gpt-5-mini', 'gpt-5-nano']
-    results = {}
 
-    for model in models:
-        results[model] = test_model(model)
+    # レスポンスのディスクキャッシュ（OPENAI_TEST_CACHE=1 の場合のみ有効）
+    use_cache = os.getenv('OPENAI_TEST_CACHE') == '1' and not args.no_cache
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key or api_key.startswith('your_'):
+        print("❌ OPENAI_API_KEY not configured")
+        sys.exit(1)
+
+    # リクエストは並列に送信し、結果はモデル順に表示
+    responses = asyncio.run(request_models(api_key, models, use_cache))
+    results = {
+        model: report_model(model, response)
+        for model, response in zip(models, responses)
+    }
 
     print(f"\n{'=' * 70}")
     print("Summary:")
@@ -21,32 +21,35 @@ python test_monitor_startup.py
 import sys
 import logging
 from datetime import datetime
-import MetaTrader5 as mt5
 import os
-from dotenv import load_dotenv
+from src.utils.env_loader import ensure_env_loaded
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from src.monitoring.monitor_orchestrator import MonitorOrchestrator
+# 起動後に監視ループが動作し続けることを確認する時間（秒）
+OBSERVATION_SECONDS = 5
 
 
 def setup_logging():
     """ログ設定の初期化"""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        format='%(asctime)s [%(levelname)s] [%(threadName)s] %(name)s: %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
 
 def initialize_mt5():
     """MT5の初期化とログイン"""
+    import MetaTrader5 as mt5
+
     logger = logging.getLogger(__name__)
 
     # 環境変数の読み込み
-    load_dotenv()
+    ensure_env_loaded()
 
-    # MT5の初期化
-    if not mt5.initialize():
+    # MT5の初期化（初期化済みのセッションがあれば再利用）
+    if mt5.terminal_info() is None and not mt5.initialize():
         logger.error("MT5初期化失敗")
         return False
 
@@ -55,6 +58,12 @@ def initialize_mt5():
     password = os.getenv('MT5_PASSWORD')
     server = os.getenv('MT5_SERVER')
 
+    # 同じ口座にログイン済みの場合はログイン処理（数秒かかる）を省略
+    account = mt5.account_info()
+    if account is not None and account.login == login and account.server == server:
+        logger.info(f"MT5ログイン済みのセッションを再利用: {login}@{server}")
+        return True
+
     authorized = mt5.login(login=login, password=password, server=server)
     if not authorized:
         logger.error(f"MT5ログイン失敗: {mt5.last_error()}")
@@ -67,6 +76,8 @@ def initialize_mt5():
 
 def test_orchestrator_startup():
     """オーケストレーターの起動テスト"""
+    from src.monitoring.monitor_orchestrator import MonitorOrchestrator
+
     logger = logging.getLogger(__name__)
 
     logger.info("=" * 80)
@@ -89,20 +100,26 @@ def test_orchestrator_startup():
     logger.info("[成功] モニター起動完了")
     logger.info("")
 
-    # 10秒待機
-    logger.info("10秒間動作を確認...")
-    time.sleep(10)
+    # 監視ループの開始を待機（最大10秒）
+    logger.info("監視ループの開始を確認...")
+    if not orchestrator.wait_until_running(timeout=10):
+        logger.warning("10秒以内に開始しなかったLayerがあります")
+
+    # 初回の監視処理で停止しないことを確認するため、一定時間動作させる
+    logger.info(f"{OBSERVATION_SECONDS}秒間動作を確認...")
+    time.sleep(OBSERVATION_SECONDS)
 
     # ステータス確認
     logger.info("ステータス取得中...")
     status = orchestrator.get_status()
 
-    logger.info(f"Layer 1 Running: {status['layer1']['is_running']}")
-    logger.info(f"Layer 1 Thread: {status['layer1']['thread_alive']}")
-    logger.info(f"Layer 2 Running: {status['layer2']['is_running']}")
-    logger.info(f"Layer 2 Thread: {status['layer2']['thread_alive']}")
-    logger.info(f"Layer 3 Running: {status['layer3']['is_running']}")
-    logger.info(f"Layer 3 Thread: {status['layer3']['thread_alive']}")
+    layers = (status['layer1'], status['layer2'], status['layer3'])
+    running = tuple(layer['is_running'] for layer in layers)
+    alive = tuple(layer['thread_alive'] for layer in layers)
+
+    for i, (is_running, thread_alive) in enumerate(zip(running, alive), start=1):
+        logger.info(f"Layer {i} Running: {is_running}")
+        logger.info(f"Layer {i} Thread: {thread_alive}")
     logger.info("")
 
     # 停止
@@ -112,28 +129,19 @@ def test_orchestrator_startup():
     logger.info("")
 
     # 結果
-    all_started = (
-        status['layer1']['is_running'] and
-        status['layer2']['is_running'] and
-        status['layer3']['is_running']
-    )
-    all_threads_alive = (
-        status['layer1']['thread_alive'] and
-        status['layer2']['thread_alive'] and
-        status['layer3']['thread_alive']
-    )
-
-    if all_started and all_threads_alive:
+    if all(running) and all(alive):
         logger.info("[合格] 全モニターが正常に起動・動作しました")
     else:
         logger.error("[不合格] 一部のモニターが正常に動作していません")
 
     logger.info("")
-    return all_started and all_threads_alive
+    return all(running) and all(alive)
 
 
 def test_individual_layers():
     """個別Layer起動テスト"""
+    from src.monitoring.monitor_orchestrator import MonitorOrchestrator
+
     logger = logging.getLogger(__name__)
 
     logger.info("=" * 80)
@@ -141,54 +149,31 @@ def test_individual_layers():
     logger.info("=" * 80)
     logger.info("")
 
-    results = {}
-
-    # Layer 1のみ
-    logger.info("Layer 1のみ起動...")
-    orch1 = MonitorOrchestrator(
-        symbol='USDJPY',
-        enable_layer1=True,
-        enable_layer2=False,
-        enable_layer3=False
-    )
-    orch1.start_all()
-    time.sleep(3)
-    status1 = orch1.get_status()
-    results['layer1'] = status1['layer1']['is_running']
-    logger.info(f"Layer 1: {'[成功]' if results['layer1'] else '[失敗]'}")
-    orch1.stop_all()
-    logger.info("")
+    # 各Layerのみを有効にしたオーケストレーターを同時に起動し、
+    # 最大3秒の待機時間を共有する（各オーケストレーターは独立したスレッドで動作）
+    orchestrators = {}
+    for layer in ('layer1', 'layer2', 'layer3'):
+        logger.info(f"Layer {layer[-1]}のみ起動...")
+        orchestrators[layer] = MonitorOrchestrator(
+            symbol='USDJPY',
+            enable_layer1=(layer == 'layer1'),
+            enable_layer2=(layer == 'layer2'),
+            enable_layer3=(layer == 'layer3')
+        )
+        orchestrators[layer].start_all()
+
+    deadline = time.monotonic() + 3
+    for orch in orchestrators.values():
+        orch.wait_until_running(timeout=max(0.0, deadline - time.monotonic()))
 
-    # Layer 2のみ
-    logger.info("Layer 2のみ起動...")
-    orch2 = MonitorOrchestrator(
-        symbol='USDJPY',
-        enable_layer1=False,
-        enable_layer2=True,
-        enable_layer3=False
-    )
-    orch2.start_all()
-    time.sleep(3)
-    status2 = orch2.get_status()
-    results['layer2'] = status2['layer2']['is_running']
-    logger.info(f"Layer 2: {'[成功]' if results['layer2'] else '[失敗]'}")
-    orch2.stop_all()
-    logger.info("")
-
-    # Layer 3のみ
-    logger.info("Layer 3のみ起動...")
-    orch3 = MonitorOrchestrator(
-        symbol='USDJPY',
-        enable_layer1=False,
-        enable_layer2=False,
-        enable_layer3=True
-    )
-    orch3.start_all()
-    time.sleep(3)
-    status3 = orch3.get_status()
-    results['layer3'] = status3['layer3']['is_running']
-    logger.info(f"Layer 3: {'[成功]' if results['layer3'] else '[失敗]'}")
-    orch3.stop_all()
+    results = {}
+    try:
+        for layer, orch in orchestrators.items():
+            results[layer] = orch.get_status()[layer]['is_running']
+            logger.info(f"Layer {layer[-1]}: {'[成功]' if results[layer] else '[失敗]'}")
+    finally:
+        for orch in orchestrators.values():
+            orch.stop_all()
     logger.info("")
 
     # 結果
@@ -204,6 +189,8 @@ def test_individual_layers():
 
 def test_position_registration():
     """ポジション登録テスト"""
+    from src.monitoring.monitor_orchestrator import MonitorOrchestrator
+
     logger = logging.getLogger(__name__)
 
     logger.info("=" * 80)
@@ -213,7 +200,7 @@ def test_position_registration():
 
     orchestrator = MonitorOrchestrator(symbol='USDJPY')
     orchestrator.start_all()
-    time.sleep(2)
+    orchestrator.wait_until_running(timeout=2)
 
     # ダミーポジションを登録
     logger.info("ダミーポジションを登録...")
@@ -226,8 +213,7 @@ def test_position_registration():
     logger.info("[成功] ポジション登録完了")
     logger.info("")
 
-    # ステータス確認
-    time.sleep(2)
+    # ステータス確認（登録は同期的に反映される）
     status = orchestrator.get_status()
     logger.info(f"Layer 3 Tracked Positions: {status['layer3']['tracked_positions']}")
 
@@ -251,6 +237,8 @@ def test_position_registration():
 
 def main():
     """メインテスト処理"""
+    import MetaTrader5 as mt5
+
     setup_logging()
     logger = logging.getLogger(__name__)
 
@@ -268,15 +256,16 @@ def main():
 
     try:
         # テスト実行
-        results = {}
-
-        results['test1'] = test_orchestrator_startup()
-        time.sleep(2)
-
-        results['test2'] = test_individual_layers()
-        time.sleep(2)
-
-        results['test3'] = test_position_registration()
+        # 各テストは独立したオーケストレーターを使用するため並列に実行し、
+        # 起動待ち・ステータス確認の待機時間を重ねる（ログはスレッド名で区別）
+        tests = {
+            'test1': test_orchestrator_startup,
+            'test2': test_individual_layers,
+            'test3': test_position_registration,
+        }
+        with ThreadPoolExecutor(max_workers=len(tests), thread_name_prefix='monitor-test') as executor:
+            futures = {name: executor.submit(test) for name, test in tests.items()}
+        results = {name: future.result() for name, future in futures.items()}
 
         # 総合結果
         logger.info("=" * 80)
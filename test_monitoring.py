@@ -20,12 +20,8 @@ python test_monitoring.py
 
 import sys
 import logging
-from datetime import datetime
-import MetaTrader5 as mt5
 import os
-from dotenv import load_dotenv
-
-from src.monitoring.monitor_orchestrator import MonitorOrchestrator
+from src.utils.env_loader import ensure_env_loaded
 
 
 def setup_logging():
@@ -39,13 +35,15 @@ def setup_logging():
 
 def initialize_mt5():
     """MT5の初期化とログイン"""
+    import MetaTrader5 as mt5
+
     logger = logging.getLogger(__name__)
 
     # 環境変数の読み込み
-    load_dotenv()
+    ensure_env_loaded()
 
-    # MT5の初期化
-    if not mt5.initialize():
+    # MT5の初期化（初期化済みのセッションがあれば再利用）
+    if mt5.terminal_info() is None and not mt5.initialize():
         logger.error("MT5初期化失敗")
         return False
 
@@ -54,6 +52,12 @@ def initialize_mt5():
     password = os.getenv('MT5_PASSWORD')
     server = os.getenv('MT5_SERVER')
 
+    # 同じ口座にログイン済みの場合はログイン処理（数秒かかる）を省略
+    account = mt5.account_info()
+    if account is not None and account.login == login and account.server == server:
+        logger.info(f"MT5ログイン済みのセッションを再利用: {login}@{server}")
+        return True
+
     authorized = mt5.login(login=login, password=password, server=server)
     if not authorized:
         logger.error(f"MT5ログイン失敗: {mt5.last_error()}")
@@ -66,6 +70,8 @@ def initialize_mt5():
 
 def get_open_positions(symbol='USDJPY'):
     """オープンポジションを取得"""
+    import MetaTrader5 as mt5
+
     positions = mt5.positions_get(symbol=symbol)
     if positions is None:
         return []
@@ -78,7 +84,6 @@ def get_open_positions(symbol='USDJPY'):
             'price_open': pos.price_open,
             'price_current': pos.price_current,
             'profit': pos.profit,
-            'time': datetime.fromtimestamp(pos.time),
         }
         for pos in positions
     ]
@@ -86,6 +91,9 @@ def get_open_positions(symbol='USDJPY'):
 
 def main():
     """メインテスト処理"""
+    import MetaTrader5 as mt5
+    from src.monitoring.monitor_orchestrator import MonitorOrchestrator
+
     setup_logging()
     logger = logging.getLogger(__name__)
 
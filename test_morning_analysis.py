@@ -9,24 +9,42 @@
 
 import os
 import sys
+import io
 import json
+import hashlib
 import logging
 from datetime import datetime
-from dotenv import load_dotenv
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.utils.cache import cache_dir
+from src.utils.env_loader import ensure_env_loaded
+
 # 環境変数の読み込み
-load_dotenv()
+ensure_env_loaded()
 
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+logger = logging.getLogger(__name__)
+
+# 分析に使用するモデル
+MODEL = 'pro'
+
+
+def result_cache_path(market_data, review_result, past_statistics):
+    """入力データに対応する分析結果キャッシュのパス"""
+    payload = json.dumps(
+        {'model': MODEL, 'market_data': market_data,
+         'review_result': review_result, 'past_statistics': past_statistics},
+        sort_keys=True, ensure_ascii=False
+    )
+    key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir('morning_analysis'), f"{key}.json")
 
-from src.ai_analysis.ai_analyzer import AIAnalyzer
 
 def main():
     """メイン処理"""
@@ -153,129 +171,149 @@ def main():
     print(f"  過去5日統計: {past_statistics['last_5_days']['total_pips']}pips, 勝率{past_statistics['last_5_days']['win_rate']}")
     print()
 
-    # AIAnalyzer初期化（Gemini Pro使用）
-    print("AIAnalyzer初期化中...")
-    analyzer = AIAnalyzer(
-        symbol='USDJPY',
-        model='pro',
-        backtest_start_date='2024-09-01',
-        backtest_end_date='2024-09-30'
-    )
-    print("✓ 初期化完了")
-    print()
-
-    # 朝の詳細分析を実行
-    print("朝の詳細分析を実行中...")
-    print("（Gemini Pro APIを呼び出します。数秒かかる場合があります）")
-    print()
+    # 同じ入力での分析結果はディスクにキャッシュする（FORCE_LLM=1 で常にAPIを呼び出す）
+    cache_path = result_cache_path(market_data, review_result, past_statistics)
+    force_llm = os.getenv('FORCE_LLM') == '1'
 
     try:
-        strategy_result = analyzer.morning_analysis(
-            market_data=market_data,
-            review_result=review_result,
-            past_statistics=past_statistics
-        )
+        if not force_llm and os.path.exists(cache_path):
+            with open(cache_path, encoding='utf-8') as f:
+                strategy_result = json.load(f)
+            print(f"✓ キャッシュ済みの分析結果を使用します: {cache_path}")
+            print("（API呼び出し・データベース保存は行いません。再実行する場合は FORCE_LLM=1 を設定）")
+            print()
+        else:
+            from src.ai_analysis.ai_analyzer import AIAnalyzer
 
-        print("=" * 80)
-        print("分析結果")
-        print("=" * 80)
-        print()
+            # AIAnalyzer初期化（Gemini Pro使用）
+            print("AIAnalyzer初期化中...")
+            analyzer = AIAnalyzer(
+                symbol='USDJPY',
+                model=MODEL,
+                backtest_start_date='2024-09-01',
+                backtest_end_date='2024-09-30'
+            )
+            print("✓ 初期化完了")
+            print()
+
+            # 朝の詳細分析を実行
+            print("朝の詳細分析を実行中...")
+            print("（Gemini Pro APIを呼び出します。数秒かかる場合があります）")
+            print()
+
+            strategy_result = analyzer.morning_analysis(
+                market_data=market_data,
+                review_result=review_result,
+                past_statistics=past_statistics
+            )
+
+            # 分析エラー時のフォールバック結果（信頼度0）はキャッシュしない
+            if strategy_result.get('confidence', 0) > 0:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(strategy_result, f, ensure_ascii=False)
+
+        # 結果表示はバッファにまとめ、最後に一度だけ書き出す
+        out = io.StringIO()
+        print("=" * 80, file=out)
+        print("分析結果", file=out)
+        print("=" * 80, file=out)
+        print(file=out)
 
         # 基本情報
-        print(f"日次バイアス: {strategy_result.get('daily_bias', 'N/A')}")
-        print(f"信頼度: {strategy_result.get('confidence', 0):.2f}")
-        print()
+        print(f"日次バイアス: {strategy_result.get('daily_bias', 'N/A')}", file=out)
+        print(f"信頼度: {strategy_result.get('confidence', 0):.2f}", file=out)
+        print(file=out)
 
         # 判断理由
-        print("判断理由:")
-        print(f"  {strategy_result.get('reasoning', 'N/A')}")
-        print()
+        print("判断理由:", file=out)
+        print(f"  {strategy_result.get('reasoning', 'N/A')}", file=out)
+        print(file=out)
 
         # 市場環境
         env = strategy_result.get('market_environment', {})
-        print("市場環境:")
-        print(f"  トレンド: {env.get('trend', 'N/A')}")
-        print(f"  強度: {env.get('strength', 'N/A')}")
-        print(f"  フェーズ: {env.get('phase', 'N/A')}")
-        print()
+        print("市場環境:", file=out)
+        print(f"  トレンド: {env.get('trend', 'N/A')}", file=out)
+        print(f"  強度: {env.get('strength', 'N/A')}", file=out)
+        print(f"  フェーズ: {env.get('phase', 'N/A')}", file=out)
+        print(file=out)
 
         # エントリー条件
         entry = strategy_result.get('entry_conditions', {})
-        print("エントリー条件:")
-        print(f"  取引すべきか: {entry.get('should_trade', False)}")
-        print(f"  方向: {entry.get('direction', 'N/A')}")
+        print("エントリー条件:", file=out)
+        print(f"  取引すべきか: {entry.get('should_trade', False)}", file=out)
+        print(f"  方向: {entry.get('direction', 'N/A')}", file=out)
         price_zone = entry.get('price_zone', {})
-        print(f"  価格ゾーン: {price_zone.get('min', 0):.2f} ~ {price_zone.get('max', 0):.2f}")
-        print(f"  必須シグナル: {len(entry.get('required_signals', []))}個")
+        print(f"  価格ゾーン: {price_zone.get('min', 0):.2f} ~ {price_zone.get('max', 0):.2f}", file=out)
+        print(f"  必須シグナル: {len(entry.get('required_signals', []))}個", file=out)
         for i, signal in enumerate(entry.get('required_signals', []), 1):
-            print(f"    {i}. {signal}")
-        print()
+            print(f"    {i}. {signal}", file=out)
+        print(file=out)
 
         # 決済戦略
         exit_strat = strategy_result.get('exit_strategy', {})
-        print("決済戦略:")
+        print("決済戦略:", file=out)
         tp_levels = exit_strat.get('take_profit', [])
-        print(f"  利確レベル: {len(tp_levels)}段階")
+        print(f"  利確レベル: {len(tp_levels)}段階", file=out)
         for level in tp_levels:
-            print(f"    +{level.get('pips', 0)}pips: {level.get('close_percent', 0)}%決済 ({level.get('reason', '')})")
-        print()
+            print(f"    +{level.get('pips', 0)}pips: {level.get('close_percent', 0)}%決済 ({level.get('reason', '')})", file=out)
+        print(file=out)
 
         # リスク管理
         risk = strategy_result.get('risk_management', {})
-        print("リスク管理:")
-        print(f"  ポジションサイズ倍率: {risk.get('position_size_multiplier', 1.0):.2f}")
-        print(f"  最大ポジション数: {risk.get('max_positions', 1)}")
-        print(f"  理由: {risk.get('reason', 'N/A')}")
-        print()
+        print("リスク管理:", file=out)
+        print(f"  ポジションサイズ倍率: {risk.get('position_size_multiplier', 1.0):.2f}", file=out)
+        print(f"  最大ポジション数: {risk.get('max_positions', 1)}", file=out)
+        print(f"  理由: {risk.get('reason', 'N/A')}", file=out)
+        print(file=out)
 
         # 重要レベル
         levels = strategy_result.get('key_levels', {})
-        print("重要価格レベル:")
-        print(f"  エントリー目標: {levels.get('entry_target', 'N/A')}")
-        print(f"  無効化レベル: {levels.get('invalidation_level', 'N/A')}")
-        print(f"  重要サポート: {levels.get('critical_support', 'N/A')}")
-        print(f"  重要レジスタンス: {levels.get('critical_resistance', 'N/A')}")
-        print()
+        print("重要価格レベル:", file=out)
+        print(f"  エントリー目標: {levels.get('entry_target', 'N/A')}", file=out)
+        print(f"  無効化レベル: {levels.get('invalidation_level', 'N/A')}", file=out)
+        print(f"  重要サポート: {levels.get('critical_support', 'N/A')}", file=out)
+        print(f"  重要レジスタンス: {levels.get('critical_resistance', 'N/A')}", file=out)
+        print(file=out)
 
         # 教訓の適用
         lessons = strategy_result.get('lessons_applied', [])
-        print(f"適用された教訓: {len(lessons)}個")
+        print(f"適用された教訓: {len(lessons)}個", file=out)
         for i, lesson in enumerate(lessons, 1):
-            print(f"  {i}. {lesson}")
-        print()
+            print(f"  {i}. {lesson}", file=out)
+        print(file=out)
 
         # JSON出力
-        print("=" * 80)
-        print("完全なJSON結果")
-        print("=" * 80)
-        print(json.dumps(strategy_result, ensure_ascii=False, indent=2))
-        print()
+        print("=" * 80, file=out)
+        print("完全なJSON結果", file=out)
+        print("=" * 80, file=out)
+        print(json.dumps(strategy_result, ensure_ascii=False, indent=2), file=out)
+        print(file=out)
 
         # データベース確認
-        print("=" * 80)
-        print("データベース確認")
-        print("=" * 80)
-        print("以下のコマンドで保存されたデータを確認できます:")
-        print()
-        print("  psql -U postgres -d fx_autotrade")
-        print("  SELECT strategy_date, symbol, daily_bias, confidence")
-        print("    FROM backtest_daily_strategies")
-        print("    ORDER BY created_at DESC")
-        print("    LIMIT 1;")
-        print()
+        print("=" * 80, file=out)
+        print("データベース確認", file=out)
+        print("=" * 80, file=out)
+        print("以下のコマンドで保存されたデータを確認できます:", file=out)
+        print(file=out)
+        print("  psql -U postgres -d fx_autotrade", file=out)
+        print("  SELECT strategy_date, symbol, daily_bias, confidence", file=out)
+        print("    FROM backtest_daily_strategies", file=out)
+        print("    ORDER BY created_at DESC", file=out)
+        print("    LIMIT 1;", file=out)
+        print(file=out)
 
-        print("=" * 80)
-        print("テスト完了")
-        print("=" * 80)
+        print("=" * 80, file=out)
+        print("テスト完了", file=out)
+        print("=" * 80, file=out)
+        sys.stdout.write(out.getvalue())
 
     except Exception as e:
         print()
         print("=" * 80)
         print("エラーが発生しました")
         print("=" * 80)
-        print(f"エラー: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"エラー: {e}")
         return 1
 
     return 0
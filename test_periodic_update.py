@@ -11,25 +11,28 @@ import os
 import sys
 import json
 import logging
-from datetime import datetime
-from dotenv import load_dotenv
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# 環境変数の読み込み
-load_dotenv()
+from src.utils.env_loader import ensure_env_loaded
 
-# ログ設定
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+logger = logging.getLogger(__name__)
+
+
+def _bootstrap():
+    """環境変数の読み込みとログ設定（スクリプト実行時のみ）"""
+    ensure_env_loaded()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 
-from src.ai_analysis.ai_analyzer import AIAnalyzer
 
 def main():
     """メイン処理"""
+    from src.ai_analysis.ai_analyzer import AIAnalyzer
+
     print("=" * 80)
     print("定期更新テスト（periodic_update）")
     print("=" * 80)
@@ -274,7 +277,7 @@ def main():
         print("=" * 80)
         print("完全なJSON結果")
         print("=" * 80)
-        print(json.dumps(update_result, ensure_ascii=False, indent=2))
+        print(json.dumps(update_result, ensure_ascii=False, indent=2, default=str))
         print()
 
         # データベース確認
@@ -299,13 +302,12 @@ def main():
         print("=" * 80)
         print("エラーが発生しました")
         print("=" * 80)
-        print(f"エラー: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"エラー: {e}")
         return 1
 
     return 0
 
 
 if __name__ == '__main__':
+    _bootstrap()
     exit(main())
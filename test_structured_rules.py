@@ -6,24 +6,39 @@
 
 【使用方法】
 python test_structured_rules.py
+python test_structured_rules.py --seq  # 各テストを順番に実行
 
 【テスト内容】
 1. エントリー条件のチェック（価格ゾーン、RSI、EMA、MACD）
 2. 決済条件のチェック（TP、SL、インジケーター決済）
 3. 時間フィルターのチェック
+4. エントリー条件の一括チェック（単体チェックとの結果一致）
 
 【作成日】2025-01-15
 """
 
 from src.rule_engine import StructuredRuleEngine
+import io
 import json
+import time
+import argparse
+import contextlib
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# 区切り線
+SEPARATOR = "=" * 80
+SUB_SEPARATOR = "-" * 80
 
 
 def test_entry_conditions():
     """エントリー条件のテスト"""
-    print("=" * 80)
+    print(SEPARATOR)
     print("エントリー条件テスト")
-    print("=" * 80)
+    print(SEPARATOR)
 
     engine = StructuredRuleEngine()
 
@@ -104,11 +119,13 @@ def test_entry_conditions():
         print(f"  ❌ エントリー不可: {message}")
 
     # 失敗ケースのテスト
-    print("\n" + "-" * 80)
+    print("\n" + SUB_SEPARATOR)
     print("【失敗ケース1: RSIが範囲外】")
-    market_data_fail = market_data.copy()
-    market_data_fail['M15'] = market_data['M15'].copy()
-    market_data_fail['M15']['rsi'] = 75  # 70を超える
+    # 変更する値だけを上書きレイヤーに持ち、元の市場データは共有する
+    market_data_fail = ChainMap(
+        {'M15': ChainMap({'rsi': 75}, market_data['M15'])},  # 70を超える
+        market_data
+    )
 
     is_valid, message = engine.check_entry_conditions(market_data_fail, rule)
     print(f"  RSI: {market_data_fail['M15']['rsi']}")
@@ -117,10 +134,9 @@ def test_entry_conditions():
     else:
         print(f"  ❌ エントリー不可: {message}")
 
-    print("\n" + "-" * 80)
+    print("\n" + SUB_SEPARATOR)
     print("【失敗ケース2: 価格がゾーン外】")
-    market_data_fail2 = market_data.copy()
-    market_data_fail2['current_price'] = 149.70  # 149.65を超える
+    market_data_fail2 = ChainMap({'current_price': 149.70}, market_data)  # 149.65を超える
 
     is_valid, message = engine.check_entry_conditions(market_data_fail2, rule)
     print(f"  価格: {market_data_fail2['current_price']}")
@@ -132,9 +148,9 @@ def test_entry_conditions():
 
 def test_exit_conditions():
     """決済条件のテスト"""
-    print("\n\n" + "=" * 80)
+    print("\n\n" + SEPARATOR)
     print("決済条件テスト")
-    print("=" * 80)
+    print(SEPARATOR)
 
     engine = StructuredRuleEngine()
 
@@ -204,17 +220,110 @@ def test_exit_conditions():
         print(f"  ❌ 保有継続: {reason}")
 
 
+def test_entry_conditions_batch():
+    """エントリー条件の一括チェックのテスト"""
+    print("\n\n" + SEPARATOR)
+    print("エントリー条件 一括チェックテスト")
+    print(SEPARATOR)
+
+    engine = StructuredRuleEngine()
+
+    # ランダムな市場データ（1行=1時点）
+    n = 100_000
+    rng = np.random.default_rng(0)
+    price = rng.uniform(149.40, 149.70, n)
+    market_df = pd.DataFrame({
+        'current_price': price,
+        'spread': rng.uniform(0.5, 12.0, n),
+        'current_time': [f"{h:02d}:{m:02d}" for h, m in zip(rng.integers(0, 24, n), rng.integers(0, 60, n))],
+        'M15_rsi': rng.uniform(30, 80, n),
+        'M15_ema_20': price + rng.normal(0, 0.05, n),
+        'M15_macd_histogram': rng.normal(0, 0.05, n),
+    })
+
+    rule = {
+        'entry_conditions': {
+            'should_trade': True,
+            'direction': 'BUY',
+            'price_zone': {'min': 149.50, 'max': 149.65},
+            'indicators': {
+                'rsi': {'timeframe': 'M15', 'min': 50, 'max': 70},
+                'ema': {'timeframe': 'M15', 'condition': 'price_above', 'period': 20},
+                'macd': {'timeframe': 'M15', 'condition': 'histogram_positive'}
+            },
+            'spread': {'max_pips': 10},
+            'time_filter': {
+                'avoid_times': [
+                    {'start': '09:50', 'end': '10:00', 'reason': 'Tokyo fixing'},
+                    {'start': '23:30', 'end': '00:30', 'reason': 'Rollover'}
+                ]
+            }
+        }
+    }
+
+    start = time.perf_counter()
+    mask = engine.check_entry_conditions_batch(market_df, rule)
+    batch_sec = time.perf_counter() - start
+
+    # 先頭の一部の行を単体チェックと比較
+    sample = 2_000
+    start = time.perf_counter()
+    expected = []
+    for row in market_df.head(sample).itertuples(index=False):
+        market_data = {
+            'current_price': row.current_price,
+            'spread': row.spread,
+            'current_time': row.current_time,
+            'M15': {
+                'rsi': row.M15_rsi,
+                'ema_20': row.M15_ema_20,
+                'macd_histogram': row.M15_macd_histogram,
+            }
+        }
+        expected.append(engine.check_entry_conditions(market_data, rule)[0])
+    single_sec = time.perf_counter() - start
+
+    mismatches = int(np.count_nonzero(mask[:sample] != np.array(expected)))
+
+    print(f"\n【一括チェック】 {n:,}行: {batch_sec * 1000:.1f}ms（エントリー可能: {int(mask.sum()):,}行）")
+    print(f"【単体チェック】 {sample:,}行: {single_sec * 1000:.1f}ms")
+    if mismatches == 0:
+        print(f"  ✅ 単体チェックと一致（{sample:,}行）")
+    else:
+        print(f"  ❌ 単体チェックと不一致: {mismatches}行")
+
+
+def _run_captured(test):
+    """テストを実行し、標準出力をまとめて返す（プロセスプール用）"""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        test()
+    return buf.getvalue()
+
+
 def main():
     """メイン処理"""
+    parser = argparse.ArgumentParser(description='構造化トレードルールエンジン テスト')
+    parser.add_argument('--seq', action='store_true', help='各テストを並列化せず順番に実行')
+    args = parser.parse_args()
+
     print("\n構造化トレードルールエンジン テスト")
-    print("=" * 80)
+    print(SEPARATOR)
 
-    test_entry_conditions()
-    test_exit_conditions()
+    tests = [test_entry_conditions, test_exit_conditions, test_entry_conditions_batch]
+    if args.seq:
+        for test in tests:
+            test()
+    else:
+        # 各テストは独立しているため別プロセスで並列に実行し、
+        # 出力はテストごとにまとめて元の順序で表示する
+        with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+            for output in executor.map(_run_captured, tests):
+                print(output, end='')
 
-    print("\n" + "=" * 80)
+    print("\n" + SEPARATOR)
     print("テスト完了")
-    print("=" * 80)
+    print(SEPARATOR)
 
 
 if __name__ == '__main__':
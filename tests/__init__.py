@@ -11,6 +11,7 @@ FX自動トレードシステムの全モジュールに対するユニットテ
 統合テストを含むパッケージです。
 
 【テストファイル構成】
+- conftest.py: 複数モジュールで共有するフィクスチャ
 - test_tick_loader.py: ティックデータローダーのテスト
 - test_timeframe_converter.py: 時間足変換のテスト（今後実装）
 - test_technical_indicators.py: テクニカル指標計算のテスト（今後実装）
@@ -24,6 +25,9 @@ FX自動トレードシステムの全モジュールに対するユニットテ
 特定のテスト実行:
     pytest tests/test_tick_loader.py -v
 
+並列実行（pytest-xdist、CPUコア数のワーカーで分散）:
+    pytest tests/ -n auto
+
 カバレッジ付き実行:
     pytest tests/ --cov=src --cov-report=html
 """
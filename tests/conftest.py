@@ -0,0 +1,228 @@
+"""
+========================================
+テスト共通フィクスチャ
+========================================
+
+ファイル名: conftest.py
+パス: tests/conftest.py
+
+【概要】
+複数のテストモジュールで共有するpytestフィクスチャを定義します。
+読み取り専用のデータや生成コストの高いオブジェクトは
+スコープを広げて1回だけ作成し、各テストで再利用します。
+
+【フィクスチャ一覧】
+AI分析:
+- _patch_genai: google.generativeaiのパッチ（テストクラスごとに1回）
+- _reset_genai_mocks: 共有モックのテストごとのリセット
+- mock_env: GEMINI_API_KEYのモック（テストクラスごとに1回）
+- client: テストごとのGeminiClient（共有インスタンスのシャローコピー）
+- sample_market_data: サンプルマーケットデータ
+
+ティックデータ:
+- sample_tick_data: サンプルティックデータ（MT5フォーマット）
+- temp_zip_file: 一時zipファイル（間接パラメータで通貨ペア・年月を指定可能）
+- loaded_ticks: 一時zipファイルから読み込んだティックデータ
+
+google.generativeaiのパッチは自動適用されないため、使用するモジュールで
+pytestmark = pytest.mark.usefixtures('_patch_genai', '_reset_genai_mocks')
+を指定してください。
+
+【作成日】2025-10-22
+"""
+
+import csv
+import copy
+import io
+import os
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from src.data_processing.tick_loader import TickDataLoader
+
+# 一時zipファイルのデフォルトの（通貨ペア, 年, 月）
+DEFAULT_ZIP_PARAMS = ('USDJPY', 2024, 9)
+
+
+# ========================================
+# AI分析
+# ========================================
+
+@pytest.fixture(scope="class")
+def _patch_genai(request):
+    """
+    google.generativeaiのパッチをテストクラスごとに1回だけ適用
+
+    モックはテストクラスの属性（mock_configure, mock_model）から参照できます。
+    """
+    with patch('google.generativeai.configure') as mock_configure, \
+            patch('google.generativeai.GenerativeModel') as mock_model:
+        if request.cls is not None:
+            request.cls.mock_configure = mock_configure
+            request.cls.mock_model = mock_model
+        yield mock_configure, mock_model
+
+
+@pytest.fixture
+def _reset_genai_mocks(_patch_genai):
+    """共有モックの呼び出し履歴・戻り値設定をテストごとにリセット"""
+    for mock in _patch_genai:
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="class")
+def mock_env():
+    """環境変数をモック（クラス内で1回だけ適用）"""
+    with patch.dict(os.environ, {'GEMINI_API_KEY': 'test_api_key'}):
+        yield
+
+
+@pytest.fixture(scope="class")
+def _client_template(_patch_genai, mock_env):
+    """テストで共有するGeminiClient（クラス内で1回だけ生成）"""
+    # AI分析を使わないテストモジュールの収集時にgoogle.generativeaiを読み込まないよう遅延import
+    from src.ai_analysis.gemini_client import GeminiClient
+
+    return GeminiClient()
+
+
+@pytest.fixture
+def client(_client_template):
+    """テストごとのGeminiClient（共有インスタンスのシャローコピー）"""
+    return copy.copy(_client_template)
+
+
+@pytest.fixture(scope="session")
+def sample_market_data():
+    """テスト用のサンプルマーケットデータ（読み取り専用のためセッション内で共有）"""
+    return {
+        'timestamp': '2024-09-01T10:00:00',
+        'symbol': 'USDJPY',
+        'timeframes': {
+            'H1': {
+                'current': {
+                    'open': 145.120,
+                    'high': 145.150,
+                    'low': 145.100,
+                    'close': 145.140,
+                    'volume': 1000
+                },
+                'change_pct': 0.15
+            }
+        },
+        'technical_indicators': {
+            'ema': {
+                'short': 145.130,
+                'long': 145.100,
+                'trend': 'up'
+            },
+            'rsi': {
+                'value': 55.0,
+                'condition': 'neutral'
+            }
+        }
+    }
+
+
+# ========================================
+# ティックデータ
+# ========================================
+
+@pytest.fixture(scope="session")
+def sample_tick_data():
+    """
+    テスト用のサンプルティックデータを生成（実際のMT5フォーマット）
+
+    Returns:
+        list: サンプルティックデータのリスト（TSV形式）
+    """
+    return [
+        {
+            '<DATE>': '2024.09.01',
+            '<TIME>': '00:00:00.000',
+            '<BID>': '145.123',
+            '<ASK>': '145.125',
+            '<LAST>': '',
+            '<VOLUME>': '100'
+        },
+        {
+            '<DATE>': '2024.09.01',
+            '<TIME>': '00:00:01.000',
+            '<BID>': '145.124',
+            '<ASK>': '145.126',
+            '<LAST>': '',
+            '<VOLUME>': '150'
+        },
+        {
+            '<DATE>': '2024.09.01',
+            '<TIME>': '00:00:02.000',
+            '<BID>': '145.125',
+            '<ASK>': '145.127',
+            '<LAST>': '',
+            '<VOLUME>': '200'
+        }
+    ]
+
+
+@pytest.fixture(scope="session")
+def temp_zip_file(request, sample_tick_data, tmp_path_factory):
+    """
+    テスト用の一時zipファイルを作成（読み取り専用のためセッション内で1回だけ作成）
+
+    通貨ペア・年月は間接パラメータで変更できます（省略時はDEFAULT_ZIP_PARAMS）。
+    pytestはパラメータごとにフィクスチャをキャッシュするため、
+    同じ組み合わせのzipは1回だけ作成されます。
+
+        @pytest.mark.parametrize("temp_zip_file", [("EURUSD", 2024, 8)], indirect=True)
+
+    Args:
+        request: pytestのリクエスト（request.param: (通貨ペア, 年, 月)）
+        sample_tick_data: サンプルデータ
+        tmp_path_factory: pytestが提供する一時ディレクトリのファクトリ
+
+    Returns:
+        tuple: (zipファイルパス, データディレクトリ)
+    """
+    symbol, year, month = getattr(request, 'param', DEFAULT_ZIP_PARAMS)
+
+    # 一時ディレクトリ構造を作成
+    data_dir = tmp_path_factory.mktemp("tick_fixture") / "data" / "tick_data"
+    symbol_dir = data_dir / symbol
+    symbol_dir.mkdir(parents=True)
+
+    # CSVファイル名とzipファイル名
+    csv_filename = f"ticks_{symbol}-oj5k_{year:04d}-{month:02d}.csv"
+    zip_filename = f"ticks_{symbol}-oj5k_{year:04d}-{month:02d}.zip"
+    zip_path = symbol_dir / zip_filename
+
+    # CSVをメモリ上で作成（TSV形式、タブ区切り）
+    buf = io.StringIO()
+    fieldnames = ['<DATE>', '<TIME>', '<BID>', '<ASK>', '<LAST>', '<VOLUME>']
+    writer = csv.DictWriter(buf, fieldnames=fieldnames, delimiter='\t')
+    writer.writeheader()
+    writer.writerows(sample_tick_data)
+
+    # zipファイルに直接書き込む（一時CSVファイルは作成しない）
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+        zipf.writestr(csv_filename, buf.getvalue())
+
+    return str(zip_path), str(data_dir)
+
+
+@pytest.fixture(scope="session")
+def loaded_ticks(temp_zip_file):
+    """
+    一時zipファイルから読み込んだティックデータ（セッション内で1回だけ読み込み）
+
+    デフォルトの通貨ペア・年月（DEFAULT_ZIP_PARAMS）のzipを読み込みます。
+
+    Args:
+        temp_zip_file: 一時zipファイル
+
+    Returns:
+        list: 読み込んだティックデータのリスト（読み取り専用として使用）
+    """
+    zip_path, data_dir = temp_zip_file
+    return TickDataLoader(data_dir=data_dir).load_from_zip(*DEFAULT_ZIP_PARAMS)
@@ -21,6 +21,9 @@ GeminiClientとAIAnalyzerクラスの機能をテストするユニットテス
 個別実行:
     pytest tests/test_ai_analyzer.py -v
 
+並列実行:
+    pytest tests/test_ai_analyzer.py -n auto
+
 カバレッジ付き:
     pytest tests/test_ai_analyzer.py --cov=src.ai_analysis -v
 
@@ -33,6 +36,7 @@ GeminiClientとAIAnalyzerクラスの機能をテストするユニットテス
 
 import pytest
 import os
+import copy
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 import json
@@ -41,49 +45,56 @@ from src.ai_analysis.gemini_client import GeminiClient
 from src.ai_analysis.ai_analyzer import AIAnalyzer
 
 
-class TestGeminiClient:
-    """GeminiClientクラスのテストケース"""
+# google.generativeaiのパッチ（tests/conftest.py）を全テストに適用
+pytestmark = pytest.mark.usefixtures('_patch_genai', '_reset_genai_mocks')
 
-    @pytest.fixture
-    def mock_env(self):
-        """環境変数をモック"""
-        with patch.dict(os.environ, {'GEMINI_API_KEY': 'test_api_key'}):
-            yield
 
-    @pytest.fixture
-    def sample_market_data(self):
-        """テスト用のサンプルマーケットデータ"""
-        return {
-            'timestamp': '2024-09-01T10:00:00',
-            'symbol': 'USDJPY',
-            'timeframes': {
-                'H1': {
-                    'current': {
-                        'open': 145.120,
-                        'high': 145.150,
-                        'low': 145.100,
-                        'close': 145.140,
-                        'volume': 1000
-                    },
-                    'change_pct': 0.15
-                }
-            },
-            'technical_indicators': {
-                'ema': {
-                    'short': 145.130,
-                    'long': 145.100,
-                    'trend': 'up'
-                },
-                'rsi': {
-                    'value': 55.0,
-                    'condition': 'neutral'
-                }
-            }
-        }
+class FakeCursor:
+    """psycopg2カーソルの最小限の代替（実行したクエリを記録）"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """psycopg2接続の最小限の代替（Mockを使わずにDB呼び出しを記録）"""
+
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_db():
+    """psycopg2.connectをFakeConnectionを返す関数に差し替え"""
+    conn = FakeConnection()
+    with patch('src.ai_analysis.ai_analyzer.psycopg2.connect', lambda *args, **kwargs: conn):
+        yield conn
+
+
+class TestGeminiClient:
+    """
+    GeminiClientクラスのテストケース
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_client_initialization(self, mock_model, mock_configure, mock_env):
+    mock_env, client, sample_market_data は tests/conftest.py で定義
+    """
+
+    def test_client_initialization(self, mock_env):
         """
         GeminiClientの初期化テスト
 
@@ -98,7 +109,7 @@ class TestGeminiClient:
         assert client.model_pro is not None
         assert client.model_flash is not None
         assert client.model_flash_lite is not None
-        mock_configure.assert_called_once_with(api_key='test_api_key')
+        self.mock_configure.assert_called_once_with(api_key='test_api_key')
 
     def test_client_initialization_no_api_key(self):
         """
@@ -113,9 +124,7 @@ class TestGeminiClient:
 
             assert 'GEMINI_API_KEY' in str(exc_info.value)
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_build_analysis_prompt(self, mock_model, mock_configure, mock_env, sample_market_data):
+    def test_build_analysis_prompt(self, client, sample_market_data):
         """
         分析プロンプト構築テスト
 
@@ -123,7 +132,6 @@ class TestGeminiClient:
         - プロンプトが正しく構築されるか
         - マーケットデータがJSON形式で含まれるか
         """
-        client = GeminiClient()
         prompt = client._build_analysis_prompt(sample_market_data)
 
         assert isinstance(prompt, str)
@@ -131,83 +139,68 @@ class TestGeminiClient:
         assert 'BUY/SELL/HOLD' in prompt
         assert 'technical_indicators' in prompt.lower()
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_parse_response_valid_json(self, mock_model, mock_configure, mock_env):
-        """
-        正常なJSONレスポンスのパーステスト
-
-        【確認内容】
-        - 正しいJSON形式がパースされるか
-        - 必須フィールドが含まれるか
-        """
-        client = GeminiClient()
-
-        valid_response = """
-        ```json
-        {
-            "action": "BUY",
-            "confidence": 75,
-            "reasoning": "Strong uptrend detected"
-        }
-        ```
-        """
-
-        result = client._parse_response(valid_response)
-
-        assert result['action'] == 'BUY'
-        assert result['confidence'] == 75
-        assert 'reasoning' in result
-
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_parse_response_invalid_action(self, mock_model, mock_configure, mock_env):
-        """
-        無効なactionのレスポンステスト
-
-        【確認内容】
-        - 無効なactionが処理されるか
-        - HOLDにフォールバックするか
-        """
-        client = GeminiClient()
-
-        invalid_response = """
-        ```json
-        {
-            "action": "INVALID_ACTION",
-            "confidence": 50
-        }
-        ```
-        """
-
-        result = client._parse_response(invalid_response)
-
-        assert result['action'] == 'HOLD'
-        assert result['confidence'] == 0
-
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_parse_response_no_json(self, mock_model, mock_configure, mock_env):
+    @pytest.mark.parametrize("response,expected_action,expected_confidence,expected_reasoning", [
+        pytest.param(
+            """
+            ```json
+            {
+                "action": "BUY",
+                "confidence": 75,
+                "reasoning": "Strong uptrend detected"
+            }
+            ```
+            """,
+            'BUY', 75, '',
+            id='valid_json'
+        ),
+        pytest.param(
+            """
+            ```json
+            {
+                "action": "INVALID_ACTION",
+                "confidence": 50
+            }
+            ```
+            """,
+            'HOLD', 0, None,
+            id='invalid_action'
+        ),
+        pytest.param(
+            "This is just a plain text response without any JSON.",
+            'HOLD', 0, 'Failed to parse',
+            id='no_json'
+        ),
+    ])
+    def test_parse_response(
+        self,
+        client,
+        response,
+        expected_action,
+        expected_confidence,
+        expected_reasoning
+    ):
         """
-        JSON形式が含まれないレスポンステスト
+        レスポンスのパーステスト
 
         【確認内容】
-        - JSON形式がない場合にエラーハンドリングされるか
-        - HOLDが返されるか
+        - 正しいJSON形式がパースされ、必須フィールドが含まれるか
+        - 無効なactionの場合にHOLDにフォールバックするか
+        - JSON形式がない場合にエラーハンドリングされ、HOLDが返されるか
         """
-        client = GeminiClient()
-
-        no_json_response = "This is just a plain text response without any JSON."
-
-        result = client._parse_response(no_json_response)
-
-        assert result['action'] == 'HOLD'
-        assert result['confidence'] == 0
-        assert 'Failed to parse' in result['reasoning']
-
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_select_model(self, mock_model, mock_configure, mock_env):
+        result = client._parse_response(response)
+
+        assert result['action'] == expected_action
+        assert result['confidence'] == expected_confidence
+        if expected_reasoning is not None:
+            assert expected_reasoning in result['reasoning']
+
+    @pytest.mark.parametrize("model_name,expected_attr", [
+        ('pro', 'model_pro'),
+        ('flash', 'model_flash'),
+        ('flash-lite', 'model_flash_lite'),
+        ('unknown', 'model_flash'),  # 不明なモデル名の場合はflash
+    ])
+    def test_select_model(self, client, model_name, expected_attr):
         """
         モデル選択テスト
 
@@ -215,19 +208,9 @@ class TestGeminiClient:
         - 各モデルが正しく選択されるか
         - 不明なモデル名の場合はflashが選択されるか
         """
-        client = GeminiClient()
-
-        # 各モデルの選択確認
-        assert client._select_model('pro') == client.model_pro
-        assert client._select_model('flash') == client.model_flash
-        assert client._select_model('flash-lite') == client.model_flash_lite
-
-        # 不明なモデル名の場合
-        assert client._select_model('unknown') == client.model_flash
+        assert client._select_model(model_name) is getattr(client, expected_attr)
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_analyze_market_success(self, mock_model_class, mock_configure, mock_env, sample_market_data):
+    def test_analyze_market_success(self, client, sample_market_data):
         """
         マーケット分析成功テスト
 
@@ -249,9 +232,6 @@ class TestGeminiClient:
 
         mock_model_instance = Mock()
         mock_model_instance.generate_content.return_value = mock_response
-        mock_model_class.return_value = mock_model_instance
-
-        client = GeminiClient()
         client.model_flash = mock_model_instance
 
         result = client.analyze_market(sample_market_data, model='flash')
@@ -260,9 +240,7 @@ class TestGeminiClient:
         assert result['confidence'] == 80
         mock_model_instance.generate_content.assert_called_once()
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    def test_analyze_market_api_error(self, mock_model_class, mock_configure, mock_env, sample_market_data):
+    def test_analyze_market_api_error(self, client, sample_market_data):
         """
         API呼び出しエラー時のテスト
 
@@ -273,9 +251,6 @@ class TestGeminiClient:
         # エラーを発生させるモックの設定
         mock_model_instance = Mock()
         mock_model_instance.generate_content.side_effect = Exception("API Error")
-        mock_model_class.return_value = mock_model_instance
-
-        client = GeminiClient()
         client.model_flash = mock_model_instance
 
         result = client.analyze_market(sample_market_data, model='flash')
@@ -288,9 +263,10 @@ class TestGeminiClient:
 class TestAIAnalyzer:
     """AIAnalyzerクラスのテストケース"""
 
-    @pytest.fixture
-    def mock_env_full(self):
-        """完全な環境変数をモック"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_env_full(cls):
+        """完全な環境変数をモック（クラス内で1回だけ適用）"""
         with patch.dict(os.environ, {
             'GEMINI_API_KEY': 'test_api_key',
             'DB_HOST': 'localhost',
@@ -301,8 +277,17 @@ class TestAIAnalyzer:
         }):
             yield
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
+    @pytest.fixture(scope="class")
+    @classmethod
+    def _analyzer_template(cls, mock_env_full):
+        """テストで共有するAIAnalyzer（クラス内で1回だけ生成）"""
+        return AIAnalyzer()
+
+    @pytest.fixture
+    def analyzer(self, _analyzer_template):
+        """テストごとのAIAnalyzer（共有インスタンスのシャローコピー）"""
+        return copy.copy(_analyzer_template)
+
     @patch('src.ai_analysis.ai_analyzer.TickDataLoader')
     @patch('src.ai_analysis.ai_analyzer.TimeframeConverter')
     @patch('src.ai_analysis.ai_analyzer.TechnicalIndicators')
@@ -313,8 +298,6 @@ class TestAIAnalyzer:
         mock_indicators,
         mock_converter,
         mock_loader,
-        mock_model,
-        mock_configure,
         mock_env_full
     ):
         """
@@ -334,10 +317,7 @@ class TestAIAnalyzer:
         assert analyzer.data_standardizer is not None
         assert analyzer.gemini_client is not None
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    @patch('src.ai_analysis.ai_analyzer.psycopg2.connect')
-    def test_create_error_result(self, mock_connect, mock_model, mock_configure, mock_env_full):
+    def test_create_error_result(self, analyzer):
         """
         エラー結果作成テスト
 
@@ -345,7 +325,6 @@ class TestAIAnalyzer:
         - エラー結果が正しく作成されるか
         - 必須フィールドが含まれるか
         """
-        analyzer = AIAnalyzer()
         result = analyzer._create_error_result("Test error")
 
         assert result['action'] == 'HOLD'
@@ -354,10 +333,7 @@ class TestAIAnalyzer:
         assert 'timestamp' in result
         assert 'symbol' in result
 
-    @patch('google.generativeai.configure')
-    @patch('google.generativeai.GenerativeModel')
-    @patch('src.ai_analysis.ai_analyzer.psycopg2.connect')
-    def test_save_to_database(self, mock_connect, mock_model, mock_configure, mock_env_full):
+    def test_save_to_database(self, fake_db, analyzer):
         """
         データベース保存テスト
 
@@ -365,14 +341,6 @@ class TestAIAnalyzer:
         - DB保存が正常に実行されるか
         - 正しいデータが保存されるか
         """
-        # DBモックの設定
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
-
-        analyzer = AIAnalyzer()
-
         ai_result = {
             'action': 'BUY',
             'confidence': 75,
@@ -385,21 +353,8 @@ class TestAIAnalyzer:
         result = analyzer._save_to_database(ai_result, market_data)
 
         assert result is True
-        mock_cursor.execute.assert_called_once()
-        mock_conn.commit.assert_called_once()
-
-
-# テストの実行統計情報（参考）
-def test_suite_info():
-    """
-    テストスイート情報
-
-    このテストモジュールは以下をカバーします:
-    - GeminiClient: 9ケース
-    - AIAnalyzer: 3ケース
-    合計: 12ケース
-    """
-    pass
+        assert len(fake_db.executed) == 1
+        assert fake_db.commits == 1
 
 
 if __name__ == "__main__":
@@ -20,6 +20,9 @@ TickDataLoaderクラスの機能をテストするユニットテストモジュ
 個別実行:
     pytest tests/test_tick_loader.py -v
 
+並列実行:
+    pytest tests/test_tick_loader.py -n auto
+
 カバレッジ付き:
     pytest tests/test_tick_loader.py --cov=src.data_processing.tick_loader -v
 
@@ -32,91 +35,17 @@ TickDataLoaderクラスの機能をテストするユニットテストモジュ
 
 import pytest
 import os
-import zipfile
-import csv
 import tempfile
 from datetime import datetime
 from src.data_processing.tick_loader import TickDataLoader
 
 
 class TestTickDataLoader:
-    """TickDataLoaderクラスのテストケース"""
-
-    @pytest.fixture
-    def sample_tick_data(self):
-        """
-        テスト用のサンプルティックデータを生成（実際のMT5フォーマット）
-
-        Returns:
-            list: サンプルティックデータのリスト（TSV形式）
-        """
-        return [
-            {
-                '<DATE>': '2024.09.01',
-                '<TIME>': '00:00:00.000',
-                '<BID>': '145.123',
-                '<ASK>': '145.125',
-                '<LAST>': '',
-                '<VOLUME>': '100'
-            },
-            {
-                '<DATE>': '2024.09.01',
-                '<TIME>': '00:00:01.000',
-                '<BID>': '145.124',
-                '<ASK>': '145.126',
-                '<LAST>': '',
-                '<VOLUME>': '150'
-            },
-            {
-                '<DATE>': '2024.09.01',
-                '<TIME>': '00:00:02.000',
-                '<BID>': '145.125',
-                '<ASK>': '145.127',
-                '<LAST>': '',
-                '<VOLUME>': '200'
-            }
-        ]
-
-    @pytest.fixture
-    def temp_zip_file(self, sample_tick_data, tmp_path):
-        """
-        テスト用の一時zipファイルを作成
-
-        Args:
-            sample_tick_data: サンプルデータ
-            tmp_path: pytestが提供する一時ディレクトリ
-
-        Returns:
-            tuple: (zipファイルパス, データディレクトリ)
-        """
-        # 一時ディレクトリ構造を作成
-        data_dir = tmp_path / "data" / "tick_data"
-        symbol_dir = data_dir / "USDJPY"
-        symbol_dir.mkdir(parents=True)
-
-        # CSVファイル名とzipファイル名
-        csv_filename = "ticks_USDJPY-oj5k_2024-09.csv"
-        zip_filename = "ticks_USDJPY-oj5k_2024-09.zip"
-        zip_path = symbol_dir / zip_filename
-
-        # 一時CSVファイルを作成してzipに圧縮
-        csv_path = symbol_dir / csv_filename
-
-        # CSVファイルを作成（TSV形式、タブ区切り）
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['<DATE>', '<TIME>', '<BID>', '<ASK>', '<LAST>', '<VOLUME>']
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(sample_tick_data)
-
-        # zipファイルを作成
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            zipf.write(csv_path, csv_filename)
-
-        # CSVファイルを削除（zipのみ残す）
-        csv_path.unlink()
+    """
+    TickDataLoaderクラスのテストケース
 
-        return str(zip_path), str(data_dir)
+    sample_tick_data, temp_zip_file, loaded_ticks は tests/conftest.py で定義
+    """
 
     def test_loader_initialization(self):
         """
@@ -181,19 +110,17 @@ class TestTickDataLoader:
         with pytest.raises(FileNotFoundError):
             loader.load_from_zip("USDJPY", 2024, 1)
 
-    def test_validate_data_success(self, temp_zip_file):
+    def test_validate_data_success(self, loaded_ticks):
         """
         データバリデーション成功のテスト
 
         【確認内容】
         - 正常なデータが検証を通過するか
         """
-        zip_path, data_dir = temp_zip_file
-        loader = TickDataLoader(data_dir=data_dir)
-        tick_data = loader.load_from_zip("USDJPY", 2024, 9)
+        loader = TickDataLoader()
 
         # バリデーション実行
-        is_valid = loader.validate_data(tick_data)
+        is_valid = loader.validate_data(loaded_ticks)
         assert is_valid is True, "正常なデータがバリデーションを通過しませんでした"
 
     def test_validate_data_empty(self):
@@ -228,7 +155,7 @@ class TestTickDataLoader:
         is_valid = loader.validate_data(invalid_data)
         assert is_valid is False, "無効な価格がバリデーションを通過してしまいました"
 
-    def test_timestamp_parsing(self, temp_zip_file):
+    def test_timestamp_parsing(self, loaded_ticks):
         """
         タイムスタンプのパーステスト
 
@@ -236,12 +163,8 @@ class TestTickDataLoader:
         - タイムスタンプが正しくdatetimeに変換されるか
         - タイムゾーン情報が正しく処理されるか
         """
-        zip_path, data_dir = temp_zip_file
-        loader = TickDataLoader(data_dir=data_dir)
-        tick_data = loader.load_from_zip("USDJPY", 2024, 9)
-
         # 最初のデータのタイムスタンプを確認
-        first_timestamp = tick_data[0]['timestamp']
+        first_timestamp = loaded_ticks[0]['timestamp']
 
         assert first_timestamp.year == 2024
         assert first_timestamp.month == 9
@@ -250,51 +173,30 @@ class TestTickDataLoader:
         assert first_timestamp.minute == 0
         assert first_timestamp.second == 0
 
-    def test_data_order(self, temp_zip_file):
+    def test_data_order(self, loaded_ticks):
         """
         データの順序性テスト
 
         【確認内容】
         - データが時系列順に読み込まれるか
         """
-        zip_path, data_dir = temp_zip_file
-        loader = TickDataLoader(data_dir=data_dir)
-        tick_data = loader.load_from_zip("USDJPY", 2024, 9)
-
         # タイムスタンプの昇順を確認
-        for i in range(len(tick_data) - 1):
-            assert tick_data[i]['timestamp'] <= tick_data[i + 1]['timestamp'], \
+        for i in range(len(loaded_ticks) - 1):
+            assert loaded_ticks[i]['timestamp'] <= loaded_ticks[i + 1]['timestamp'], \
                 "データが時系列順になっていません"
 
-    def test_bid_ask_relationship(self, temp_zip_file):
+    def test_bid_ask_relationship(self, loaded_ticks):
         """
         Bid/Askの関係性テスト
 
         【確認内容】
         - Bid <= Ask の関係が保たれているか（通常はBid < Ask）
         """
-        zip_path, data_dir = temp_zip_file
-        loader = TickDataLoader(data_dir=data_dir)
-        tick_data = loader.load_from_zip("USDJPY", 2024, 9)
-
-        for tick in tick_data:
+        for tick in loaded_ticks:
             assert tick['bid'] <= tick['ask'], \
                 f"Bid ({tick['bid']}) が Ask ({tick['ask']}) より大きくなっています"
 
 
-# テストの実行統計情報（参考）
-def test_suite_info():
-    """
-    テストスイート情報
-
-    このテストモジュールは以下をカバーします:
-    - 正常系テスト: 4ケース
-    - 異常系テスト: 3ケース
-    - データ検証テスト: 3ケース
-    """
-    pass
-
-
 if __name__ == "__main__":
     """
     直接実行時のテストランナー